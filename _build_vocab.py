@@ -2,11 +2,16 @@
 Run this script to generate oxford_vocabulary.js
 Usage: python _build_vocab.py
 """
-import csv, json, os
+import csv, os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'words'))
+from audio_store import audio_field
+from manifest_store import load_manifest_map
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CSV_PATH = os.path.join(SCRIPT_DIR, 'words', 'oxford_5000_merged_total_translated.csv')
 MANIFEST_PATH = os.path.join(SCRIPT_DIR, 'words', 'tts_delivery', 'words_manifest.json')
+MANIFEST_STREAM_PATH = os.path.join(SCRIPT_DIR, 'words', 'tts_delivery', 'words_manifest.jsonl')
 OUTPUT_PATH = os.path.join(SCRIPT_DIR, 'oxford_vocabulary.js')
 
 SKIP_TERMS = {
@@ -21,10 +26,8 @@ with open(CSV_PATH, 'r', encoding='utf-8') as f:
         csv_data[term] = {'cefr': row['cefr'].strip(), 'translation': row['translation'].strip()}
 
 manifest_map = {}
-if os.path.exists(MANIFEST_PATH):
-    with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
-        for e in json.load(f):
-            manifest_map[e['word']] = e['filename']
+if os.path.exists(MANIFEST_STREAM_PATH) or os.path.exists(MANIFEST_PATH):
+    manifest_map = load_manifest_map(MANIFEST_STREAM_PATH, MANIFEST_PATH)
 
 levels = ['A1', 'A2', 'B1', 'B2', 'C1']
 vocab = {l: [] for l in levels}
@@ -36,7 +39,7 @@ for term, info in csv_data.items():
     entry = {'word': term, 'meaning': translation}
     audio = manifest_map.get(term)
     if audio:
-        entry['audio'] = audio
+        entry['audio'] = audio_field(audio, must_exist=False)
     vocab[cefr].append(entry)
 
 total = sum(len(v) for v in vocab.values())
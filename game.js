@@ -61,6 +61,7 @@ class WordGame {
         this.buildWordbookSelector();
         this.buildLevelSelector();
         this.updatePoolCount();
+        this.warmWordAudio();
     }
 
     buildWordbookSelector() {
@@ -119,6 +120,7 @@ class WordGame {
         this.buildWordbookSelector();
         this.buildLevelSelector();
         this.updatePoolCount();
+        this.warmWordAudio();
 
         const book = this.vocabManager.getActiveBook();
         this.showToast(`${book.emoji} ${book.name} (${this.vocabManager.getActiveWordCount()}词)`);
@@ -177,11 +179,17 @@ class WordGame {
         this.vocabManager.setActiveLevels(currentLevels);
         localStorage.setItem('wordGameActiveLevels', JSON.stringify(currentLevels));
         this.updatePoolCount();
+        this.warmWordAudio();
 
         const activeNames = currentLevels.join('+');
         this.showToast(`词池: ${activeNames} (${this.vocabManager.getActiveWordCount()}词)`);
     }
 
+    // 预加载当前词书等级的音频精灵（如已生成 wordbooks/audio_sprites.js）
+    warmWordAudio() {
+        this.audioPlayer.loadSprites(this.vocabManager.activeBookId, this.vocabManager.activeLevels);
+    }
+
     updatePoolCount() {
         if (this.poolCountDisplay) {
             this.poolCountDisplay.textContent = this.vocabManager.getActiveWordCount();
@@ -13,14 +13,111 @@ const CEFR_INFO = {
     C1: { name: '高级', emoji: '⚡', color: '#e74c3c', desc: '高级词汇' }
 };
 
+// 已解码的音频精灵最多保留的总时长（秒）。解码后为 float32 PCM，
+// 48 kHz 下每秒约 192 KB，300 秒约 58 MB
+const MAX_DECODED_SPRITE_SECONDS = 300;
+
 // 音频播放器 - 使用预生成的 WAV 文件
 class AudioPlayer {
-    constructor(audioBasePath) {
+    constructor(audioBasePath, spriteBasePath) {
         this.basePath = audioBasePath || 'words/tts_delivery/audio/';
+        this.spriteBasePath = spriteBasePath || 'words/tts_delivery/sprites/';
         this.currentAudio = null;
+        this.currentSource = null;
         this.enabled = true;
         this.audioCache = {};
         this.volume = 1.0; // Default volume
+
+        // 词书音频精灵（见 words/audio_sprites.py）：音频文件名 -> { src, start, duration }
+        this.spriteClips = {};
+        this.spriteBuffers = {};    // src -> AudioBuffer（加载中为 Promise，失败为 null），按最近使用排序
+        this.audioContext = null;
+        this.gainNode = null;
+    }
+
+    _getContext() {
+        if (!this.audioContext) {
+            this.audioContext = new (window.AudioContext || window.webkitAudioContext)();
+            this.gainNode = this.audioContext.createGain();
+            this.gainNode.gain.value = this.volume;
+            this.gainNode.connect(this.audioContext.destination);
+        }
+        return this.audioContext;
+    }
+
+    // 登记当前词书等级的音频精灵；分段在第一次从中播放时才下载解码，
+    // 不再属于当前词书/等级的已解码缓冲区在这里释放
+    loadSprites(bookId, levels) {
+        const clips = {};
+        const active = new Set();
+        if (typeof AUDIO_SPRITES !== 'undefined' && AUDIO_SPRITES[bookId] &&
+            (window.AudioContext || window.webkitAudioContext)) {
+            (levels || Object.keys(AUDIO_SPRITES[bookId])).forEach(level => {
+                (AUDIO_SPRITES[bookId][level] || []).forEach(sprite => {
+                    active.add(sprite.src);
+                    Object.entries(sprite.clips).forEach(([file, [start, duration]]) => {
+                        clips[file] = { src: sprite.src, start, duration };
+                    });
+                });
+            });
+        }
+        this.spriteClips = clips;
+        Object.keys(this.spriteBuffers).forEach(src => {
+            if (!active.has(src)) delete this.spriteBuffers[src];
+        });
+    }
+
+    // 下载并解码一个精灵分段；失败的分段记为 null，之后逐词播放
+    _decodeSprite(src) {
+        const ctx = this._getContext();
+        const pending = fetch(this.spriteBasePath + src)
+            .then(res => res.arrayBuffer())
+            .then(data => new Promise((resolve, reject) => ctx.decodeAudioData(data, resolve, reject)))
+            .then(buffer => {
+                if (this.spriteBuffers[src] !== pending) return;  // 加载期间已切换词书
+                this.spriteBuffers[src] = buffer;
+                this._trimSpriteBuffers(src);
+            })
+            .catch(() => {
+                console.warn('音频精灵加载失败:', src);
+                if (this.spriteBuffers[src] === pending) this.spriteBuffers[src] = null;
+            });
+        this.spriteBuffers[src] = pending;
+    }
+
+    // 已解码总时长超过 MAX_DECODED_SPRITE_SECONDS 时，释放最久未用的分段
+    _trimSpriteBuffers(keep) {
+        const decoded = Object.keys(this.spriteBuffers)
+            .filter(src => this.spriteBuffers[src] instanceof AudioBuffer);
+        let total = decoded.reduce((sum, src) => sum + this.spriteBuffers[src].duration, 0);
+        for (const src of decoded) {
+            if (total <= MAX_DECODED_SPRITE_SECONDS) break;
+            if (src === keep) continue;
+            total -= this.spriteBuffers[src].duration;
+            delete this.spriteBuffers[src];
+        }
+    }
+
+    // 从已解码的精灵中播放；分段未就绪时开始加载并返回 false（本次逐词播放）
+    _playFromSprite(filename) {
+        const clip = this.spriteClips[filename];
+        if (!clip) return false;
+        const buffer = this.spriteBuffers[clip.src];
+        if (buffer === undefined) this._decodeSprite(clip.src);
+        if (!(buffer instanceof AudioBuffer)) return false;
+
+        // 重新插入，使对象键顺序即最近使用顺序
+        delete this.spriteBuffers[clip.src];
+        this.spriteBuffers[clip.src] = buffer;
+
+        const ctx = this._getContext();
+        if (ctx.state === 'suspended') ctx.resume();
+        const source = ctx.createBufferSource();
+        source.buffer = buffer;
+        source.connect(this.gainNode);
+        source.start(0, clip.start, clip.duration);
+        this.currentSource = source;
+        return true;
     }
 
     setVolume(val) {
@@ -28,6 +125,9 @@ class AudioPlayer {
         if (this.currentAudio) {
             this.currentAudio.volume = this.volume;
         }
+        if (this.gainNode) {
+            this.gainNode.gain.value = this.volume;
+        }
     }
 
     // 播放单词发音
@@ -37,6 +137,8 @@ class AudioPlayer {
         // 停止当前正在播放的
         this.stop();
 
+        if (this._playFromSprite(filename)) return;
+
         const path = this.basePath + filename;
 
         // 尝试从缓存获取
@@ -54,9 +156,9 @@ class AudioPlayer {
         this.audioCache[path] = audio;
         this.currentAudio = audio;
         audio.play().catch(() => {
-            // 如果WAV播放失败，回退到浏览器TTS
-            console.warn('WAV播放失败，使用浏览器TTS:', filename);
-            this.fallbackTTS(filename.replace('.wav', ''));
+            // 如果音频播放失败，回退到浏览器TTS
+            console.warn('音频播放失败，使用浏览器TTS:', filename);
+            this.fallbackTTS(filename.replace(/\.(wav|mp3|ogg|m4a)$/, ''));
         });
     }
 
@@ -73,6 +175,10 @@ class AudioPlayer {
     }
 
     stop() {
+        if (this.currentSource) {
+            try { this.currentSource.stop(); } catch (e) { }
+            this.currentSource = null;
+        }
         if (this.currentAudio) {
             this.currentAudio.pause();
             this.currentAudio.currentTime = 0;
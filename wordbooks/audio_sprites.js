@@ -0,0 +1,3 @@
+// 词书音频精灵索引 (自动生成: python words/audio_sprites.py)
+// { bookId: { levelId: [ { src, clips: { audioFile: [start, duration] } }, ... ] } }
+const AUDIO_SPRITES = {};
@@ -0,0 +1,257 @@
+"""
+Bulk PCM analysis of the word audio library.
+
+fix_audio_filenames.py / fix_audio_step2.py only look at names; this module
+looks at the samples. Every WAV is memory-mapped and its data chunk exposed
+as a NumPy int16 view of the mapping (no read/copy of the file), then one
+pass computes per file:
+    duration, RMS, peak, leading/trailing silence, silence ratio,
+    voiced duration, clipped samples, header problems (truncated data, bad chunks)
+
+The result is a columnar report (one row per file) written as CSV, or as
+Parquet when the path ends in .parquet and pyarrow is installed, so broken
+assets can be found by sorting:
+
+    python words/audio_analysis.py                            # tts_delivery/audio_report.csv
+    python words/audio_analysis.py --sort voiced_ms --top 20  # shortest speech first
+    python words/audio_analysis.py --output report.parquet --workers 4
+
+Library use:
+    with MappedWav(path) as wav:
+        wav.samples            # np.ndarray view into the mmap (frames x channels for stereo)
+    row = analyze_file(path)   # dict of the report columns
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tts_batch import FRAME_MS, SILENCE_DBFS
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
+REPORT_FILE = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_report.csv')
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+FULL_SCALE = 32768.0
+
+COLUMNS = [
+    'file', 'ok', 'error', 'sample_rate', 'channels', 'bits', 'duration_ms',
+    'rms_dbfs', 'peak_dbfs', 'lead_silence_ms', 'trail_silence_ms',
+    'silence_ratio', 'voiced_ms', 'clipped_samples', 'truncated', 'file_bytes',
+]
+
+
+class WavFormatError(Exception):
+    """Raised when a file is not a parsable PCM WAV."""
+
+
+def parse_header(buf):
+    """Walk the RIFF chunks of buf -> (fmt dict, data offset, data bytes, truncated)."""
+    if len(buf) < 12 or buf[0:4] != b'RIFF' or buf[8:12] != b'WAVE':
+        raise WavFormatError('not a RIFF/WAVE file')
+    fmt = None
+    pos = 12
+    end = len(buf)
+    while pos + 8 <= end:
+        chunk_id = bytes(buf[pos:pos + 4])
+        (size,) = struct.unpack_from('<I', buf, pos + 4)
+        body = pos + 8
+        if chunk_id == b'fmt ':
+            if size < 16:
+                raise WavFormatError('fmt chunk too short')
+            tag, channels, rate, _, block_align, bits = struct.unpack_from('<HHIIHH', buf, body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and size >= 40:
+                (tag,) = struct.unpack_from('<H', buf, body + 24)
+            fmt = {'format': tag, 'channels': channels, 'sample_rate': rate,
+                   'block_align': block_align, 'bits': bits}
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise WavFormatError('data chunk before fmt chunk')
+            available = end - body
+            # Streaming writers leave 0 / 0xFFFFFFFF as the size; treat as "to end of file"
+            if size in (0, 0xFFFFFFFF):
+                size = available
+            truncated = size > available
+            data_bytes = min(size, available)
+            return fmt, body, data_bytes - data_bytes % max(1, fmt['block_align']), truncated
+        pos = body + size + (size & 1)
+    raise WavFormatError('no data chunk' if fmt else 'no fmt chunk')
+
+
+class MappedWav:
+    """A WAV file mapped read-only, with its samples exposed as a NumPy view (no copy)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = None
+        self.samples = None
+        try:
+            size = os.fstat(self.file.fileno()).st_size
+            if size == 0:
+                raise WavFormatError('empty file')
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.fmt, offset, data_bytes, self.truncated = parse_header(self.map)
+            if self.fmt['format'] != WAVE_FORMAT_PCM or self.fmt['bits'] != 16:
+                raise WavFormatError(f"unsupported encoding (format {self.fmt['format']}, {self.fmt['bits']}-bit)")
+            view = np.frombuffer(self.map, dtype='<i2', count=data_bytes // 2, offset=offset)
+            channels = self.fmt['channels']
+            self.samples = view if channels == 1 else view.reshape(-1, channels)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def sample_rate(self):
+        return self.fmt['sample_rate']
+
+    def close(self):
+        self.samples = None
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                # A caller still holds a view of the samples; the mapping is
+                # released when the last view is garbage-collected
+                pass
+            self.map = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def to_dbfs(amplitude):
+    return round(20 * np.log10(amplitude / FULL_SCALE), 2) if amplitude > 0 else None
+
+
+def analyze_samples(samples, sample_rate, threshold_dbfs=SILENCE_DBFS):
+    """Report columns computed from an int16 sample array (mono, or frames x channels)."""
+    mono = samples if samples.ndim == 1 else samples[:, 0]
+    n = len(mono)
+    row = {'duration_ms': round(1000 * n / sample_rate, 1) if sample_rate else 0}
+    if n == 0:
+        row.update(rms_dbfs=None, peak_dbfs=None, lead_silence_ms=0, trail_silence_ms=0,
+                   silence_ratio=1.0, voiced_ms=0, clipped_samples=0)
+        return row
+
+    peak = max(int(samples.max()), -int(samples.min()))
+    sq = np.square(mono, dtype=np.float64)
+    frame_len = max(1, sample_rate * FRAME_MS // 1000)
+    n_frames = n // frame_len
+    frame_energy = sq[:n_frames * frame_len].reshape(n_frames, frame_len).mean(axis=1)
+    if n % frame_len:
+        frame_energy = np.append(frame_energy, sq[n_frames * frame_len:].mean())
+    threshold = (FULL_SCALE * 10 ** (threshold_dbfs / 20)) ** 2
+    voiced = np.flatnonzero(frame_energy > threshold)
+    frames = len(frame_energy)
+
+    row.update(
+        rms_dbfs=to_dbfs(float(np.sqrt(sq.mean()))),
+        peak_dbfs=to_dbfs(peak),
+        lead_silence_ms=int(voiced[0] * FRAME_MS) if len(voiced) else row['duration_ms'],
+        trail_silence_ms=int((frames - voiced[-1] - 1) * FRAME_MS) if len(voiced) else row['duration_ms'],
+        silence_ratio=round(1 - len(voiced) / frames, 4),
+        voiced_ms=len(voiced) * FRAME_MS,
+        clipped_samples=int(np.count_nonzero((samples >= 32767) | (samples <= -32768))),
+    )
+    return row
+
+
+def analyze_file(path):
+    """One report row for path; unreadable files get ok=False and an error message."""
+    row = dict.fromkeys(COLUMNS)
+    row.update(file=os.path.basename(path), ok=False, error='', file_bytes=os.path.getsize(path))
+    try:
+        with MappedWav(path) as wav:
+            row.update(sample_rate=wav.sample_rate, channels=wav.fmt['channels'],
+                       bits=wav.fmt['bits'], truncated=wav.truncated)
+            row.update(analyze_samples(wav.samples, wav.sample_rate))
+        row['ok'] = not row['truncated']
+        if row['truncated']:
+            row['error'] = 'data chunk extends past end of file'
+    except (WavFormatError, struct.error, ValueError, OSError) as e:
+        row['error'] = str(e)
+    return row
+
+
+def _analyze_chunk(paths):
+    return [analyze_file(p) for p in paths]
+
+
+def analyze_dir(audio_dir=AUDIO_DIR, workers=None):
+    """Analyze every .wav in audio_dir -> list of row dicts (sorted by filename)."""
+    paths = [os.path.join(audio_dir, n) for n in sorted(os.listdir(audio_dir)) if n.endswith('.wav')]
+    if workers == 1 or len(paths) < 64:
+        return _analyze_chunk(paths)
+    workers = workers or os.cpu_count() or 1
+    size = max(16, len(paths) // (4 * workers))
+    chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_analyze_chunk, chunks):
+            rows.extend(part)
+    return rows
+
+
+def write_report(rows, path):
+    """Write rows as CSV, or Parquet for *.parquet (needs pyarrow); returns the DataFrame."""
+    import pandas as pd
+
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze the PCM content of every word WAV')
+    parser.add_argument('--input', default=AUDIO_DIR, help='Audio directory (default: tts_delivery/audio)')
+    parser.add_argument('--output', default=REPORT_FILE, help='Report path, .csv or .parquet (default: tts_delivery/audio_report.csv)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--sort', default='voiced_ms', help='Column to sort the printed summary by (default: voiced_ms)')
+    parser.add_argument('--desc', action='store_true', help='Sort descending')
+    parser.add_argument('--top', type=int, default=10, help='Rows to print (default: 10)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input):
+        print(f"Error: {args.input} not found.")
+        sys.exit(1)
+    if args.sort not in COLUMNS:
+        print(f"Error: unknown column '{args.sort}' (choose from {', '.join(COLUMNS)})")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    rows = analyze_dir(args.input, args.workers)
+    elapsed = time.perf_counter() - start
+    try:
+        df = write_report(rows, args.output)
+    except ImportError as e:
+        print(f"Error: {e} (install pyarrow for Parquet, or use a .csv path)")
+        sys.exit(1)
+
+    total_mb = df['file_bytes'].sum() / 2**20
+    print(f"Analyzed {len(df)} files ({total_mb:.0f} MB) in {elapsed:.2f}s -> {args.output}")
+    print(f"Unreadable/truncated: {int((~df['ok']).sum())}")
+    print(f"No voiced audio:      {int((df['voiced_ms'] == 0).sum())}")
+    print(f"Clipped files:        {int((df['clipped_samples'] > 0).sum())}")
+    print(f"\nTop {args.top} by {args.sort}{' (desc)' if args.desc else ''}:")
+    view = df.sort_values(args.sort, ascending=not args.desc, na_position='first').head(args.top)
+    print(view[['file', 'ok', 'duration_ms', 'voiced_ms', 'rms_dbfs', 'peak_dbfs',
+                'lead_silence_ms', 'trail_silence_ms', 'clipped_samples', 'error']].to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
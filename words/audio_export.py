@@ -0,0 +1,273 @@
+"""
+Export the word audio library to a compressed codec.
+
+Each WAV in tts_delivery/audio is 40-90 KB of uncompressed PCM. This stage
+encodes every file with ffmpeg (in parallel) next to the WAV, e.g.
+tts_delivery/audio/apple.mp3, so the game's AudioPlayer basePath does not
+change. It reads the trimmed/normalized clips from audio_postprocess.py when
+tts_delivery/audio_processed exists.
+
+It also writes tts_delivery/audio_map.json ({"apple.wav": "apple.mp3", ...}).
+The wordbook generators read it via exported_audio_name(), so regenerated
+wordbooks point each entry's `audio` field at the compressed file. Delete the
+map to go back to WAV.
+
+tts_delivery/audio_export_cache.json records the source size + mtime and
+the codec settings each output was encoded from, so a rerun only encodes
+changed sources, and changing --codec or --bitrate re-encodes everything.
+
+Codecs (--codec):
+    mp3   libmp3lame VBR, plays everywhere (default)
+    opus  Ogg Opus, smallest; Android WebView / Chrome / Firefox / Safari 17+
+    aac   AAC in .m4a
+
+Usage:
+    python words/audio_export.py                     # mp3, all cores
+    python words/audio_export.py --codec opus --bitrate 24k
+    python words/audio_export.py --report-only       # size/decode report for an existing export
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+from tts_cache import atomic_write
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
+PROCESSED_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_processed')
+AUDIO_MAP = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_map.json')
+EXPORT_CACHE = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_export_cache.json')
+
+# codec -> (extension, ffmpeg encoder args, default bitrate or None for VBR quality)
+CODECS = {
+    'mp3': ('.mp3', ['-c:a', 'libmp3lame', '-q:a', '7'], None),
+    'opus': ('.ogg', ['-c:a', 'libopus', '-application', 'voip'], '24k'),
+    'aac': ('.m4a', ['-c:a', 'aac', '-movflags', '+faststart'], '48k'),
+}
+DEFAULT_CODEC = 'mp3'
+DECODE_SAMPLE = 100
+CACHE_FLUSH_EVERY = 500
+
+_audio_map = None
+
+
+def load_audio_map(path=AUDIO_MAP):
+    """Return {wav filename: exported filename}, or {} if no export has been made."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)['files']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def exported_audio_name(filename, path=AUDIO_MAP):
+    """Name to write into a wordbook `audio` field for filename (the WAV name if not exported)."""
+    global _audio_map
+    if _audio_map is None:
+        _audio_map = load_audio_map(path)
+    return _audio_map.get(filename, filename)
+
+
+def find_ffmpeg():
+    exe = shutil.which('ffmpeg')
+    if not exe:
+        raise RuntimeError("ffmpeg not found on PATH (needed to encode/decode compressed audio)")
+    return exe
+
+
+def encode_file(ffmpeg, src, dst, codec, bitrate=None):
+    """Encode one WAV with ffmpeg; writes to a temp name and renames, like atomic_write."""
+    ext, args, default_bitrate = CODECS[codec]
+    bitrate = bitrate or default_bitrate
+    tmp = f"{dst}.tmp{ext}"
+    cmd = [ffmpeg, '-nostdin', '-loglevel', 'error', '-y', '-i', src, '-ac', '1', *args]
+    if bitrate:
+        cmd += ['-b:a', bitrate]
+    try:
+        subprocess.run(cmd + [tmp], capture_output=True, check=True)
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def encode_settings(codec, bitrate=None):
+    """Everything that determines an encoded file besides its source; part of each cache stamp."""
+    ext, args, default_bitrate = CODECS[codec]
+    return [codec, ext, args, bitrate or default_bitrate]
+
+
+def export_stamp(src, settings):
+    st = os.stat(src)
+    return [st.st_size, st.st_mtime_ns, settings]
+
+
+def load_export_cache(path=EXPORT_CACHE):
+    """Return {exported file path: stamp of the source and settings it was encoded from}."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def export_library(source_dir, output_dir=AUDIO_DIR, codec=DEFAULT_CODEC, bitrate=None, workers=None, force=False,
+                   cache_path=EXPORT_CACHE):
+    """Encode every .wav in source_dir into output_dir; returns (mapping, encoded, skipped, failed).
+
+    A file is skipped when its output exists and was encoded from the same
+    source (size + mtime) with the same codec settings, unless force is set,
+    so changing --codec or --bitrate re-encodes the library.
+    """
+    ffmpeg = find_ffmpeg()
+    ext = CODECS[codec][0]
+    settings = encode_settings(codec, bitrate)
+    cache = {} if force else load_export_cache(cache_path)
+    mapping = {}
+    stamps = {}
+    jobs = []
+    skipped = 0
+    for name in sorted(os.listdir(source_dir)):
+        if not name.endswith('.wav'):
+            continue
+        src = os.path.join(source_dir, name)
+        out_name = name[:-len('.wav')] + ext
+        dst = os.path.abspath(os.path.join(output_dir, out_name))
+        mapping[name] = out_name
+        stamps[dst] = export_stamp(src, settings)
+        if cache.get(dst) == stamps[dst] and os.path.exists(dst):
+            skipped += 1
+            continue
+        jobs.append((name, src, dst))
+
+    failed = []
+
+    def run(job):
+        name, src, dst = job
+        try:
+            encode_file(ffmpeg, src, dst, codec, bitrate)
+            return name, dst, None
+        except subprocess.CalledProcessError as e:
+            return name, dst, e.stderr.decode('utf-8', 'replace').strip()
+
+    def save_cache():
+        # Entries of other codecs / output dirs are kept; only stale ones of this run are replaced
+        atomic_write(cache_path, json.dumps(cache, ensure_ascii=False).encode('utf-8'))
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            for done, (name, dst, error) in enumerate(pool.map(run, jobs), 1):
+                if error is not None:
+                    failed.append(name)
+                    mapping.pop(name, None)
+                    cache.pop(dst, None)
+                    print(f"  ERROR {name}: {error}")
+                    continue
+                cache[dst] = stamps[dst]
+                if done % CACHE_FLUSH_EVERY == 0:
+                    print(f"  [{done}/{len(jobs)}]")
+                    save_cache()
+    finally:
+        # Also on a crash or Ctrl-C, so finished files are not re-encoded next run
+        save_cache()
+
+    return mapping, len(jobs) - len(failed), skipped, failed
+
+
+def write_audio_map(mapping, codec, path=AUDIO_MAP):
+    data = {'codec': codec, 'files': mapping}
+    atomic_write(path, json.dumps(data, ensure_ascii=False, indent=1, sort_keys=True).encode('utf-8'))
+
+
+def decode_wav(path):
+    with wave.open(path, 'rb') as w:
+        return w.readframes(w.getnframes())
+
+
+def decode_compressed(ffmpeg, path):
+    result = subprocess.run([ffmpeg, '-nostdin', '-loglevel', 'error', '-i', path,
+                             '-f', 's16le', '-ac', '1', '-'], capture_output=True, check=True)
+    return result.stdout
+
+
+def report(mapping, wav_dir, out_dir, sample=DECODE_SAMPLE):
+    """Print before/after library size and mean per-file decode time on a random sample."""
+    pairs = [(os.path.join(wav_dir, w), os.path.join(out_dir, c)) for w, c in mapping.items()]
+    pairs = [(w, c) for w, c in pairs if os.path.exists(w) and os.path.exists(c)]
+    if not pairs:
+        print("Nothing to report.")
+        return
+    wav_bytes = sum(os.path.getsize(w) for w, _ in pairs)
+    out_bytes = sum(os.path.getsize(c) for _, c in pairs)
+    print(f"Files:     {len(pairs)}")
+    print(f"WAV:       {wav_bytes / 2**20:.1f} MB ({wav_bytes / len(pairs) / 1024:.1f} KB/file)")
+    print(f"Exported:  {out_bytes / 2**20:.1f} MB ({out_bytes / len(pairs) / 1024:.1f} KB/file), "
+          f"{100 * (1 - out_bytes / wav_bytes):.1f}% smaller")
+
+    ffmpeg = find_ffmpeg()
+    picked = random.Random(0).sample(pairs, min(sample, len(pairs)))
+    start = time.perf_counter()
+    for w, _ in picked:
+        decode_wav(w)
+    wav_ms = 1000 * (time.perf_counter() - start) / len(picked)
+    start = time.perf_counter()
+    for _, c in picked:
+        decode_compressed(ffmpeg, c)
+    out_ms = 1000 * (time.perf_counter() - start) / len(picked)
+    print(f"Decode:    WAV {wav_ms:.2f} ms/file, exported {out_ms:.2f} ms/file "
+          f"(ffmpeg, incl. process start; n={len(picked)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export word audio to a compressed codec')
+    parser.add_argument('--codec', choices=sorted(CODECS), default=DEFAULT_CODEC,
+                        help=f'Target codec (default: {DEFAULT_CODEC})')
+    parser.add_argument('--bitrate', default=None, help='Encoder bitrate, e.g. 24k (default: per codec)')
+    parser.add_argument('--source', default=None,
+                        help='WAV directory (default: tts_delivery/audio_processed if present, else tts_delivery/audio)')
+    parser.add_argument('--output', default=AUDIO_DIR, help='Output directory (default: tts_delivery/audio)')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel encoders (default: all cores)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-encode every file, ignoring the export cache')
+    parser.add_argument('--report-only', action='store_true', help='Only print the size/decode report')
+    parser.add_argument('--sample', type=int, default=DECODE_SAMPLE,
+                        help=f'Files timed for the decode report (default: {DECODE_SAMPLE})')
+    args = parser.parse_args()
+
+    source = args.source or (PROCESSED_DIR if os.path.isdir(PROCESSED_DIR) else AUDIO_DIR)
+
+    try:
+        if args.report_only:
+            report(load_audio_map(), AUDIO_DIR, args.output, args.sample)
+            return
+
+        print(f"=== Audio Export ({args.codec}) ===")
+        print(f"Source: {source}")
+        print(f"Output: {args.output}")
+        start = time.perf_counter()
+        mapping, encoded, skipped, failed = export_library(
+            source, args.output, args.codec, args.bitrate, args.workers, args.force
+        )
+        elapsed = time.perf_counter() - start
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    write_audio_map(mapping, args.codec)
+    print(f"\nEncoded: {encoded}  Up to date: {skipped}  Failed: {len(failed)}  ({elapsed:.1f}s)")
+    print(f"Mapping: {AUDIO_MAP} ({len(mapping)} files)")
+    print("Regenerate the wordbooks to point their audio fields at the exported files.\n")
+    # "Before" is the raw WAV library the game ships today
+    report(mapping, AUDIO_DIR, args.output, args.sample)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+"""
+Acoustic fingerprint index for the word audio library.
+
+fix_audio_filenames.py copies one merged clip to several words and
+fix_audio_step2.py renames by hand, so the library contains duplicate and
+mislabeled clips. This module gives every WAV a spectral hash and keeps the
+hashes in an on-disk index, so finding them is a lookup instead of listening.
+
+Fingerprint (per file):
+1. Trim to the voiced region (same -45 dBFS / 10ms frames as tts_batch.py)
+2. Short-time spectrum (20ms Hann windows, 10ms hop) summed into BANDS
+   log-spaced bands between 100 Hz and 8 kHz
+3. Band energies averaged into TIME_BINS equal time slices, so the hash does
+   not depend on padding or small tempo differences
+4. One bit per (slice, band pair): sign of the band-energy difference and
+   its change from the previous slice -> 32 x 15 = 480 bits
+
+Two clips are near-identical when the fraction of differing bits is below
+--threshold. Unrelated words differ in about half of the bits. Clips with
+fewer voiced frames than TIME_BINS (under ~1/3 s) get no fingerprint: padding
+them would give every short clip the same bits. They are left out of the
+duplicate search and listed by --implausible instead.
+
+The index (tts_delivery/cache/fingerprints.npz) is rebuilt incrementally:
+only files whose size or mtime changed are fingerprinted again.
+
+Usage:
+    python words/audio_fingerprint.py                    # update index, list duplicate groups
+    python words/audio_fingerprint.py --implausible      # also flag durations that do not fit the word
+    python words/audio_fingerprint.py --lookup "bath n.bathroom.wav"
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from audio_analysis import AUDIO_DIR, MappedWav, WavFormatError
+from tts_batch import FRAME_MS, SILENCE_DBFS
+from tts_cache import CACHE_DIR
+
+INDEX_FILE = os.path.join(CACHE_DIR, 'fingerprints.npz')
+# Bumped when fingerprints change meaning; older index files are rebuilt
+INDEX_VERSION = 2
+
+BANDS = 16
+TIME_BINS = 33
+MIN_HZ = 100.0
+MAX_HZ = 8000.0
+WINDOW_MS = 20
+HOP_MS = 10
+FINGERPRINT_BITS = (TIME_BINS - 1) * (BANDS - 1)
+DEFAULT_THRESHOLD = 0.12
+# Voiced durations of near-identical clips must be within this ratio of each other
+DURATION_TOLERANCE = 1.3
+# Voiced duration outside [low, high] x the library median for the word length is implausible
+IMPLAUSIBLE_RANGE = (0.35, 2.8)
+
+# Number of set bits for every byte value
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint16)
+
+
+def voiced_region(samples, sample_rate, threshold_dbfs=SILENCE_DBFS):
+    """(start, end) sample range from the first to the last voiced frame, or None if silent."""
+    frame_len = max(1, sample_rate * FRAME_MS // 1000)
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return None
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    energy = np.square(frames, dtype=np.float64).mean(axis=1)
+    voiced = np.flatnonzero(energy > (32768 * 10 ** (threshold_dbfs / 20)) ** 2)
+    if len(voiced) == 0:
+        return None
+    return voiced[0] * frame_len, (voiced[-1] + 1) * frame_len
+
+
+def band_energies(samples, sample_rate):
+    """(frames x BANDS) log band energies of a mono int16 signal."""
+    win = max(16, sample_rate * WINDOW_MS // 1000)
+    hop = max(1, sample_rate * HOP_MS // 1000)
+    if len(samples) < win:
+        samples = np.pad(samples, (0, win - len(samples)))
+    frames = np.lib.stride_tricks.sliding_window_view(samples, win)[::hop]
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(win).astype(np.float32), axis=1)) ** 2
+    freqs = np.fft.rfftfreq(win, 1.0 / sample_rate)
+    edges = np.geomspace(MIN_HZ, min(MAX_HZ, sample_rate / 2), BANDS + 1)
+    bins = np.clip(np.searchsorted(edges, freqs) - 1, -1, BANDS)
+    energies = np.zeros((len(frames), BANDS))
+    for band in range(BANDS):
+        mask = bins == band
+        if mask.any():
+            energies[:, band] = spectrum[:, mask].sum(axis=1)
+    return np.log(energies + 1e-9)
+
+
+def fingerprint_samples(samples, sample_rate):
+    """Packed fingerprint bytes and voiced duration (ms) of a mono int16 signal.
+
+    The fingerprint is None if the clip is silent (voiced_ms 0) or has fewer
+    voiced frames than TIME_BINS.
+    """
+    region = voiced_region(samples, sample_rate)
+    if region is None:
+        return None, 0
+    start, end = region
+    voiced_ms = round(1000 * (end - start) / sample_rate)
+    energies = band_energies(samples[start:end].astype(np.float32), sample_rate)
+    if len(energies) < TIME_BINS:
+        return None, voiced_ms
+    slices = np.array([chunk.mean(axis=0) for chunk in np.array_split(energies, TIME_BINS)])
+    band_diff = slices[:, :-1] - slices[:, 1:]
+    bits = (band_diff[1:] - band_diff[:-1]) > 0
+    return np.packbits(bits.ravel()), voiced_ms
+
+
+def fingerprint_file(path):
+    """(fingerprint bytes or None, voiced_ms, error message)."""
+    try:
+        with MappedWav(path) as wav:
+            samples = wav.samples if wav.samples.ndim == 1 else wav.samples[:, 0]
+            fp, voiced_ms = fingerprint_samples(samples, wav.sample_rate)
+        return fp, voiced_ms, ''
+    except (WavFormatError, ValueError, OSError) as e:
+        return None, 0, str(e)
+
+
+def _fingerprint_chunk(paths):
+    return [fingerprint_file(p) for p in paths]
+
+
+class FingerprintIndex:
+    """Fingerprints of every WAV in a directory, persisted as one .npz file."""
+
+    FIELDS = ('names', 'sizes', 'mtimes', 'voiced_ms', 'fingerprints', 'valid')
+
+    def __init__(self, names, sizes, mtimes, voiced_ms, fingerprints, valid):
+        self.names = list(names)
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        self.mtimes = np.asarray(mtimes, dtype=np.int64)
+        self.voiced_ms = np.asarray(voiced_ms, dtype=np.int64)
+        self.fingerprints = np.asarray(fingerprints, dtype=np.uint8).reshape(len(self.names), -1)
+        self.valid = np.asarray(valid, dtype=bool)
+        self.position = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data['version']) != INDEX_VERSION:
+                    return None
+                return cls(*(data[f] for f in cls.FIELDS))
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, path=INDEX_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp, version=INDEX_VERSION, names=np.array(self.names, dtype=str), sizes=self.sizes, mtimes=self.mtimes,
+                 voiced_ms=self.voiced_ms, fingerprints=self.fingerprints, valid=self.valid)
+        os.replace(tmp, path)
+
+    @classmethod
+    def build(cls, audio_dir=AUDIO_DIR, path=INDEX_FILE, workers=None, force=False):
+        """Load the index at path and refresh it for audio_dir; returns (index, fingerprinted count)."""
+        old = None if force else cls.load(path)
+        names, sizes, mtimes = [], [], []
+        with os.scandir(audio_dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.name.endswith('.wav') and entry.is_file():
+                    st = entry.stat()
+                    names.append(entry.name)
+                    sizes.append(st.st_size)
+                    mtimes.append(st.st_mtime_ns)
+
+        width = FINGERPRINT_BITS // 8
+        fps = np.zeros((len(names), width), dtype=np.uint8)
+        voiced = np.zeros(len(names), dtype=np.int64)
+        valid = np.zeros(len(names), dtype=bool)
+        todo = []
+        for i, name in enumerate(names):
+            j = old.position.get(name) if old is not None else None
+            if (j is not None and old.sizes[j] == sizes[i] and old.mtimes[j] == mtimes[i]
+                    and old.fingerprints.shape[1] == width):
+                fps[i], voiced[i], valid[i] = old.fingerprints[j], old.voiced_ms[j], old.valid[j]
+            else:
+                todo.append(i)
+
+        if todo:
+            paths = [os.path.join(audio_dir, names[i]) for i in todo]
+            workers = workers or os.cpu_count() or 1
+            size = max(16, len(paths) // (4 * workers))
+            chunks = [paths[k:k + size] for k in range(0, len(paths), size)]
+            results = []
+            if workers == 1 or len(chunks) == 1:
+                results = [r for chunk in chunks for r in _fingerprint_chunk(chunk)]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for part in pool.map(_fingerprint_chunk, chunks):
+                        results.extend(part)
+            for i, (fp, voiced_ms, _) in zip(todo, results):
+                voiced[i] = voiced_ms
+                if fp is not None:
+                    fps[i], valid[i] = fp, True
+
+        index = cls(names, sizes, mtimes, voiced, fps, valid)
+        index.save(path)
+        return index, len(todo)
+
+    def distances(self, i, candidates):
+        """Fraction of differing fingerprint bits between entry i and each candidate index."""
+        diff = np.bitwise_xor(self.fingerprints[candidates], self.fingerprints[i])
+        return POPCOUNT[diff].sum(axis=1) / FINGERPRINT_BITS
+
+    def _duration_window(self, order, sorted_ms, k):
+        """Candidates for the k-th entry of order: later entries with a comparable voiced duration."""
+        limit = sorted_ms[k] * DURATION_TOLERANCE + 50
+        end = np.searchsorted(sorted_ms, limit, side='right')
+        return order[k + 1:end]
+
+    def duplicate_groups(self, threshold=DEFAULT_THRESHOLD):
+        """Groups (lists of names) of near-identical clips, largest first.
+
+        Entries are sorted by voiced duration, so each clip is only compared
+        with the few clips of similar length.
+        """
+        order = np.flatnonzero(self.valid)
+        order = order[np.argsort(self.voiced_ms[order], kind='stable')]
+        sorted_ms = self.voiced_ms[order]
+        parent = {}
+
+        def find(x):
+            while parent.get(x, x) != x:
+                parent[x] = parent.get(parent[x], parent[x])
+                x = parent[x]
+            return x
+
+        for k, i in enumerate(order):
+            candidates = self._duration_window(order, sorted_ms, k)
+            if len(candidates) == 0:
+                continue
+            for j in candidates[self.distances(i, candidates) <= threshold]:
+                a, b = find(i), find(j)
+                if a != b:
+                    parent[b] = a
+
+        groups = {}
+        for x in set(parent) | set(parent.values()):
+            groups.setdefault(find(x), []).append(self.names[x])
+        return sorted((sorted(g) for g in groups.values()), key=lambda g: (-len(g), g[0]))
+
+    def lookup(self, name, threshold=DEFAULT_THRESHOLD):
+        """[(other name, distance)] of clips near-identical to name, closest first."""
+        i = self.position[name]
+        if not self.valid[i]:
+            return []
+        others = np.flatnonzero(self.valid)
+        others = others[others != i]
+        dist = self.distances(i, others)
+        hits = np.argsort(dist)
+        return [(self.names[others[h]], round(float(dist[h]), 3)) for h in hits if dist[h] <= threshold]
+
+    def implausible_durations(self, low=IMPLAUSIBLE_RANGE[0], high=IMPLAUSIBLE_RANGE[1]):
+        """[(name, voiced_ms, expected_ms)] whose voiced duration does not fit the word length.
+
+        The expectation is the library median voiced duration for words with the
+        same number of letters, so it adapts to the voice and speaking rate.
+        Every clip without a fingerprint is reported too: silent or unreadable
+        files with voiced_ms 0, clips too short to fingerprint with their
+        (short) voiced duration.
+        """
+        letters = np.array([sum(c.isalpha() for c in os.path.splitext(n)[0]) for n in self.names])
+        expected = {}
+        for n_letters in np.unique(letters):
+            ms = self.voiced_ms[(letters == n_letters) & self.valid]
+            if len(ms):
+                expected[n_letters] = float(np.median(ms))
+        flagged = []
+        for i, name in enumerate(self.names):
+            exp = expected.get(letters[i])
+            ms = int(self.voiced_ms[i])
+            if not self.valid[i] or (exp and not low * exp <= ms <= high * exp):
+                flagged.append((name, ms, round(exp or 0)))
+        return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find duplicate / mislabeled clips by acoustic fingerprint')
+    parser.add_argument('--input', default=AUDIO_DIR, help='Audio directory (default: tts_delivery/audio)')
+    parser.add_argument('--index', default=INDEX_FILE, help='Index file (default: tts_delivery/cache/fingerprints.npz)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--rebuild', action='store_true', help='Fingerprint every file again')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Max fraction of differing bits for a match (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--lookup', metavar='FILE', help='List clips near-identical to FILE')
+    parser.add_argument('--implausible', action='store_true', help='Flag voiced durations implausible for the word')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input):
+        print(f"Error: {args.input} not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index, updated = FingerprintIndex.build(args.input, args.index, args.workers, args.rebuild)
+    print(f"Index: {len(index.names)} files ({updated} fingerprinted, "
+          f"{len(index.names) - updated} reused) in {time.perf_counter() - start:.2f}s")
+
+    if args.lookup:
+        if args.lookup not in index.position:
+            print(f"Error: {args.lookup} is not in the index.")
+            sys.exit(1)
+        matches = index.lookup(args.lookup, args.threshold)
+        print(f"\nNear-identical to {args.lookup}: {len(matches)}")
+        for name, dist in matches:
+            print(f"  {dist:.3f}  {name}")
+        return
+
+    start = time.perf_counter()
+    groups = index.duplicate_groups(args.threshold)
+    print(f"\nDuplicate groups: {len(groups)} ({sum(len(g) for g in groups)} files) "
+          f"in {time.perf_counter() - start:.2f}s")
+    for group in groups:
+        print(f"  {len(group)}: " + ' | '.join(group))
+
+    if args.implausible:
+        flagged = index.implausible_durations()
+        print(f"\nImplausible durations: {len(flagged)}")
+        for name, ms, expected in flagged:
+            note = '' if index.valid[index.position[name]] else ', no fingerprint'
+            print(f"  {name}: voiced {ms} ms (typical {expected} ms{note})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Post-process the raw TTS WAVs in tts_delivery/audio.
+
+The API output is 24 kHz mono LINEAR16 with the 300ms SSML padding and
+whatever leading silence the voice adds. This stage, for every file:
+1. Trims leading/trailing silence, keeping a configurable guard (--guard-ms)
+2. Normalizes loudness to a target RMS over the voiced frames (--target-dbfs),
+   with the gain limited so the peak stays below --peak-dbfs
+3. Writes the result atomically to tts_delivery/audio_processed/{name}.wav
+
+Files are processed across all cores. A per-file cache (input size + mtime
++ processing settings) is kept next to the output, so re-runs only
+reprocess inputs that changed or were never processed.
+
+Usage:
+    python words/audio_postprocess.py                     # all cores, default settings
+    python words/audio_postprocess.py --workers 4 --guard-ms 80 --target-dbfs -18
+    python words/audio_postprocess.py --force             # ignore the cache
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tts_batch import FRAME_MS, SILENCE_DBFS
+from tts_cache import atomic_write
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
+PROCESSED_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_processed')
+CACHE_NAME = 'postprocess_cache.json'
+# Results between cache writes (a crash or Ctrl-C loses at most this many)
+CACHE_FLUSH_EVERY = 500
+
+DEFAULT_GUARD_MS = 50
+DEFAULT_TARGET_DBFS = -20.0
+DEFAULT_PEAK_DBFS = -1.0
+# Files that are (almost) all silence are copied through as is: not trimmed to
+# nothing, and not boosted to the target loudness on the RMS of a frame or two
+MIN_VOICED_MS = 30
+# Bumped when process_file() changes, so cached outputs are redone
+PROCESS_VERSION = 2
+
+
+def dbfs_to_amplitude(dbfs):
+    return 32768 * 10 ** (dbfs / 20)
+
+
+def read_pcm(path):
+    """Read a mono 16-bit WAV -> (wave params, int16 ndarray)."""
+    with wave.open(path, 'rb') as w:
+        params = w.getparams()
+        if params.sampwidth != 2 or params.nchannels != 1:
+            raise ValueError(f"expected mono 16-bit PCM, got {params.nchannels}ch/{8 * params.sampwidth}bit")
+        samples = np.frombuffer(w.readframes(params.nframes), dtype='<i2')
+    return params, samples
+
+
+def pcm_to_wav_bytes(samples, sample_rate):
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(samples.astype('<i2').tobytes())
+    return buf.getvalue()
+
+
+def frame_rms(samples, sample_rate):
+    """RMS per FRAME_MS frame (last partial frame zero-padded) and the frame length."""
+    frame_len = max(1, sample_rate * FRAME_MS // 1000)
+    n_frames = -(-len(samples) // frame_len)
+    padded = np.zeros(n_frames * frame_len, dtype=np.float64)
+    padded[:len(samples)] = samples
+    frames = padded.reshape(n_frames, frame_len)
+    return np.sqrt(np.mean(frames * frames, axis=1)), frame_len
+
+
+def has_speech(voiced):
+    """True if the voiced frame mask covers at least MIN_VOICED_MS."""
+    return int(np.count_nonzero(voiced)) * FRAME_MS >= MIN_VOICED_MS
+
+
+def trim_silence(samples, sample_rate, guard_ms=DEFAULT_GUARD_MS, threshold_dbfs=SILENCE_DBFS):
+    """Return (trimmed samples, RMS per frame, voiced mask per frame).
+
+    Keeps guard_ms of audio before the first and after the last voiced frame.
+    """
+    rms, frame_len = frame_rms(samples, sample_rate)
+    voiced = rms > dbfs_to_amplitude(threshold_dbfs)
+    if not has_speech(voiced):
+        return samples, rms, voiced
+    idx = np.flatnonzero(voiced)
+    guard = sample_rate * guard_ms // 1000
+    start = max(0, idx[0] * frame_len - guard)
+    end = min(len(samples), (idx[-1] + 1) * frame_len + guard)
+    return samples[start:end], rms, voiced
+
+
+def normalize_loudness(samples, voiced_rms, target_dbfs=DEFAULT_TARGET_DBFS, peak_dbfs=DEFAULT_PEAK_DBFS):
+    """Scale samples so voiced_rms reaches target_dbfs without the peak exceeding peak_dbfs.
+
+    Returns (int16 samples, gain_db).
+    """
+    if voiced_rms <= 0 or len(samples) == 0:
+        return samples, 0.0
+    peak = float(np.max(np.abs(samples.astype(np.int32))))
+    gain = dbfs_to_amplitude(target_dbfs) / voiced_rms
+    if peak > 0:
+        gain = min(gain, dbfs_to_amplitude(peak_dbfs) / peak)
+    scaled = np.clip(np.rint(samples * gain), -32768, 32767).astype(np.int16)
+    return scaled, 20 * np.log10(gain)
+
+
+def settings_key(guard_ms, target_dbfs, peak_dbfs):
+    """Hash of the processing settings; changing any of them invalidates the cache."""
+    raw = json.dumps([guard_ms, target_dbfs, peak_dbfs, SILENCE_DBFS, FRAME_MS, MIN_VOICED_MS,
+                      PROCESS_VERSION])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def process_file(src, dst, guard_ms=DEFAULT_GUARD_MS, target_dbfs=DEFAULT_TARGET_DBFS,
+                 peak_dbfs=DEFAULT_PEAK_DBFS):
+    """Trim + normalize one WAV; returns a stats dict (runs in a worker process)."""
+    params, samples = read_pcm(src)
+    rate = params.framerate
+    trimmed, rms, voiced = trim_silence(samples, rate, guard_ms)
+    silent = not has_speech(voiced)
+    if silent:
+        # Same condition that skipped the trim: no gain, it would mostly boost noise
+        out, gain_db = trimmed, 0.0
+    else:
+        voiced_rms = float(np.sqrt(np.mean(rms[voiced] ** 2)))
+        out, gain_db = normalize_loudness(trimmed, voiced_rms, target_dbfs, peak_dbfs)
+    atomic_write(dst, pcm_to_wav_bytes(out, rate))
+    return {
+        'in_ms': round(1000 * len(samples) / rate),
+        'out_ms': round(1000 * len(out) / rate),
+        'gain_db': round(float(gain_db), 2),
+        'silent': silent,
+    }
+
+
+def _worker(job):
+    name, src, dst, options = job
+    try:
+        return name, process_file(src, dst, **options), None
+    except Exception as e:
+        return name, None, f"{type(e).__name__}: {e}"
+
+
+def load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def input_stamp(path, settings):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns, settings]
+
+
+def postprocess_dir(audio_dir=AUDIO_DIR, output_dir=PROCESSED_DIR, workers=None, force=False,
+                    guard_ms=DEFAULT_GUARD_MS, target_dbfs=DEFAULT_TARGET_DBFS, peak_dbfs=DEFAULT_PEAK_DBFS):
+    """Process every .wav in audio_dir that changed since the last run.
+
+    Returns (processed, cached, failed, stats) where stats maps filename -> stats dict.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_NAME)
+    cache = {} if force else load_cache(cache_path)
+    settings = settings_key(guard_ms, target_dbfs, peak_dbfs)
+    options = {'guard_ms': guard_ms, 'target_dbfs': target_dbfs, 'peak_dbfs': peak_dbfs}
+
+    jobs = []
+    cached = 0
+    stamps = {}
+    for name in sorted(os.listdir(audio_dir)):
+        if not name.endswith('.wav'):
+            continue
+        src = os.path.join(audio_dir, name)
+        dst = os.path.join(output_dir, name)
+        stamps[name] = input_stamp(src, settings)
+        entry = cache.get(name)
+        if entry and entry['stamp'] == stamps[name] and os.path.exists(dst):
+            cached += 1
+            continue
+        jobs.append((name, src, dst, options))
+
+    def save_cache():
+        # Forget inputs that no longer exist
+        kept = {name: entry for name, entry in cache.items() if name in stamps}
+        atomic_write(cache_path, json.dumps(kept, ensure_ascii=False).encode('utf-8'))
+
+    stats = {}
+    failed = []
+    try:
+        if jobs:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunk = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+                for done, (name, result, error) in enumerate(pool.map(_worker, jobs, chunksize=chunk), 1):
+                    if error:
+                        failed.append(name)
+                        print(f"  ERROR {name}: {error}")
+                        continue
+                    stats[name] = result
+                    cache[name] = {'stamp': stamps[name], **result}
+                    if done % CACHE_FLUSH_EVERY == 0:
+                        print(f"  [{done}/{len(jobs)}]")
+                        save_cache()
+    finally:
+        # Also on a crash or Ctrl-C, so finished files are not redone next run
+        save_cache()
+    return len(stats), cached, failed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trim and loudness-normalize TTS audio')
+    parser.add_argument('--input', default=AUDIO_DIR, help='Raw WAV directory (default: tts_delivery/audio)')
+    parser.add_argument('--output', default=PROCESSED_DIR, help='Output directory (default: tts_delivery/audio_processed)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--guard-ms', type=int, default=DEFAULT_GUARD_MS,
+                        help=f'Silence kept before/after the voiced region (default: {DEFAULT_GUARD_MS})')
+    parser.add_argument('--target-dbfs', type=float, default=DEFAULT_TARGET_DBFS,
+                        help=f'Target RMS loudness of voiced frames (default: {DEFAULT_TARGET_DBFS})')
+    parser.add_argument('--peak-dbfs', type=float, default=DEFAULT_PEAK_DBFS,
+                        help=f'Peak ceiling when applying gain (default: {DEFAULT_PEAK_DBFS})')
+    parser.add_argument('--force', action='store_true', help='Reprocess every file, ignoring the cache')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input):
+        print(f"Error: {args.input} not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    processed, cached, failed, stats = postprocess_dir(
+        args.input, args.output, args.workers, args.force,
+        args.guard_ms, args.target_dbfs, args.peak_dbfs,
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"\n=== Post-processing Complete ===")
+    print(f"Processed: {processed}  Cached: {cached}  Failed: {len(failed)}")
+    if stats:
+        in_ms = sum(s['in_ms'] for s in stats.values())
+        out_ms = sum(s['out_ms'] for s in stats.values())
+        silent = sum(s['silent'] for s in stats.values())
+        print(f"Duration:  {in_ms / 1000:.0f}s -> {out_ms / 1000:.0f}s ({100 * (1 - out_ms / in_ms):.1f}% trimmed)")
+        if silent:
+            print(f"Silent:    {silent} files had under {MIN_VOICED_MS} ms of voiced frames (copied as is)")
+    print(f"Elapsed:   {elapsed:.1f}s ({processed / max(elapsed, 1e-9):.0f} files/sec)")
+    print(f"Output:    {args.output}")
+
+
+if __name__ == '__main__':
+    main()
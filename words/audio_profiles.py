@@ -0,0 +1,233 @@
+"""
+Per-platform sample-rate / bit-depth profiles of the word audio library.
+
+The clips are 24 kHz mono 16-bit, more than a single spoken word needs on a
+phone speaker. This stage writes one output directory per named profile:
+
+    desktop   24000 Hz 16-bit   full quality (files are hard-linked, not re-encoded)
+    web       22050 Hz 16-bit   PWA / service-worker cache
+    android   16000 Hz  8-bit   Android build; speech keeps everything below 8 kHz,
+                                8-bit with TPDF dither (~48 dB SNR) is fine on a phone speaker
+
+    words/tts_delivery/audio_profiles/{profile}/{name}.wav
+
+Resampling is done in the frequency domain with NumPy (rfft, keep or
+zero-pad the bins below the new Nyquist with a short cosine roll-off,
+irfft), so one clip is a couple of vectorized FFTs and any rate ratio
+(24000 -> 22050) is exact. Clips start and end in silence, so the
+periodic extension of the FFT does not leak into the speech.
+
+Sources are the post-processed clips (audio_postprocess.py) when present,
+else the raw WAVs. Files run across all cores with the same per-file cache
+(input size + mtime + profile settings) as audio_postprocess.py, saved every
+CACHE_FLUSH_EVERY files.
+
+This is an offline export only: the game, sw.js and the Android build still
+load tts_delivery/audio, and nothing reads audio_profiles/ yet. Copy a
+profile directory into a build by hand.
+
+Usage:
+    python words/audio_profiles.py                       # every profile
+    python words/audio_profiles.py --profile android --bits 16
+"""
+import argparse
+import io
+import json
+import math
+import os
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from audio_postprocess import (AUDIO_DIR, CACHE_FLUSH_EVERY, PROCESSED_DIR, input_stamp,
+                               load_cache, pcm_to_wav_bytes, read_pcm)
+from tts_cache import atomic_write
+
+PROFILES_DIR = os.path.join(os.path.dirname(AUDIO_DIR), 'audio_profiles')
+CACHE_NAME = 'profile_cache.json'
+PROFILES = {
+    'desktop': {'sample_rate': 24000, 'bits': 16},
+    'web': {'sample_rate': 22050, 'bits': 16},
+    'android': {'sample_rate': 16000, 'bits': 8},
+}
+# Fraction of the kept band faded out below the new Nyquist (limits ringing)
+ROLLOFF = 0.05
+
+
+def _fft_length(length, step):
+    """Smallest multiple of step >= length whose quotient has only factors 2, 3, 5 (fast FFT sizes)."""
+    k = max(1, -(-length // step))
+    while True:
+        r = k
+        for f in (2, 3, 5):
+            while r % f == 0:
+                r //= f
+        if r == 1:
+            return k * step
+        k += 1
+
+
+def resample(samples, src_rate, dst_rate, rolloff=ROLLOFF):
+    """Band-limited resampling of a 1-D int16/float array -> float64 array at dst_rate."""
+    x = np.asarray(samples, dtype=np.float64)
+    if src_rate == dst_rate or len(x) == 0:
+        return x
+    # Pad to a fast FFT length where the output length is an exact integer
+    n = _fft_length(len(x), src_rate // math.gcd(src_rate, dst_rate))
+    m = n * dst_rate // src_rate
+    spectrum = np.fft.rfft(x, n)
+    bins = min(len(spectrum), m // 2 + 1)
+    out = np.zeros(m // 2 + 1, dtype=np.complex128)
+    out[:bins] = spectrum[:bins]
+    if dst_rate < src_rate and rolloff:
+        fade = max(1, int(bins * rolloff))
+        out[bins - fade:bins] *= 0.5 * (1 + np.cos(np.linspace(0, np.pi, fade)))
+    y = np.fft.irfft(out, m) * (m / n)
+    return y[:round(len(x) * dst_rate / src_rate)]
+
+
+def quantize(y, bits, rng=None):
+    """float samples (int16 scale) -> int16 array, or uint8 with TPDF dither for 8-bit."""
+    if bits == 16:
+        return np.clip(np.round(y), -32768, 32767).astype('<i2')
+    if bits == 8:
+        rng = rng or np.random.default_rng(0)
+        dither = rng.random(len(y)) - rng.random(len(y))
+        return np.clip(np.round(y / 256 + dither) + 128, 0, 255).astype(np.uint8)
+    raise ValueError(f"unsupported bit depth {bits} (16 or 8)")
+
+
+def wav_bytes(pcm, sample_rate):
+    """WAV file bytes for int16 (16-bit) or uint8 (8-bit) mono samples."""
+    if pcm.dtype != np.uint8:
+        return pcm_to_wav_bytes(pcm, sample_rate)
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(1)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+def convert_file(src, dst, sample_rate, bits):
+    """Write src at sample_rate/bits to dst; returns (input bytes, output bytes)."""
+    params, samples = read_pcm(src)
+    if params.framerate == sample_rate and bits == 16:
+        # Already in the target format: link instead of re-encoding
+        if os.path.lexists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            atomic_write(dst, pcm_to_wav_bytes(samples, sample_rate))
+    else:
+        pcm = quantize(resample(samples, params.framerate, sample_rate), bits)
+        atomic_write(dst, wav_bytes(pcm, sample_rate))
+    return os.path.getsize(src), os.path.getsize(dst)
+
+
+def _worker(job):
+    name, src, dst, sample_rate, bits = job
+    try:
+        return name, convert_file(src, dst, sample_rate, bits), None
+    except Exception as e:
+        return name, None, f"{type(e).__name__}: {e}"
+
+
+def build_profile(profile, source_dir, output_dir, sample_rate, bits, workers=None, force=False):
+    """Convert every .wav of source_dir that changed since the last run.
+
+    Returns (converted, cached, failed, in_bytes, out_bytes) for the converted files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_NAME)
+    cache = {} if force else load_cache(cache_path)
+    settings = f"{profile}:{sample_rate}:{bits}:{ROLLOFF}"
+
+    jobs = []
+    stamps = {}
+    cached = 0
+    for name in sorted(os.listdir(source_dir)):
+        if not name.endswith('.wav'):
+            continue
+        src = os.path.join(source_dir, name)
+        dst = os.path.join(output_dir, name)
+        stamps[name] = input_stamp(src, settings)
+        if cache.get(name) == stamps[name] and os.path.exists(dst):
+            cached += 1
+            continue
+        jobs.append((name, src, dst, sample_rate, bits))
+
+    def save_cache():
+        # Forget inputs that no longer exist
+        kept = {name: stamp for name, stamp in cache.items() if name in stamps}
+        atomic_write(cache_path, json.dumps(kept, ensure_ascii=False).encode('utf-8'))
+
+    failed = []
+    in_bytes = out_bytes = 0
+    try:
+        if jobs:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunk = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+                for done, (name, sizes, error) in enumerate(pool.map(_worker, jobs, chunksize=chunk), 1):
+                    if error:
+                        failed.append(name)
+                        print(f"  ERROR {name}: {error}")
+                        continue
+                    cache[name] = stamps[name]
+                    in_bytes += sizes[0]
+                    out_bytes += sizes[1]
+                    if done % CACHE_FLUSH_EVERY == 0:
+                        print(f"  [{done}/{len(jobs)}]")
+                        save_cache()
+    finally:
+        # Also on a crash or Ctrl-C, so finished files are not redone next run
+        save_cache()
+    return len(jobs) - len(failed), cached, failed, in_bytes, out_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write per-platform resampled copies of the word audio')
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES), default=None,
+                        help='Profile to build (repeatable, default: all)')
+    parser.add_argument('--source', default=None,
+                        help='WAV directory (default: tts_delivery/audio_processed if present, else tts_delivery/audio)')
+    parser.add_argument('--output', default=PROFILES_DIR, help='Parent output directory (default: tts_delivery/audio_profiles)')
+    parser.add_argument('--sample-rate', type=int, default=None,
+                        help="Override the profile's sample rate (needs exactly one --profile)")
+    parser.add_argument('--bits', type=int, choices=(8, 16), default=None,
+                        help="Override the profile's bit depth (needs exactly one --profile)")
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--force', action='store_true', help='Reconvert every file, ignoring the cache')
+    args = parser.parse_args()
+
+    profiles = args.profile or list(PROFILES)
+    if (args.sample_rate or args.bits) and len(profiles) != 1:
+        parser.error('--sample-rate / --bits override a single profile; pass exactly one --profile')
+
+    source = args.source or (PROCESSED_DIR if os.path.isdir(PROCESSED_DIR) else AUDIO_DIR)
+    if not os.path.isdir(source):
+        print(f"Error: {source} not found.")
+        sys.exit(1)
+
+    print(f"=== Audio Profiles ===")
+    print(f"Source: {source}")
+    for profile in profiles:
+        rate = args.sample_rate or PROFILES[profile]['sample_rate']
+        bits = args.bits or PROFILES[profile]['bits']
+        output_dir = os.path.join(args.output, profile)
+        start = time.perf_counter()
+        converted, cached, failed, in_bytes, out_bytes = build_profile(
+            profile, source, output_dir, rate, bits, args.workers, args.force)
+        elapsed = time.perf_counter() - start
+        ratio = f", {in_bytes / 2**20:.1f} MB -> {out_bytes / 2**20:.1f} MB" if in_bytes else ""
+        print(f"  {profile:8} {rate} Hz {bits:2}-bit: {converted} converted, {cached} cached, "
+              f"{len(failed)} failed{ratio} ({elapsed:.1f}s) -> {output_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Per-word audio quality gate.
+
+A synthesized clip is accepted only if:
+    the WAV header parses and the data chunk is complete (16-bit PCM, mono)
+    the sample rate is the library's (24 kHz, what Chirp 3 HD returns)
+    it holds at least --min-voiced-ms of speech
+    at most --max-silence-ratio of its frames are silent
+
+The check reuses audio_analysis.analyze_file (memory-mapped, one NumPy pass),
+so it costs well under a millisecond per clip and runs inline: tts_lib's
+synthesize_text(..., gate=gate) checks every file it writes, evicts a bad
+blob from the synthesis cache and re-requests once while the client is still
+warm. Clips that fail again are moved to tts_delivery/audio_rejected/ and
+their words collected in a retry queue (tts_delivery/quality_retry.txt),
+which generate_missing_audio.py accepts as --input.
+
+Batch mode checks a whole directory:
+    python words/audio_quality.py                    # report + write the retry queue
+    python words/audio_quality.py --quarantine       # also move failing clips aside
+    python words/generate_missing_audio.py --input words/tts_delivery/quality_retry.txt
+"""
+import argparse
+import os
+import shutil
+import sys
+import threading
+import time
+
+from audio_analysis import AUDIO_DIR, analyze_dir, analyze_file
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REJECTED_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_rejected')
+RETRY_QUEUE = os.path.join(SCRIPT_DIR, 'tts_delivery', 'quality_retry.txt')
+
+EXPECTED_SAMPLE_RATE = 24000
+MIN_VOICED_MS = 100
+# Clips carry ~300 ms of SSML padding plus leading silence; a typical word is ~65% silent
+MAX_SILENCE_RATIO = 0.9
+
+
+class QualityGate:
+    """Checks clips against the thresholds and collects the words that failed.
+
+    Thread-safe: one gate is shared by every worker of generate_concurrently().
+    """
+
+    def __init__(self, sample_rate=EXPECTED_SAMPLE_RATE, min_voiced_ms=MIN_VOICED_MS,
+                 max_silence_ratio=MAX_SILENCE_RATIO, rejected_dir=REJECTED_DIR):
+        self.sample_rate = sample_rate
+        self.min_voiced_ms = min_voiced_ms
+        self.max_silence_ratio = max_silence_ratio
+        self.rejected_dir = rejected_dir
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.checked = 0
+        self.retried = 0
+
+    def problems(self, row):
+        """List of reasons an analysis row (audio_analysis.COLUMNS) fails the gate."""
+        if not row['ok']:
+            return [f"bad header: {row['error']}"]
+        found = []
+        if row['channels'] != 1 or row['bits'] != 16:
+            found.append(f"{row['channels']} channel(s), {row['bits']}-bit (want mono 16-bit)")
+        if self.sample_rate and row['sample_rate'] != self.sample_rate:
+            found.append(f"sample rate {row['sample_rate']} (want {self.sample_rate})")
+        if row['voiced_ms'] < self.min_voiced_ms:
+            found.append(f"voiced {row['voiced_ms']} ms (min {self.min_voiced_ms})")
+        if row['silence_ratio'] > self.max_silence_ratio:
+            found.append(f"silence ratio {row['silence_ratio']:.2f} (max {self.max_silence_ratio:g})")
+        return found
+
+    def check(self, path):
+        """Reasons path fails the gate; empty list if the clip is fine."""
+        with self.lock:
+            self.checked += 1
+        if not os.path.exists(path):
+            return ['file missing']
+        return self.problems(analyze_file(path))
+
+    def reject(self, word, path, problems):
+        """Queue word for retry and move its clip out of the audio directory."""
+        with self.lock:
+            self.failures[word] = problems
+        if os.path.exists(path):
+            os.makedirs(self.rejected_dir, exist_ok=True)
+            shutil.move(path, os.path.join(self.rejected_dir, os.path.basename(path)))
+
+    def write_queue(self, path=RETRY_QUEUE):
+        """Write the failed words (one per line, reasons as comments); returns path."""
+        with self.lock:
+            failures = dict(self.failures)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('# Words whose audio failed the quality gate (python words/audio_quality.py)\n')
+            for word, problems in failures.items():
+                f.write(f"# {word}: {'; '.join(problems)}\n{word}\n")
+        return path
+
+    def summary(self):
+        return f"checked={self.checked} retried={self.retried} rejected={len(self.failures)}"
+
+
+def check_dir(audio_dir=AUDIO_DIR, gate=None, workers=None):
+    """Run the gate over every .wav in audio_dir -> [(filename, problems)] for failures."""
+    gate = gate or QualityGate()
+    rows = analyze_dir(audio_dir, workers)
+    gate.checked += len(rows)
+    return [(row['file'], p) for row in rows if (p := gate.problems(row))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check every word clip against the audio quality gate')
+    parser.add_argument('--input', default=AUDIO_DIR, help='Audio directory (default: tts_delivery/audio)')
+    parser.add_argument('--queue', default=RETRY_QUEUE, help='Retry queue file (default: tts_delivery/quality_retry.txt)')
+    parser.add_argument('--quarantine', action='store_true',
+                        help='Move failing clips to tts_delivery/audio_rejected/ so they are regenerated')
+    parser.add_argument('--sample-rate', type=int, default=EXPECTED_SAMPLE_RATE,
+                        help=f'Required sample rate, 0 for any (default: {EXPECTED_SAMPLE_RATE})')
+    parser.add_argument('--min-voiced-ms', type=int, default=MIN_VOICED_MS,
+                        help=f'Minimum speech per clip (default: {MIN_VOICED_MS})')
+    parser.add_argument('--max-silence-ratio', type=float, default=MAX_SILENCE_RATIO,
+                        help=f'Maximum fraction of silent frames (default: {MAX_SILENCE_RATIO:g})')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input):
+        print(f"Error: {args.input} not found.")
+        sys.exit(1)
+
+    gate = QualityGate(args.sample_rate, args.min_voiced_ms, args.max_silence_ratio)
+    start = time.perf_counter()
+    failed = check_dir(args.input, gate, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"=== Audio Quality Gate ===")
+    print(f"Checked {gate.checked} files in {elapsed:.2f}s, {len(failed)} failed")
+    for filename, problems in failed:
+        print(f"  {filename}: {'; '.join(problems)}")
+        word = filename[:-len('.wav')]
+        if args.quarantine:
+            gate.reject(word, os.path.join(args.input, filename), problems)
+        else:
+            gate.failures[word] = problems
+
+    if failed:
+        gate.write_queue(args.queue)
+        print(f"\nRetry queue: {args.queue}")
+        if args.quarantine:
+            print(f"Moved to:    {gate.rejected_dir}")
+        else:
+            print("Rerun with --quarantine to move the clips aside before regenerating them.")
+
+
+if __name__ == '__main__':
+    main()
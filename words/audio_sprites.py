@@ -0,0 +1,235 @@
+"""
+Pack each wordbook's audio into sprites: one file per wordbook level.
+
+Without sprites every tile tap is a separate HTTP fetch + HTMLAudio. This
+build stage concatenates the clips of every registered wordbook level
+(e.g. scene_food/all, cet4/高频) into one audio file with short silent gaps,
+and writes a start/duration index next to the wordbook JS:
+
+    words/tts_delivery/sprites/scene_food-all-0.mp3
+    wordbooks/audio_sprites.js
+        const AUDIO_SPRITES = {"scene_food": {"all": [{"src": "scene_food-all-0.mp3",
+                               "clips": {"apple.wav": [start_s, duration_s], ...}}]}};
+
+Levels longer than --max-seconds (the Oxford books) are split into several
+sprites. The player decodes a sprite only when a word in it is first played,
+drops the sprites of books/levels that are no longer active, and keeps at
+most MAX_DECODED_SPRITE_SECONDS (vocabulary.js) of decoded audio, so a
+phone never holds a whole Oxford level as float PCM.
+
+Clips are keyed by the entry's `audio` field, so the game's AudioPlayer can
+resolve playWord(cell.audio) to a seek into the decoded sprite buffer and
+fall back to the per-word file when a word is not in the loaded sprite.
+
+Sources are the post-processed clips (audio_postprocess.py) when present,
+else the raw WAVs. Sprites are encoded with the same ffmpeg codecs as
+audio_export.py; --codec wav needs no ffmpeg. The gap between clips absorbs
+encoder priming/padding so seeks never clip the start of a word.
+
+The index is also written as audio_sprites.json in the sprite directory;
+--book runs merge into that and regenerate the whole JS from it. The
+committed wordbooks/audio_sprites.js is empty (no sprites are committed),
+so the game plays per-word files until this stage is run.
+
+Usage:
+    python words/audio_sprites.py                       # mp3 sprites for every wordbook
+    python words/audio_sprites.py --codec opus --book scene_food --book cet4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from audio_export import CODECS, encode_file, find_ffmpeg
+from audio_postprocess import AUDIO_DIR, PROCESSED_DIR, pcm_to_wav_bytes, read_pcm
+from tts_cache import atomic_write
+from wordbook_index import PROJECT_DIR, WordbookIndex
+
+SPRITES_DIR = os.path.join(os.path.dirname(AUDIO_DIR), 'sprites')
+SPRITES_JS = os.path.join(PROJECT_DIR, 'wordbooks', 'audio_sprites.js')
+DEFAULT_CODEC = 'mp3'
+GAP_MS = 150
+# One sprite is the unit the player fetches and decodes: 60 s is ~11.5 MB of
+# float32 PCM at 48 kHz. Total decoded memory is capped by the player
+# (MAX_DECODED_SPRITE_SECONDS in vocabulary.js), not by this constant.
+MAX_SPRITE_SECONDS = 60
+INDEX_JSON_NAME = 'audio_sprites.json'
+
+
+def sprite_id(book, level, part):
+    return f"{book}-{level}-{part}"
+
+
+def source_wav(audio_field, source_dir):
+    """WAV path for a wordbook audio field ('apple.wav' or an exported 'apple.mp3')."""
+    return os.path.join(source_dir, os.path.splitext(audio_field)[0] + '.wav')
+
+
+def build_sprites(audio_fields, source_dir, gap_ms=GAP_MS, max_seconds=MAX_SPRITE_SECONDS):
+    """Concatenate clips into sprites of at most ~max_seconds each.
+
+    Returns ([(sample_rate, int16 samples, {audio_field: [start_s, duration_s]}), ...], missing).
+    Long levels are split so the browser never has to hold a huge decoded buffer.
+    """
+    sprites = []
+    missing = []
+    seen = set()
+    rate = gap = None
+    parts, clips, offset = [], {}, 0
+
+    def flush():
+        if clips:
+            parts.append(gap)
+            sprites.append((rate, np.concatenate(parts), dict(clips)))
+
+    for field in audio_fields:
+        if field in seen:
+            continue
+        seen.add(field)
+        path = source_wav(field, source_dir)
+        if not os.path.exists(path):
+            missing.append(field)
+            continue
+        params, samples = read_pcm(path)
+        if rate is None:
+            rate = params.framerate
+            gap = np.zeros(rate * gap_ms // 1000, dtype=np.int16)
+        elif params.framerate != rate:
+            missing.append(field)
+            continue
+        if clips and (offset + len(samples)) / rate > max_seconds:
+            flush()
+            parts, clips, offset = [], {}, 0
+        # Leading gap too, so the first clip is not affected by encoder priming
+        parts.append(gap)
+        offset += len(gap)
+        parts.append(samples)
+        clips[field] = [round(offset / rate, 4), round(len(samples) / rate, 4)]
+        offset += len(samples)
+    flush()
+    return sprites, missing
+
+
+def pack_level(book, level, audio_fields, source_dir, out_dir, codec, ffmpeg,
+               gap_ms=GAP_MS, max_seconds=MAX_SPRITE_SECONDS):
+    """Build and write one level's sprites; returns (book, level, [index entries], missing, bytes)."""
+    sprites, missing = build_sprites(audio_fields, source_dir, gap_ms, max_seconds)
+    entries = []
+    total = 0
+    for part, (rate, samples, clips) in enumerate(sprites):
+        name = sprite_id(book, level, part)
+        wav_path = os.path.join(out_dir, f"{name}.wav")
+        atomic_write(wav_path, pcm_to_wav_bytes(samples, rate))
+        if codec == 'wav':
+            path = wav_path
+        else:
+            path = os.path.join(out_dir, name + CODECS[codec][0])
+            encode_file(ffmpeg, wav_path, path, codec)
+            os.remove(wav_path)
+        entries.append({'src': os.path.basename(path), 'clips': clips})
+        total += os.path.getsize(path)
+    return book, level, entries, missing, total
+
+
+def load_index(path):
+    """Sprite index written by the last run ({book: {level: [entries]}}), or {} if none."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_sprites_js(index, path=SPRITES_JS):
+    payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    js = ('// 词书音频精灵索引 (自动生成: python words/audio_sprites.py)\n'
+          '// { bookId: { levelId: [ { src, clips: { audioFile: [start, duration] } }, ... ] } }\n'
+          f'const AUDIO_SPRITES = {payload};\n')
+    atomic_write(path, js.encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack wordbook audio into per-level sprites')
+    parser.add_argument('--codec', choices=['wav'] + sorted(CODECS), default=DEFAULT_CODEC,
+                        help=f'Sprite codec (default: {DEFAULT_CODEC})')
+    parser.add_argument('--book', action='append', default=None, help='Only pack this wordbook (repeatable)')
+    parser.add_argument('--source', default=None,
+                        help='WAV directory (default: tts_delivery/audio_processed if present, else tts_delivery/audio)')
+    parser.add_argument('--output', default=SPRITES_DIR, help='Sprite directory (default: tts_delivery/sprites)')
+    parser.add_argument('--index', default=SPRITES_JS, help='Index JS file (default: wordbooks/audio_sprites.js)')
+    parser.add_argument('--gap-ms', type=int, default=GAP_MS, help=f'Silence between clips (default: {GAP_MS})')
+    parser.add_argument('--max-seconds', type=float, default=MAX_SPRITE_SECONDS,
+                        help=f'Split levels into sprites of at most this length (default: {MAX_SPRITE_SECONDS:g})')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel sprites (default: all cores)')
+    args = parser.parse_args()
+
+    source = args.source or (PROCESSED_DIR if os.path.isdir(PROCESSED_DIR) else AUDIO_DIR)
+    try:
+        ffmpeg = None if args.codec == 'wav' else find_ffmpeg()
+    except RuntimeError as e:
+        print(f"Error: {e} (or use --codec wav)")
+        sys.exit(1)
+    os.makedirs(args.output, exist_ok=True)
+
+    start = time.perf_counter()
+    wordbooks = WordbookIndex.scan()
+    jobs = []
+    for book, entries in sorted(wordbooks.books.items()):
+        if args.book and book not in args.book:
+            continue
+        levels = {}
+        for e in entries:
+            if e.audio:
+                levels.setdefault(e.level, []).append(e.audio)
+        for level, fields in levels.items():
+            jobs.append((book, level, fields))
+
+    print(f"=== Audio Sprites ({args.codec}) ===")
+    print(f"Source: {source}")
+    print(f"Levels to pack: {len(jobs)}")
+
+    index = {}
+    total_bytes = 0
+    total_missing = 0
+    built = 0
+    with ThreadPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as pool:
+        futures = [pool.submit(pack_level, book, level, fields, source, args.output,
+                               args.codec, ffmpeg, args.gap_ms, args.max_seconds)
+                   for book, level, fields in jobs]
+        for future in futures:
+            book, level, entries, missing, size = future.result()
+            total_missing += len(missing)
+            if not entries:
+                print(f"  {book}/{level}: no audio found, skipped")
+                continue
+            index.setdefault(book, {})[level] = entries
+            total_bytes += size
+            built += len(entries)
+            clips = sum(len(e['clips']) for e in entries)
+            note = f", {len(missing)} missing" if missing else ""
+            print(f"  {book}/{level}: {clips} clips in {len(entries)} sprite(s), {size / 1024:.0f} KB{note}")
+
+    # Partial (--book) runs keep the other books' entries from the JSON index
+    index_json = os.path.join(args.output, INDEX_JSON_NAME)
+    if args.book:
+        old = load_index(index_json)
+        if not old:
+            print(f"  No previous {index_json}: the index will only list the selected books")
+        old.update(index)
+        index = old
+    atomic_write(index_json, json.dumps(index, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    write_sprites_js(index, args.index)
+
+    elapsed = time.perf_counter() - start
+    print(f"\nWrote {built} sprites ({total_bytes / 2**20:.1f} MB) in {elapsed:.1f}s")
+    if total_missing:
+        print(f"Clips without a source WAV: {total_missing} (played per file instead)")
+    print(f"Index: {args.index}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+"""
+Duration / loudness / size statistics of the word audio library.
+
+Groups every clip by CEFR level (oxford_5000_cleaned.csv) and by wordbook
+(the audio fields of wordbooks/*.js and oxford_vocabulary.js) and reports,
+per group and metric, count / mean / p50 / p95 / p99 / max plus a
+histogram on bin edges shared by all groups, so books can be compared
+side by side:
+
+    duration_ms   clip length
+    rms_dbfs      loudness
+    file_bytes    what the service worker caches for the group
+
+Each group also gets a memory estimate for vocabulary.js: cached file bytes
+(AudioPlayer.audioCache keeps every played clip) and the decoded PCM size
+(float32 at DECODE_RATE, what Web Audio would hold with every sprite of the
+group decoded; the player caps this at MAX_DECODED_SPRITE_SECONDS). The
+largest clips are listed as outliers.
+
+Per-file metrics come from audio_analysis.py (memory-mapped, all cores).
+Output is a JSON artifact and a static HTML page (no JS, inline SVG):
+
+    python words/audio_stats.py                       # tts_delivery/audio_stats.{json,html}
+    python words/audio_stats.py --bins 30 --outliers 50
+"""
+import argparse
+import csv
+import html
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from audio_analysis import AUDIO_DIR, analyze_dir
+from audio_store import resolve_audio
+from tts_cache import atomic_write
+from tts_priority import OXFORD_CSV
+from wordbook_index import WordbookIndex
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATS_JSON = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_stats.json')
+STATS_HTML = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_stats.html')
+
+METRICS = ('duration_ms', 'rms_dbfs', 'file_bytes')
+PERCENTILES = (50, 95, 99)
+DEFAULT_BINS = 20
+DEFAULT_OUTLIERS = 20
+# AudioContext decodes to float32 at the device rate (48 kHz on most phones)
+DECODE_RATE = 48000
+
+
+def cefr_groups(csv_path=OXFORD_CSV):
+    """{cefr: [audio filename]} for the Oxford word list (first level of a term wins)."""
+    groups = {}
+    seen = set()
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            term = row['term'].strip()
+            cefr = row['cefr'].strip() or '?'
+            if term in seen:
+                continue
+            seen.add(term)
+            groups.setdefault(cefr, []).append(f"{term}.wav")
+    return groups
+
+
+def wordbook_groups(index):
+    """{book: [audio filename]} from the wordbooks' audio fields (compressed names mapped back)."""
+    groups = {}
+    for book, entries in index.books.items():
+        groups[book] = [os.path.splitext(e.audio)[0] + '.wav' for e in entries if e.audio]
+    return groups
+
+
+def metric_edges(values, bins):
+    """Histogram edges shared by every group: 0.5th..99.5th percentile of the whole library."""
+    lo, hi = np.percentile(values, [0.5, 99.5])
+    if hi <= lo:
+        hi = lo + 1
+    return np.linspace(lo, hi, bins + 1)
+
+
+def summarize(values, edges):
+    """Distribution of one metric; values outside edges land in the first/last bin."""
+    if len(values) == 0:
+        return {'count': 0}
+    counts, _ = np.histogram(np.clip(values, edges[0], edges[-1]), edges)
+    p = np.percentile(values, PERCENTILES)
+    return {
+        'count': int(len(values)),
+        'mean': round(float(values.mean()), 2),
+        'min': round(float(values.min()), 2),
+        **{f'p{q}': round(float(v), 2) for q, v in zip(PERCENTILES, p)},
+        'max': round(float(values.max()), 2),
+        'histogram': counts.tolist(),
+    }
+
+
+def build_stats(rows, groupings, audio_dir=AUDIO_DIR, bins=DEFAULT_BINS, outliers=DEFAULT_OUTLIERS):
+    """Stats dict for analysis rows and {grouping: {group: [filename]}}."""
+    by_file = {r['file']: r for r in rows if r['ok']}
+    columns = {m: np.array([r[m] if r[m] is not None else np.nan for r in by_file.values()], dtype=float)
+               for m in METRICS}
+    position = {name: i for i, name in enumerate(by_file)}
+    edges = {m: metric_edges(columns[m][~np.isnan(columns[m])], bins) for m in METRICS}
+
+    def group_stats(filenames):
+        idx = []
+        missing = 0
+        for name in dict.fromkeys(filenames):
+            resolved = resolve_audio(name, audio_dir)
+            if resolved in position:
+                idx.append(position[resolved])
+            else:
+                missing += 1
+        idx = np.array(idx, dtype=int)
+        result = {'clips': len(idx), 'missing': missing}
+        for m in METRICS:
+            values = columns[m][idx]
+            result[m] = summarize(values[~np.isnan(values)], edges[m])
+        seconds = columns['duration_ms'][idx].sum() / 1000
+        result['cache_bytes'] = int(columns['file_bytes'][idx].sum())
+        result['decoded_bytes'] = int(seconds * DECODE_RATE * 4)
+        return result
+
+    stats = {
+        'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'audio_dir': audio_dir,
+        'decode_rate': DECODE_RATE,
+        'edges': {m: [round(float(e), 2) for e in edges[m]] for m in METRICS},
+        'all': group_stats(list(by_file)),
+    }
+    for grouping, groups in groupings.items():
+        stats[grouping] = {g: group_stats(files) for g, files in sorted(groups.items())}
+    largest = sorted(by_file.values(), key=lambda r: r['file_bytes'], reverse=True)[:outliers]
+    stats['outliers'] = [{'file': r['file'], 'file_bytes': r['file_bytes'],
+                          'duration_ms': r['duration_ms'], 'rms_dbfs': r['rms_dbfs']} for r in largest]
+    stats['unreadable'] = sorted(r['file'] for r in rows if not r['ok'])
+    return stats
+
+
+def _svg_histogram(counts, width=160, height=36):
+    peak = max(counts) or 1
+    bar = width / len(counts)
+    rects = ''.join(
+        f'<rect x="{i * bar:.1f}" y="{height - height * c / peak:.1f}" '
+        f'width="{bar - 1:.1f}" height="{height * c / peak:.1f}"/>'
+        for i, c in enumerate(counts) if c)
+    return f'<svg width="{width}" height="{height}">{rects}</svg>'
+
+
+def _fmt_bytes(n):
+    return f"{n / 2**20:.1f} MB" if n >= 2**20 else f"{n / 1024:.0f} KB"
+
+
+def render_html(stats):
+    """Static HTML page for a build_stats() dict."""
+    def table(title, groups):
+        head = ''.join(f'<th colspan="4">{m}</th>' for m in METRICS)
+        sub = '<th>p50</th><th>p95</th><th>p99</th><th>histogram</th>' * len(METRICS)
+        body = []
+        for name, g in groups.items():
+            cells = []
+            for m in METRICS:
+                s = g[m]
+                if not s['count']:
+                    cells.append('<td colspan="4"></td>')
+                    continue
+                cells.append(f"<td>{s['p50']:g}</td><td>{s['p95']:g}</td><td>{s['p99']:g}</td>"
+                             f"<td>{_svg_histogram(s['histogram'])}</td>")
+            body.append(f"<tr><th>{html.escape(name)}</th><td>{g['clips']}</td><td>{g['missing']}</td>"
+                        f"<td>{_fmt_bytes(g['cache_bytes'])}</td><td>{_fmt_bytes(g['decoded_bytes'])}</td>"
+                        f"{''.join(cells)}</tr>")
+        return (f"<h2>{title}</h2><table><tr><th rowspan=\"2\"></th><th rowspan=\"2\">clips</th>"
+                f"<th rowspan=\"2\">missing</th><th rowspan=\"2\">cache</th><th rowspan=\"2\">decoded</th>"
+                f"{head}</tr><tr>{sub}</tr>{''.join(body)}</table>")
+
+    edges = ''.join(f"<li>{m}: {stats['edges'][m][0]:g} .. {stats['edges'][m][-1]:g}</li>" for m in METRICS)
+    outliers = ''.join(f"<tr><td>{html.escape(o['file'])}</td><td>{_fmt_bytes(o['file_bytes'])}</td>"
+                       f"<td>{o['duration_ms']:g}</td><td>{o['rms_dbfs']}</td></tr>" for o in stats['outliers'])
+    return f"""<!DOCTYPE html>
+<html lang="zh-CN"><head><meta charset="utf-8"><title>Audio statistics</title>
+<style>
+body {{ font-family: sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; font-size: 13px; }}
+th, td {{ border: 1px solid #ddd; padding: 2px 6px; text-align: right; }}
+svg rect {{ fill: #4a90d9; }}
+</style></head><body>
+<h1>Audio statistics</h1>
+<p>{html.escape(stats['audio_dir'])} &middot; generated {stats['generated']} &middot;
+decoded = float32 PCM at {stats['decode_rate']} Hz</p>
+<p>Histogram ranges (values outside fall in the end bins):</p><ul>{edges}</ul>
+{table('All clips', {'all': stats['all']})}
+{table('By CEFR level', stats['cefr'])}
+{table('By wordbook', stats['wordbook'])}
+<h2>Largest clips</h2>
+<table><tr><th>file</th><th>size</th><th>duration_ms</th><th>rms_dbfs</th></tr>{outliers}</table>
+</body></html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-CEFR and per-wordbook audio statistics')
+    parser.add_argument('--input', default=AUDIO_DIR, help='Audio directory (default: tts_delivery/audio)')
+    parser.add_argument('--json', default=STATS_JSON, help='JSON output (default: tts_delivery/audio_stats.json)')
+    parser.add_argument('--html', default=STATS_HTML, help="HTML output, '' to skip (default: tts_delivery/audio_stats.html)")
+    parser.add_argument('--bins', type=int, default=DEFAULT_BINS, help=f'Histogram bins (default: {DEFAULT_BINS})')
+    parser.add_argument('--outliers', type=int, default=DEFAULT_OUTLIERS,
+                        help=f'Largest clips to list (default: {DEFAULT_OUTLIERS})')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input):
+        print(f"Error: {args.input} not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    rows = analyze_dir(args.input, args.workers)
+    groupings = {'cefr': cefr_groups(), 'wordbook': wordbook_groups(WordbookIndex.scan())}
+    stats = build_stats(rows, groupings, args.input, args.bins, args.outliers)
+    atomic_write(args.json, json.dumps(stats, ensure_ascii=False, indent=1).encode('utf-8'))
+    if args.html:
+        atomic_write(args.html, render_html(stats).encode('utf-8'))
+    elapsed = time.perf_counter() - start
+
+    total = stats['all']
+    print(f"Analyzed {total['clips']} clips in {elapsed:.2f}s")
+    print(f"{'group':24} {'clips':>6} {'cache':>9} {'decoded':>9} {'dur p50':>8} {'p95':>7} {'p99':>7}")
+    for grouping in ('cefr', 'wordbook'):
+        for name, g in stats[grouping].items():
+            d = g['duration_ms']
+            if not d['count']:
+                continue
+            print(f"{grouping[0]}:{name:22} {g['clips']:6} {_fmt_bytes(g['cache_bytes']):>9} "
+                  f"{_fmt_bytes(g['decoded_bytes']):>9} {d['p50']:8g} {d['p95']:7g} {d['p99']:7g}")
+    print(f"\nJSON: {args.json}")
+    if args.html:
+        print(f"HTML: {args.html}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+"""
+Deduplicated audio store for tts_delivery/audio.
+
+fix_audio_filenames.py copies a merged clip to its first word and
+fix_audio_step2.py renames by hand, so the library holds byte-identical
+copies under different names ('bath n.bathroom.wav' / 'bath.wav', ...).
+This stage hashes every file (only files that share a size with another
+file are hashed), keeps one file per digest and replaces the duplicates:
+
+    --mode hardlink   duplicates become hard links to the kept file (default;
+                      every name still exists, nothing else changes)
+    --mode symlink    duplicates become relative symlinks
+    --mode alias      duplicates are deleted and recorded in
+                      tts_delivery/audio_aliases.json ({"alias.wav": "kept.wav"});
+                      needs --confirm-delete, see below
+
+The kept file of each group is the name wordbooks reference, else a name
+without a part-of-speech suffix, else the shortest name.
+
+The Python tools resolve names through this module, so aliases are transparent to them:
+    audio_files()             on-disk names + aliases (wordbook_index, generate_missing_audio)
+    resolve_audio(filename)   the file that actually holds filename's audio, or None
+    audio_field(filename)     value for a wordbook `audio` field (alias + compressed export applied)
+
+The frontend does not read the alias table: game.js also plays `word + '.wav'`
+directly (the learned-words badge), and those requests 404 once the file is
+deleted. Alias mode is therefore not part of the normal workflow; it refuses
+to run without --confirm-delete. Use hardlink (or symlink) to save the space
+while keeping every name playable.
+
+Usage:
+    python words/audio_store.py --dry-run
+    python words/audio_store.py                    # hardlink duplicates
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tts_cache import atomic_write
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
+ALIASES_FILE = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio_aliases.json')
+MODES = ('hardlink', 'symlink', 'alias')
+
+# 'bath n.bathroom.wav', 'alone adj.adv..wav' - names produced by the old merged exports
+POS_SUFFIX_RE = re.compile(r'\s(?:n|v|adj|adv|prep|pron|det|conj|exclam|number|modal)\b.*\.wav$')
+
+_aliases = {}
+
+
+def load_aliases(path=ALIASES_FILE):
+    """Return {alias filename: kept filename}, or {} if none were recorded."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _cached_aliases(path=ALIASES_FILE):
+    if path not in _aliases:
+        _aliases[path] = load_aliases(path)
+    return _aliases[path]
+
+
+def audio_files(audio_dir=AUDIO_DIR, aliases_path=ALIASES_FILE):
+    """Set of available audio filenames: one scandir pass plus aliases whose target exists."""
+    if not os.path.isdir(audio_dir):
+        return set()
+    with os.scandir(audio_dir) as it:
+        names = {e.name for e in it if e.is_file()}
+    names.update(a for a, kept in _cached_aliases(aliases_path).items() if kept in names)
+    return names
+
+
+def resolve_audio(filename, audio_dir=AUDIO_DIR, aliases_path=ALIASES_FILE):
+    """Name of the file holding filename's audio (filename itself or its alias target), or None."""
+    if os.path.isfile(os.path.join(audio_dir, filename)):
+        return filename
+    kept = _cached_aliases(aliases_path).get(filename)
+    if kept and os.path.isfile(os.path.join(audio_dir, kept)):
+        return kept
+    return None
+
+
+def audio_field(filename, audio_dir=AUDIO_DIR, must_exist=True):
+    """Value for a wordbook `audio` field, or None if filename has no audio.
+
+    Applies the alias table, then the compressed-export mapping (audio_export.py).
+    With must_exist=False names are mapped even when no file is found
+    (manifest-driven generators keep their entries as before).
+    """
+    from audio_export import exported_audio_name
+
+    resolved = resolve_audio(filename, audio_dir)
+    if resolved is None:
+        if must_exist:
+            return None
+        resolved = _cached_aliases().get(filename, filename)
+    return exported_audio_name(resolved)
+
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def find_duplicates(audio_dir=AUDIO_DIR, workers=None):
+    """Groups of byte-identical .wav files -> {digest: [names]} (2+ names, distinct inodes).
+
+    Files are first bucketed by size; only sizes shared by several files are hashed.
+    Names that are already hard links to the same inode count once.
+    """
+    by_size = {}
+    inodes = {}
+    with os.scandir(audio_dir) as it:
+        for e in it:
+            if e.name.endswith('.wav') and e.is_file(follow_symlinks=False):
+                st = e.stat(follow_symlinks=False)
+                by_size.setdefault(st.st_size, []).append(e.name)
+                inodes[e.name] = (st.st_dev, st.st_ino)
+    candidates = [n for names in by_size.values() if len(names) > 1 for n in names]
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        digests = pool.map(lambda n: file_digest(os.path.join(audio_dir, n)), candidates)
+        groups = {}
+        for name, digest in zip(candidates, digests):
+            groups.setdefault(digest, []).append(name)
+
+    result = {}
+    for digest, names in groups.items():
+        if len({inodes[n] for n in names}) > 1:
+            result[digest] = sorted(names)
+    return result
+
+
+def choose_kept(names, referenced=()):
+    """Pick the file to keep from a group of identical files."""
+    return min(names, key=lambda n: (n not in referenced, bool(POS_SUFFIX_RE.search(n)), len(n), n))
+
+
+def _replace_with_link(audio_dir, name, kept, mode):
+    path = os.path.join(audio_dir, name)
+    tmp = os.path.join(audio_dir, f".tmp-link-{os.getpid()}")
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    if mode == 'hardlink':
+        os.link(os.path.join(audio_dir, kept), tmp)
+    else:
+        os.symlink(kept, tmp)
+    os.replace(tmp, path)
+
+
+def dedupe(audio_dir=AUDIO_DIR, mode='hardlink', referenced=(), aliases_path=ALIASES_FILE,
+           dry_run=False, workers=None):
+    """Replace duplicates in audio_dir; returns (groups, {duplicate: kept}, bytes saved)."""
+    groups = find_duplicates(audio_dir, workers)
+    replaced = {}
+    saved = 0
+    for names in groups.values():
+        kept = choose_kept(names, referenced)
+        kept_inode = os.stat(os.path.join(audio_dir, kept)).st_ino
+        for name in names:
+            path = os.path.join(audio_dir, name)
+            if name == kept or os.stat(path).st_ino == kept_inode:
+                continue
+            replaced[name] = kept
+            saved += os.path.getsize(path)
+            if dry_run:
+                continue
+            if mode == 'alias':
+                os.remove(path)
+            else:
+                _replace_with_link(audio_dir, name, kept, mode)
+
+    if mode == 'alias' and not dry_run and replaced:
+        aliases = load_aliases(aliases_path)
+        aliases.update(replaced)
+        # An alias must never point at another alias
+        aliases = {a: aliases.get(k, k) for a, k in aliases.items()}
+        atomic_write(aliases_path, json.dumps(aliases, ensure_ascii=False, indent=1, sort_keys=True).encode('utf-8'))
+        _aliases.pop(aliases_path, None)
+    return groups, replaced, saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Deduplicate byte-identical audio files')
+    parser.add_argument('--input', default=AUDIO_DIR, help='Audio directory (default: tts_delivery/audio)')
+    parser.add_argument('--mode', choices=MODES, default='hardlink',
+                        help='How duplicates are replaced (default: hardlink)')
+    parser.add_argument('--confirm-delete', action='store_true',
+                        help="Required by --mode alias, which deletes files the frontend plays by name")
+    parser.add_argument('--dry-run', action='store_true', help='Only report what would change')
+    parser.add_argument('--workers', type=int, default=None, help='Hashing threads (default: all cores)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input):
+        print(f"Error: {args.input} not found.")
+        sys.exit(1)
+
+    if args.mode == 'alias' and not args.dry_run:
+        print("WARNING: --mode alias deletes the duplicate files. game.js plays `word + '.wav'`")
+        print("         directly (learned-words badge) and does not read audio_aliases.json,")
+        print("         so those words lose their audio. Prefer the default --mode hardlink.")
+        if not args.confirm_delete:
+            print("Refusing to delete without --confirm-delete.")
+            sys.exit(1)
+
+    from wordbook_index import WordbookIndex
+
+    start = time.perf_counter()
+    referenced = set(WordbookIndex.scan().audio_refs())
+    groups, replaced, saved = dedupe(args.input, args.mode, referenced, dry_run=args.dry_run,
+                                     workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"=== Audio Dedupe ({args.mode}{', dry run' if args.dry_run else ''}) ===")
+    for names in sorted(groups.values()):
+        kept = choose_kept(names, referenced)
+        others = [n for n in names if n != kept]
+        print(f"  keep {kept!r:40} <- {', '.join(repr(n) for n in others)}")
+    print(f"\nGroups: {len(groups)}  Duplicates: {len(replaced)}  "
+          f"Saved: {saved / 2**20:.1f} MB  ({elapsed:.2f}s)")
+    if args.mode == 'alias' and replaced and not args.dry_run:
+        print(f"Aliases: {ALIASES_FILE}")
+        print("Regenerate the wordbooks so their audio fields point at the kept files.")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,70 +3,21 @@ Fix corrupted audio filenames in tts_delivery/audio/
 Merged filenames like 'bath n.bathroom.wav' get split into 'bath.wav' + 'bathroom.wav'
 """
 import os
-import re
 import shutil
 
+from pos_grammar import POS_PATTERN, has_sense_number, split_terms
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
 
-# POS markers pattern (same as in clean_vocabulary.py)
-POS_PATTERN = re.compile(
-    r'\s+(?:adj\./adv\.|det\./pron\./adv\.|det\./pron\.|det\./number|'
-    r'conj\./prep\.|conj\./adv\.|prep\./adv\.|pron\./det\.|'
-    r'adj\./pron\.|adv\./prep\.|exclam\./n\.|number/det\.|n\./v\.|'
-    r'indefinite\s+article|definite\s+article|infinitive\s+marker|'
-    r'modal\s+v\.|modal|auxiliary|number|'
-    r'adj\.|adv\s*\.|det\.|pron\.|prep\.|conj\.|exclam\.|n\.|v\s*\.)'
-)
-
-BROKEN_NAMES = {
-    'reven ge': 'revenge',
-    'allright': 'all right',
-    'second 1 det.': 'second',
-}
-
 
 def extract_words_from_filename(name):
-    """Extract individual words from a merged filename (without .wav extension)"""
-    # Fix known broken names
-    for broken, fixed in BROKEN_NAMES.items():
-        if broken in name:
-            name = name.replace(broken, fixed)
-
-    words = []
-    remaining = name.strip()
-
-    while remaining:
-        remaining = remaining.strip()
-        if not remaining:
-            break
-
-        m = POS_PATTERN.search(remaining)
-        if m:
-            word_part = remaining[:m.start()].strip()
-            if word_part:
-                # Clean sense numbers
-                cleaned = re.sub(r'\s*\d+$', '', word_part).strip()
-                cleaned = re.sub(r'(\D)\d+$', r'\1', cleaned).strip()
-                if cleaned:
-                    words.append(cleaned)
-
-            # Check what's after the POS marker
-            after_pos = remaining[m.end():].strip()
-            if after_pos:
-                # There might be more words after
-                remaining = after_pos
-            else:
-                break
-        else:
-            # No POS marker found, clean and add the remaining
-            cleaned = re.sub(r'\s*\d+$', '', remaining).strip()
-            cleaned = re.sub(r'(\D)\d+$', r'\1', cleaned).strip()
-            if cleaned:
-                words.append(cleaned)
-            break
+    """Extract individual words from a merged filename (without .wav extension).
 
-    return words
+    Same grammar as the term cleaning in clean_vocabulary.py, so repaired
+    filenames match the cleaned terms.
+    """
+    return split_terms(name)
 
 
 def main():
@@ -85,7 +36,7 @@ def main():
 
         # Check if this filename needs fixing
         has_pos = POS_PATTERN.search(name)
-        has_number_suffix = re.search(r'\s+\d+$', name) or re.search(r'(\D)\d+$', name)
+        has_number_suffix = has_sense_number(name)
 
         if not has_pos and not has_number_suffix:
             continue  # Clean filename, skip
@@ -1,100 +1,73 @@
 """
 Generate TTS audio for all missing words across all wordbooks.
 
-Reads the missing word list from all_missing_audio.txt (generated by scanning
-all registered wordbooks against the audio directory).
+Reads the missing word list from all_missing_audio.txt (written by
+wordbook_index.py), or with --scan computes it directly from the wordbooks.
 
 Uses Google Cloud TTS Chirp 3 HD (Zephyr) voice - same as existing audio files.
+Synthesis, caching and rate limiting are shared with generate_tts.py via tts_lib.py.
 Output: words/tts_delivery/audio/{word}.wav
 
 Usage:
-    # First, regenerate the missing word list:
-    node -e "
-    global.WORDBOOK_REGISTRY={};
-    global.registerWordbook=function(i,c){WORDBOOK_REGISTRY[i]=c};
-    require('./oxford_vocabulary.js');
-    var fs=require('fs');
-    fs.readdirSync('./wordbooks').filter(f=>f.endsWith('.js')).forEach(f=>require('./wordbooks/'+f));
-    var audioDir='words/tts_delivery/audio';
-    var audioFiles=new Set(fs.readdirSync(audioDir).map(f=>f.replace('.wav','')));
-    var allMissing=new Set();
-    Object.keys(WORDBOOK_REGISTRY).forEach(id=>{
-      var wb=WORDBOOK_REGISTRY[id];
-      Object.keys(wb.levels).forEach(lv=>{
-        wb.levels[lv].words.forEach(w=>{
-          if(audioFiles.has(w.word)===false) allMissing.add(w.word);
-        });
-      });
-    });
-    console.log(Array.from(allMissing).sort().join('\\n'));
-    " > words/all_missing_audio.txt
+    # First, regenerate the missing word list (parses the wordbook JS directly):
+    python words/wordbook_index.py
 
     # Then generate audio:
     python words/generate_missing_audio.py
 
+    # Or skip the word list and scan the wordbooks in the same run:
+    python words/generate_missing_audio.py --scan
+
+    # Exercise the pipeline offline (deterministic tones, simulated latency):
+    python words/generate_missing_audio.py --backend local --local-latency 0.2
+
     # Or do a dry run first:
     python words/generate_missing_audio.py --dry-run
+
+    # Control how many requests are kept in flight (default 4, 1 = sequential):
+    python words/generate_missing_audio.py --workers 8
+
+    # Words are generated highest-priority first (wordbook membership + CEFR by
+    # default); add play counts and cap the run:
+    python words/generate_missing_audio.py --priority wordbook,cefr,plays --stats stats.json --max-requests 100
 """
 
 import os
 import sys
 import argparse
-import json
-from google.cloud import texttospeech
-from google.api_core import client_options
-
-# --- Configuration ---
-LANGUAGE_CODE = 'en-US'
-TARGET_VOICE_NAME = 'en-US-Chirp3-HD-Zephyr'
-GOOGLE_CLOUD_PROJECT_ID = 'gen-lang-client-0153103557'
+import time
+from tts_lib import (
+    DEFAULT_WORKERS, LANGUAGE_CODE, TARGET_VOICE_DISPLAY, TARGET_VOICE_NAME,
+    add_tts_arguments, generate_concurrently, resolve_voice, setup_pipeline, setup_quality_gate,
+    synthesize_text, write_failed_words,
+)
+from tts_priority import PRIORITY_SOURCES, build_priority, prioritize
+from audio_store import audio_files
+from wordbook_index import WordbookIndex
 
 # Fix Windows console encoding for progress output
 if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
-def get_text_to_speech_client():
-    """Initializes the Text-to-Speech client with explicit quota project."""
-    try:
-        options = client_options.ClientOptions(quota_project_id=GOOGLE_CLOUD_PROJECT_ID)
-        return texttospeech.TextToSpeechClient(client_options=options)
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        print(f"Error initializing Google Cloud TTS Client: {e}")
-        print("Ensure you have authenticated using: gcloud auth application-default login")
-        return None
-
-
-def synthesize_text(client, text, voice_name, output_path):
-    """Synthesizes speech using SSML with 300ms padding to prevent audio cutoff."""
-    ssml_text = f'<speak>{text}<break time="300ms"/></speak>'
-    input_text = texttospeech.SynthesisInput(ssml=ssml_text)
-
-    voice = texttospeech.VoiceSelectionParams(
-        language_code=LANGUAGE_CODE,
-        name=voice_name
-    )
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.LINEAR16
-    )
-
-    try:
-        response = client.synthesize_speech(
-            request={"input": input_text, "voice": voice, "audio_config": audio_config}
-        )
-        with open(output_path, "wb") as out:
-            out.write(response.audio_content)
-        return True
-    except Exception as e:
-        print(f"  ERROR synthesizing '{text}': {e}")
-        return False
-
-
 def main():
     parser = argparse.ArgumentParser(description='Generate TTS audio for missing words')
     parser.add_argument('--dry-run', action='store_true', help='List words without generating audio')
     parser.add_argument('--input', default=None, help='Input file (default: words/all_missing_audio.txt)')
+    parser.add_argument('--scan', action='store_true',
+                        help='Scan the wordbooks for missing audio instead of reading --input')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Max concurrent TTS requests (default: {DEFAULT_WORKERS})')
+    add_tts_arguments(parser)
+    parser.add_argument('--priority', default='wordbook,cefr',
+                        help=f"Comma-separated priority sources from {', '.join(PRIORITY_SOURCES)}, "
+                             f"or 'none' for input order (default: wordbook,cefr)")
+    parser.add_argument('--stats', default=None,
+                        help="Exported wordGameStats JSON, used by the 'plays' priority source")
+    parser.add_argument('--max-requests', type=int, default=None,
+                        help='Only generate the N highest-priority words')
+    parser.add_argument('--max-seconds', type=float, default=None,
+                        help='Stop starting new words after this many seconds')
     args = parser.parse_args()
 
     # Setup paths
@@ -105,27 +78,48 @@ def main():
     if not os.path.exists(audio_dir):
         os.makedirs(audio_dir)
 
+    # One directory scan serves both the missing-word diff and the skip check
+    available = audio_files(audio_dir)
+    index = None
+
     # Load missing words
-    if not os.path.exists(input_file):
+    if args.scan:
+        index = WordbookIndex.scan()
+        words = index.missing_words(available)
+    elif not os.path.exists(input_file):
         print(f"Error: {input_file} not found.")
-        print("Generate it first with the Node.js command in the script header.")
+        print("Generate it first with: python words/wordbook_index.py (or pass --scan)")
         return
-
-    with open(input_file, 'r', encoding='utf-8') as f:
-        words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    else:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
 
     # Skip words that already have audio (in case of partial re-runs)
-    existing_audio = set()
-    if os.path.exists(audio_dir):
-        existing_audio = {f.replace('.wav', '') for f in os.listdir(audio_dir) if f.endswith('.wav')}
+    existing_audio = {f[:-len('.wav')] for f in available if f.endswith('.wav')}
 
     to_generate = [w for w in words if w not in existing_audio]
     already_done = len(words) - len(to_generate)
 
+    # Highest-value words first, so partial runs deliver the most useful audio
+    sources = [] if args.priority == 'none' else [p.strip() for p in args.priority.split(',')]
+    unknown = [p for p in sources if p not in PRIORITY_SOURCES]
+    if unknown:
+        print(f"Error: unknown priority source(s): {', '.join(unknown)}")
+        return
+    if sources:
+        to_generate = prioritize(to_generate, build_priority(sources, args.stats, index))
+    over_budget = 0
+    if args.max_requests is not None and len(to_generate) > args.max_requests:
+        over_budget = len(to_generate) - args.max_requests
+        to_generate = to_generate[:args.max_requests]
+
     print(f"=== Missing Audio Generator ===")
     print(f"Total missing words: {len(words)}")
     print(f"Already have audio:  {already_done}")
     print(f"Need to generate:    {len(to_generate)}")
+    if over_budget:
+        print(f"Deferred by budget:  {over_budget} (--max-requests)")
+    print(f"Priority:            {', '.join(sources) or 'input order'}")
     print(f"Output directory:    {audio_dir}")
     print()
 
@@ -140,49 +134,59 @@ def main():
         print(f"\nTotal: {len(to_generate)} words")
         return
 
-    # Init TTS client
-    client = get_text_to_speech_client()
-    if not client:
+    # Init TTS backend
+    backend, limiter, cache = setup_pipeline(args)
+    if not backend:
+        return
+    gate = setup_quality_gate(args, backend)
+
+    # Resolve the voice once (voice catalog cache, --refresh-voices refetches it)
+    voice_id = resolve_voice(backend, LANGUAGE_CODE, TARGET_VOICE_NAME, TARGET_VOICE_DISPLAY,
+                             refresh=args.refresh_voices)
+    if not voice_id:
+        print(f"Voice {TARGET_VOICE_NAME} is not available (backend: {backend.name}). Aborting.")
         return
 
     # Generate audio
-    success = 0
-    failed = []
     total = len(to_generate)
 
     print(f"Starting TTS generation for {total} words...")
-    print(f"Voice: {TARGET_VOICE_NAME}")
+    print(f"Voice: {voice_id} (backend: {backend.name})")
     print(f"Format: WAV (LINEAR16)")
+    print(f"Workers: {args.workers}")
+    print(f"Rate:    {args.qps:g} req/s (adaptive, max {args.max_qps:g})")
     print()
 
-    for i, word in enumerate(to_generate, 1):
-        filename = f"{word}.wav"
-        output_path = os.path.join(audio_dir, filename)
+    def synthesize(word, output_path):
+        return synthesize_text(backend, word, voice_id, output_path, limiter, cache, gate)
 
-        progress = f"[{i}/{total}]"
-        print(f"{progress} Generating: {word}...", end=' ', flush=True)
-
-        if synthesize_text(client, word, TARGET_VOICE_NAME, output_path):
-            success += 1
-            size_kb = os.path.getsize(output_path) / 1024
-            print(f"OK ({size_kb:.1f} KB)")
-        else:
-            failed.append(word)
-            print("FAILED")
+    deadline = time.monotonic() + args.max_seconds if args.max_seconds else None
+    success, failed, skipped, elapsed = generate_concurrently(
+        to_generate, audio_dir, synthesize, max_workers=args.workers, deadline=deadline
+    )
+    total -= len(skipped)
 
     # Summary
     print()
     print(f"=== Generation Complete ===")
     print(f"Success: {success}/{total}")
+    if skipped:
+        print(f"Skipped: {len(skipped)} words not started before --max-seconds (rerun to continue)")
+    print(f"Elapsed: {elapsed:.1f}s ({total / elapsed if elapsed else 0:.2f} words/sec)")
+    print(f"Limiter: {limiter.summary()}")
+    if cache:
+        print(f"Cache:   {cache.summary()}")
+    if gate:
+        print(f"Quality: {gate.summary()}")
     if failed:
         print(f"Failed:  {len(failed)} words:")
         for w in failed:
             print(f"  - {w}")
         # Save failed list for retry
-        failed_file = os.path.join(base_dir, 'tts_failed.txt')
-        with open(failed_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(failed) + '\n')
+        failed_file = write_failed_words(os.path.join(base_dir, 'tts_failed.txt'), failed)
         print(f"Failed words saved to: {failed_file}")
+        if gate and gate.failures:
+            print(f"Quality rejects queued in: {gate.write_queue()}")
     else:
         print("All words generated successfully!")
 
@@ -1,724 +1,25 @@
 #!/usr/bin/env python3
 """
 Generate 19 scene-based wordbook JS files from Oxford 5000 CSV data.
-Reads oxford_5000_cleaned.csv, maps words to scene categories,
-and outputs registerWordbook() JS files for each scene.
+Maps words to scene categories, looks up their meanings in the shared
+translation store (Oxford CSV first, then the 'scene' layer of
+translation_fallbacks.csv) and outputs registerWordbook() JS files for each scene.
 
 Scenes: food, clothing, home, transport, health, shopping, nature,
         entertainment, travel, work, school, social,
         fitness, music, animals, plants, festivals, cooking, law
 """
 
-import csv
 import os
 
+from audio_store import audio_field
+from translation_store import TranslationStore
+
 # --- Paths ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-CSV_PATH = os.path.join(SCRIPT_DIR, 'oxford_5000_cleaned.csv')
 AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
 WORDBOOKS_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), 'wordbooks')
-
-# --- Extra translations for words NOT in Oxford 5000 CSV ---
-EXTRA_TRANSLATIONS = {
-    'brochure': '手册',
-    'excursion': '短途旅行',
-    'safari': '狩猎旅行',
-    'pilgrimage': '朝圣',
-    'itinerary': '行程',
-    'hostel': '旅社',
-    'motel': '汽车旅馆',
-    'inn': '旅馆',
-    'paradise': '天堂',
-    'postcard': '明信片',
-    'sightseeing': '观光',
-    'souvenir': '纪念品',
-    'wander': '漫步',
-    'visa': '签证',
-    'baggage': '行李',
-    'backpack': '背包',
-    'landmark': '地标',
-    'scenery': '风景',
-    'voyage': '航行',
-    'cereal': '谷物',
-    'fridge': '冰箱',
-    'garlic': '大蒜',
-    'grill': '烧烤',
-    'grocery': '杂货',
-    'lettuce': '生菜',
-    'microwave': '微波炉',
-    'mushroom': '蘑菇',
-    'olive': '橄榄',
-    'organic': '有机的',
-    'pasta': '意大利面',
-    'peach': '桃子',
-    'recipe': '食谱',
-    'sausage': '香肠',
-    'vinegar': '醋',
-    'wheat': '小麦',
-    'strawberry': '草莓',
-    'snack': '零食',
-    'toast': '吐司',
-    'collar': '衣领',
-    'costume': '服装',
-    'elegant': '优雅的',
-    'handbag': '手提包',
-    'jumper': '毛衣',
-    'purse': '钱包',
-    'scarf': '围巾',
-    'silk': '丝绸',
-    'sleeve': '袖子',
-    'stripe': '条纹',
-    'sunglasses': '太阳镜',
-    'underwear': '内衣',
-    'vest': '背心',
-    'wool': '羊毛',
-    'zip': '拉链',
-    'attic': '阁楼',
-    'balcony': '阳台',
-    'basement': '地下室',
-    'chimney': '烟囱',
-    'couch': '沙发',
-    'cupboard': '橱柜',
-    'curtain': '窗帘',
-    'cushion': '垫子',
-    'doorway': '门口',
-    'drawer': '抽屉',
-    'fireplace': '壁炉',
-    'heater': '加热器',
-    'landlord': '房东',
-    'lawn': '草坪',
-    'mat': '垫子',
-    'pillow': '枕头',
-    'plug': '插头',
-    'rug': '地毯',
-    'shelf': '架子',
-    'shower': '淋浴',
-    'sink': '水槽',
-    'sofa': '沙发',
-    'stairs': '楼梯',
-    'tap': '水龙头',
-    'terrace': '露台',
-    'vacuum': '吸尘器',
-    'wardrobe': '衣柜',
-    'yard': '院子',
-    'accelerate': '加速',
-    'brake': '刹车',
-    'cab': '出租车',
-    'carriage': '车厢',
-    'commute': '通勤',
-    'crossing': '人行横道',
-    'diesel': '柴油',
-    'fare': '车费',
-    'ferry': '渡轮',
-    'gear': '齿轮',
-    'harbour': '港口',
-    'helicopter': '直升机',
-    'highway': '高速公路',
-    'junction': '交叉路口',
-    'lorry': '卡车',
-    'motorway': '高速公路',
-    'petrol': '汽油',
-    'platform': '站台',
-    'rail': '铁轨',
-    'runway': '跑道',
-    'steer': '驾驶',
-    'subway': '地铁',
-    'terminal': '航站楼',
-    'tire': '轮胎',
-    'tunnel': '隧道',
-    'van': '货车',
-    'vehicle': '车辆',
-    'ache': '疼痛',
-    'allergy': '过敏',
-    'ambulance': '救护车',
-    'ankle': '脚踝',
-    'bandage': '绷带',
-    'chin': '下巴',
-    'clinic': '诊所',
-    'deaf': '聋的',
-    'dentist': '牙医',
-    'diabetes': '糖尿病',
-    'dizzy': '头晕的',
-    'dose': '剂量',
-    'elbow': '肘',
-    'forehead': '额头',
-    'gym': '健身房',
-    'headache': '头痛',
-    'immune': '免疫的',
-    'infection': '感染',
-    'injection': '注射',
-    'jaw': '下巴',
-    'joint': '关节',
-    'kidney': '肾脏',
-    'liver': '肝脏',
-    'lung': '肺',
-    'nail': '指甲',
-    'nerve': '神经',
-    'pharmacy': '药房',
-    'pill': '药片',
-    'poison': '毒药',
-    'pregnant': '怀孕的',
-    'prescription': '处方',
-    'rib': '肋骨',
-    'spine': '脊柱',
-    'surgeon': '外科医生',
-    'swallow': '吞咽',
-    'symptom': '症状',
-    'throat': '喉咙',
-    'thumb': '拇指',
-    'toe': '脚趾',
-    'tongue': '舌头',
-    'vaccine': '疫苗',
-    'virus': '病毒',
-    'vitamin': '维生素',
-    'waist': '腰',
-    'ward': '病房',
-    'wheelchair': '轮椅',
-    'wound': '伤口',
-    'wrist': '手腕',
-    'coupon': '优惠券',
-    'merchant': '商人',
-    'wholesale': '批发',
-    'penny': '便士',
-    'refund': '退款',
-    'retail': '零售',
-    'bargain': '讨价还价',
-    'receipt': '收据',
-    'algebra': '代数',
-    'arithmetic': '算术',
-    'blackboard': '黑板',
-    'encyclopedia': '百科全书',
-    'handwriting': '笔迹',
-    'headmaster': '校长',
-    'notebook': '笔记本',
-    'textbook': '课本',
-    'undergraduate': '本科生',
-    'affection': '感情',
-    'awkward': '尴尬的',
-    'empathy': '同理心',
-    'enthusiasm': '热情',
-    'envy': '嫉妒',
-    'frustrate': '挫败',
-    'grief': '悲伤',
-    'irritate': '激怒',
-    'jealous': '嫉妒的',
-    'quarrel': '争吵',
-    'sorrow': '悲伤',
-    'tease': '取笑',
-    'temper': '脾气',
-    'rehearsal': '排练',
-    'rhythm': '节奏',
-    'sculpture': '雕塑',
-    'ballet': '芭蕾',
-    'volleyball': '排球',
-    'yoga': '瑜伽',
-    'recreation': '娱乐',
-    'chess': '国际象棋',
-    'check-in': '登记入住',
-    'accommodation': '住宿',
-    'heritage': '遗产',
-    'hiking': '远足',
-    'resort': '度假胜地',
-    'tourism': '旅游业',
-    # --- Additional missing translations ---
-    # food
-    'berry': '浆果',
-    'candy': '糖果',
-    'cherry': '樱桃',
-    'cookie': '饼干',
-    'corn': '玉米',
-    'dessert': '甜点',
-    'dine': '用餐',
-    'grape': '葡萄',
-    'honey': '蜂蜜',
-    'kettle': '水壶',
-    'lamb': '羊肉',
-    'pea': '豌豆',
-    'pie': '馅饼',
-    'pizza': '比萨',
-    'pork': '猪肉',
-    'roast': '烤',
-    'steak': '牛排',
-    'supper': '晚餐',
-    'tomato': '番茄',
-    # clothing
-    'shorts': '短裤',
-    'stain': '污渍',
-    'wallet': '钱包',
-    # home
-    'lock': '锁',
-    'tile': '瓷砖',
-    # health
-    'cough': '咳嗽',
-    'teeth': '牙齿',
-    # shopping
-    'cheque': '支票',
-    'mall': '购物中心',
-    'supply': '供应',
-    # nature
-    'breeze': '微风',
-    'butterfly': '蝴蝶',
-    'deer': '鹿',
-    'dolphin': '海豚',
-    'ecology': '生态学',
-    'eruption': '喷发',
-    'fog': '雾',
-    'frost': '霜',
-    'goat': '山羊',
-    'jungle': '丛林',
-    'mammal': '哺乳动物',
-    'rabbit': '兔子',
-    'rainbow': '彩虹',
-    'reef': '礁石',
-    'shark': '鲨鱼',
-    'sunshine': '阳光',
-    'thunder': '雷',
-    'tiger': '老虎',
-    'volcano': '火山',
-    'whale': '鲸鱼',
-    'wolf': '狼',
-    # entertainment
-    'athletics': '田径',
-    'surf': '冲浪',
-    # travel
-    'customs': '海关',
-    'luggage': '行李',
-    'suitcase': '手提箱',
-    # work
-    'intern': '实习生',
-    'overtime': '加班',
-    # school
-    'diploma': '文凭',
-    'graduation': '毕业',
-    'grammar': '语法',
-    'quiz': '测验',
-    'semester': '学期',
-    'tutor': '家教',
-    'vocabulary': '词汇',
-    # social
-    'bore': '使厌烦',
-    'compliment': '赞美',
-    'confuse': '使困惑',
-    'hug': '拥抱',
-    'thankful': '感激的',
-    # fitness
-    'abs': '腹肌',
-    'aerobic': '有氧运动',
-    'agile': '敏捷的',
-    'barbell': '杠铃',
-    'cardio': '有氧运动',
-    'cramp': '抽筋',
-    'curl': '弯举',
-    'dash': '冲刺',
-    'dumbbell': '哑铃',
-    'endurance': '耐力',
-    'flex': '屈伸',
-    'grip': '握力',
-    'handball': '手球',
-    'hydrate': '补水',
-    'instructor': '教练',
-    'jog': '慢跑',
-    'lunge': '弓步',
-    'paddle': '球拍',
-    'pedal': '踏板',
-    'plank': '平板支撑',
-    'rep': '次数',
-    'rope': '跳绳',
-    'row': '划船',
-    'skip': '跳绳',
-    'slam': '猛击',
-    'spin': '动感单车',
-    'squat': '深蹲',
-    'stamina': '耐力',
-    'stride': '步幅',
-    'sweat': '汗水',
-    'treadmill': '跑步机',
-    'wrestle': '摔跤',
-    # music
-    'acoustic': '原声的',
-    'alto': '中音',
-    'amplifier': '放大器',
-    'auditorium': '音乐厅',
-    'bass': '低音',
-    'bell': '铃',
-    'blues': '蓝调',
-    'bow': '琴弓',
-    'brass': '铜管乐器',
-    'carol': '颂歌',
-    'cello': '大提琴',
-    'choir': '合唱团',
-    'chord': '和弦',
-    'chorus': '合唱',
-    'clarinet': '单簧管',
-    'clap': '鼓掌',
-    'composer': '作曲家',
-    'conductor': '指挥',
-    'disc': '唱片',
-    'drum': '鼓',
-    'duet': '二重奏',
-    'echo': '回声',
-    'encore': '返场',
-    'ensemble': '合奏',
-    'flute': '长笛',
-    'folk': '民谣',
-    'genre': '流派',
-    'gig': '演出',
-    'harp': '竖琴',
-    'headphone': '耳机',
-    'hip': '嘻哈',
-    'horn': '圆号',
-    'hymn': '赞美诗',
-    'keyboard': '键盘',
-    'loop': '循环',
-    'loud': '响亮的',
-    'lyric': '歌词',
-    'melody': '旋律',
-    'microphone': '麦克风',
-    'percussion': '打击乐',
-    'playlist': '播放列表',
-    'pop': '流行音乐',
-    'punk': '朋克',
-    'rap': '说唱',
-    'recording': '录音',
-    'remix': '混音',
-    'scale': '音阶',
-    'soprano': '女高音',
-    'soul': '灵魂乐',
-    'speaker': '扬声器',
-    'string': '弦乐',
-    'symphony': '交响曲',
-    'tempo': '节拍',
-    'tenor': '男高音',
-    'tune': '曲调',
-    'violin': '小提琴',
-    'vocal': '声乐的',
-    # animals
-    'alligator': '鳄鱼',
-    'ape': '猿猴',
-    'aquarium': '水族馆',
-    'beak': '鸟嘴',
-    'beetle': '甲虫',
-    'buffalo': '水牛',
-    'cage': '笼子',
-    'camel': '骆驼',
-    'chick': '小鸡',
-    'claw': '爪子',
-    'crocodile': '鳄鱼',
-    'crow': '乌鸦',
-    'dinosaur': '恐龙',
-    'donkey': '驴',
-    'dove': '鸽子',
-    'duck': '鸭子',
-    'eagle': '鹰',
-    'endangered': '濒危的',
-    'exotic': '异国的',
-    'extinction': '灭绝',
-    'falcon': '隼',
-    'fin': '鱼鳍',
-    'flock': '群',
-    'fox': '狐狸',
-    'frog': '青蛙',
-    'fur': '皮毛',
-    'goose': '鹅',
-    'gorilla': '大猩猩',
-    'hamster': '仓鼠',
-    'hare': '野兔',
-    'hawk': '鹰',
-    'hen': '母鸡',
-    'herd': '兽群',
-    'hound': '猎犬',
-    'ivory': '象牙',
-    'kangaroo': '袋鼠',
-    'kitten': '小猫',
-    'leash': '牵引绳',
-    'leopard': '豹',
-    'lizard': '蜥蜴',
-    'mare': '母马',
-    'migrate': '迁徙',
-    'mosquito': '蚊子',
-    'mule': '骡子',
-    'nest': '巢',
-    'ostrich': '鸵鸟',
-    'otter': '水獭',
-    'owl': '猫头鹰',
-    'ox': '公牛',
-    'panda': '熊猫',
-    'parrot': '鹦鹉',
-    'paw': '爪子',
-    'peacock': '孔雀',
-    'penguin': '企鹅',
-    'pigeon': '鸽子',
-    'pony': '小马',
-    'predator': '捕食者',
-    'prey': '猎物',
-    'puppy': '小狗',
-    'rat': '老鼠',
-    'reptile': '爬行动物',
-    'rooster': '公鸡',
-    'salmon': '三文鱼',
-    'seal': '海豹',
-    'shelter': '庇护所',
-    'sparrow': '麻雀',
-    'spider': '蜘蛛',
-    'squirrel': '松鼠',
-    'stray': '流浪的',
-    'swan': '天鹅',
-    'tame': '驯养',
-    'tortoise': '陆龟',
-    'trunk': '象鼻',
-    'turkey': '火鸡',
-    'turtle': '海龟',
-    'tusk': '象牙',
-    'vet': '兽医',
-    'veterinarian': '兽医',
-    'vulture': '秃鹰',
-    'walrus': '海象',
-    'zebra': '斑马',
-    'zoo': '动物园',
-    # plants
-    'bamboo': '竹子',
-    'bark': '树皮',
-    'bloom': '开花',
-    'blossom': '花朵',
-    'botanical': '植物学的',
-    'bouquet': '花束',
-    'bud': '芽',
-    'bulb': '球茎',
-    'cabbage': '卷心菜',
-    'cactus': '仙人掌',
-    'cedar': '雪松',
-    'chestnut': '栗子',
-    'clover': '三叶草',
-    'coconut': '椰子',
-    'compost': '堆肥',
-    'daisy': '雏菊',
-    'elm': '榆树',
-    'fern': '蕨类',
-    'fertilizer': '肥料',
-    'fig': '无花果',
-    'flora': '植物群',
-    'fungus': '真菌',
-    'hay': '干草',
-    'herb': '草药',
-    'ivy': '常春藤',
-    'lavender': '薰衣草',
-    'lily': '百合花',
-    'maple': '枫树',
-    'melon': '瓜',
-    'moss': '苔藓',
-    'oak': '橡树',
-    'orchid': '兰花',
-    'palm': '棕榈树',
-    'petal': '花瓣',
-    'pine': '松树',
-    'plum': '李子',
-    'pollen': '花粉',
-    'prune': '修剪',
-    'pumpkin': '南瓜',
-    'rye': '黑麦',
-    'shrub': '灌木',
-    'sunflower': '向日葵',
-    'thorn': '刺',
-    'tobacco': '烟草',
-    'tulip': '郁金香',
-    'vine': '藤蔓',
-    'violet': '紫罗兰',
-    'weed': '杂草',
-    'willow': '柳树',
-    # festivals
-    'ancestor': '祖先',
-    'anniversary': '周年',
-    'assembly': '集会',
-    'balloon': '气球',
-    'banquet': '宴会',
-    'bless': '祝福',
-    'bride': '新娘',
-    'carnival': '嘉年华',
-    'confetti': '彩纸',
-    'countdown': '倒计时',
-    'crown': '皇冠',
-    'eve': '前夕',
-    'fairy': '仙女',
-    'feast': '盛宴',
-    'firework': '烟火',
-    'float': '花车',
-    'glow': '发光',
-    'halloween': '万圣节',
-    'lantern': '灯笼',
-    'luck': '运气',
-    'mask': '面具',
-    'memorial': '纪念的',
-    'miracle': '奇迹',
-    'myth': '神话',
-    'offering': '供品',
-    'parade': '游行',
-    'prayer': '祈祷',
-    'procession': '游行队伍',
-    'reunion': '团聚',
-    'ribbon': '丝带',
-    'ritual': '仪式',
-    'saint': '圣人',
-    'thanksgiving': '感恩节',
-    'torch': '火炬',
-    'treat': '款待',
-    'tribute': '致敬',
-    'valentine': '情人节',
-    'wedding': '婚礼',
-    'worship': '崇拜',
-    'wrap': '包装',
-    # cooking
-    'baste': '浇汁',
-    'blender': '搅拌机',
-    'braise': '炖',
-    'broil': '炒',
-    'broth': '肉汤',
-    'chilli': '辣椒',
-    'cinnamon': '肉桂',
-    'counter': '操作台',
-    'cube': '切丁',
-    'defrost': '解冻',
-    'dice': '切粒',
-    'dressing': '调料',
-    'ginger': '姜',
-    'grate': '擦磨',
-    'gravy': '肉汁',
-    'grease': '油脂',
-    'grind': '研磨',
-    'jar': '罐子',
-    'knead': '揉面',
-    'ladle': '长柄勺',
-    'lid': '盖子',
-    'marinade': '腌汁',
-    'marinate': '腌制',
-    'mash': '捣碎',
-    'mince': '切碎',
-    'mustard': '芥末',
-    'paste': '糊状物',
-    'peel': '削皮',
-    'pinch': '一撒',
-    'poach': '水煮',
-    'portion': '一份',
-    'refrigerate': '冷藏',
-    'rinse': '冲洗',
-    'shallow': '浅的',
-    'simmer': '慢炖',
-    'soak': '浸泡',
-    'spatula': '铲刀',
-    'spray': '喷洒',
-    'sprinkle': '撒',
-    'squeeze': '挤压',
-    'steam': '蒸',
-    'stew': '炖菜',
-    'stock': '高汤',
-    'stove': '炉子',
-    'strain': '过滤',
-    'tablespoon': '汤匙',
-    'thaw': '解冻',
-    'thermometer': '温度计',
-    'toss': '拌',
-    'trim': '修剪',
-    'whip': '打发',
-    'whisk': '打蛋器',
-    # law
-    'abolish': '废除',
-    'acquit': '宣判无罪',
-    'allege': '指控',
-    'arbitrate': '仲裁',
-    'arrest': '逮捕',
-    'assault': '攻击',
-    'attorney': '律师',
-    'bail': '保释金',
-    'breach': '违反',
-    'bribe': '贿赂',
-    'clause': '条款',
-    'compensation': '赔偿',
-    'comply': '遵守',
-    'confess': '坦白',
-    'confiscate': '没收',
-    'convict': '定罪',
-    'copyright': '版权',
-    'custody': '监禁',
-    'deceive': '欺骗',
-    'defendant': '被告',
-    'detain': '拘留',
-    'dispute': '争议',
-    'entitle': '给予权利',
-    'exempt': '豁免',
-    'extradite': '引渡',
-    'felony': '重罪',
-    'forge': '伪造',
-    'guilty': '有罪的',
-    'hearing': '听证会',
-    'heir': '继承人',
-    'imprison': '监禁',
-    'indict': '起诉',
-    'injustice': '不公',
-    'innocent': '无罪的',
-    'intellectual': '知识产权',
-    'jail': '监狱',
-    'jury': '陪审团',
-    'juvenile': '少年的',
-    'kidnap': '绑架',
-    'lawsuit': '诉讼',
-    'lawyer': '律师',
-    'legitimate': '合法的',
-    'licence': '许可证',
-    'litigate': '诉讼',
-    'misconduct': '不当行为',
-    'murder': '谋杀',
-    'oath': '宣誓',
-    'pardon': '赦免',
-    'parole': '假释',
-    'plead': '辩护',
-    'precedent': '先例',
-    'prison': '监狱',
-    'prosecute': '起诉',
-    'repeal': '废除',
-    'rob': '抢劫',
-    'sentence': '判刑',
-    'settle': '和解',
-    'smuggle': '走私',
-    'statute': '法规',
-    'steal': '偷窃',
-    'sue': '起诉',
-    'suspect': '嫌疑人',
-    'testify': '作证',
-    'testimony': '证词',
-    'theft': '盗窃',
-    'tribunal': '法庭',
-    'verdict': '裁决',
-    'violate': '违反',
-    'warrant': '搜查令',
-    'witness': '证人',
-    # --- Additional missing translations ---
-    'arch': '拱; 弓步',
-    'dodge': '闪避',
-    'drill': '训练',
-    'racket': '球拍',
-    'sprint': '冲刺',
-    'applause': '掌声',
-    'performer': '表演者',
-    'ant': '蚂蚁',
-    'bull': '公牛',
-    'polar': '极地的',
-    'decay': '腐烂',
-    'fertile': '肥沃的',
-    'meadow': '草地',
-    'pear': '梨',
-    'rainforest': '雨林',
-    'vegetation': '植被',
-    'barbecue': '烧烤',
-    'calendar': '日历',
-    'dragon': '龙',
-    'picnic': '野餐',
-    'basin': '盆',
-    'bankrupt': '破产的',
-    'counsel': '律师; 忠告',
-    'decree': '法令',
-    'discriminate': '歧视',
-    'legislate': '立法',
-    'liability': '责任; 债务',
-}
+TRANSLATION_LAYERS = ('oxford', 'scene')
 
 # --- Scene categories ---
 SCENE_CATEGORIES = {
@@ -1185,27 +486,9 @@ SCENE_CATEGORIES = {
 }
 
 
-def load_csv_translations(csv_path):
-    """Load term -> translation mapping from oxford_5000_cleaned.csv"""
-    translations = {}
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            term = row['term'].strip().lower()
-            translation = row['translation'].strip()
-            # Keep the first occurrence (some words may appear multiple times with different CEFR)
-            if term not in translations:
-                translations[term] = translation
-    return translations
-
-
 def check_audio(word, audio_dir):
     """Check if audio file exists for a word, return filename or None."""
-    filename = f"{word}.wav"
-    filepath = os.path.join(audio_dir, filename)
-    if os.path.isfile(filepath):
-        return filename
-    return None
+    return audio_field(f"{word}.wav", audio_dir)
 
 
 def escape_js_string(s):
@@ -1213,7 +496,7 @@ def escape_js_string(s):
     return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
 
 
-def generate_wordbook_js(scene_id, scene_data, translations, audio_dir):
+def generate_wordbook_js(scene_id, scene_data, store, audio_dir):
     """Generate JS file content for a single scene wordbook."""
     words_js_lines = []
     missing_words = []
@@ -1223,12 +506,8 @@ def generate_wordbook_js(scene_id, scene_data, translations, audio_dir):
     for word in scene_data['words']:
         word_lower = word.strip().lower()
 
-        # Look up translation: first CSV, then EXTRA_TRANSLATIONS
-        meaning = translations.get(word_lower)
-        if meaning is None:
-            meaning = EXTRA_TRANSLATIONS.get(word_lower)
-        if meaning is None:
-            meaning = EXTRA_TRANSLATIONS.get(word)
+        # Look up translation: first CSV, then the scene fill-ins
+        meaning = store.lookup(word.strip(), TRANSLATION_LAYERS)
         if meaning is None:
             missing_words.append(word)
             meaning = word  # fallback: use the word itself
@@ -1279,10 +558,10 @@ def generate_wordbook_js(scene_id, scene_data, translations, audio_dir):
 
 
 def main():
-    # Load CSV translations
-    print(f"Loading CSV from: {CSV_PATH}")
-    translations = load_csv_translations(CSV_PATH)
-    print(f"Loaded {len(translations)} terms from CSV.")
+    # Open the translation store
+    store = TranslationStore()
+    print(f"Translation store: {store.path}")
+    print(f"Loaded {store.count('oxford')} terms from CSV, {store.count('scene')} scene translations.")
 
     # Ensure output directory exists
     os.makedirs(WORDBOOKS_DIR, exist_ok=True)
@@ -1297,7 +576,7 @@ def main():
 
     for scene_id, scene_data in SCENE_CATEGORIES.items():
         js_content, missing_words, audio_found, audio_missing = generate_wordbook_js(
-            scene_id, scene_data, translations, AUDIO_DIR
+            scene_id, scene_data, store, AUDIO_DIR
         )
 
         output_path = os.path.join(WORDBOOKS_DIR, f'scene_{scene_id}.js')
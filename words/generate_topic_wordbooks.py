@@ -6,17 +6,21 @@ Topics: tech, social_media, gaming, finance, marketing, film, medical, science,
         space, art, politics, math, environment, psychology, sports, architecture, ai
 
 Architecture (same as generate_scene_wordbooks.py):
-1. Read oxford_5000_cleaned.csv to reuse translations
+1. Open the shared translation store (translation_store.py)
 2. Check if audio file exists in tts_delivery/audio/{word}.wav
+   (through audio_store.py: dedupe aliases and compressed export names)
 3. Use hardcoded TOPIC_CATEGORIES word lists
-4. For words in Oxford CSV -> reuse translation; otherwise -> use EXTRA_TRANSLATIONS
+4. For words in Oxford CSV -> reuse translation; otherwise -> the store's 'topic' layer
+   (translation_fallbacks.csv)
 5. Output: wordbooks/topic_{name}.js with registerWordbook() call
 """
 
-import csv
 import os
 import sys
 
+from audio_store import audio_field
+from translation_store import TranslationStore
+
 # Fix Windows console encoding
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -24,9 +28,9 @@ if sys.stdout.encoding != 'utf-8':
 # === Paths ===
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
-OXFORD_CSV = os.path.join(SCRIPT_DIR, 'oxford_5000_cleaned.csv')
 AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
 OUTPUT_DIR = os.path.join(PROJECT_DIR, 'wordbooks')
+TRANSLATION_LAYERS = ('oxford', 'topic')
 
 # =============================================================
 # Topic Categories - word lists
@@ -662,1258 +666,6 @@ TOPIC_CATEGORIES = {
     },
 }
 
-# =============================================================
-# Extra translations for words NOT in Oxford 5000
-# =============================================================
-EXTRA_TRANSLATIONS = {
-    # Tech
-    'algorithm': '\u7b97\u6cd5',
-    'automate': '\u81ea\u52a8\u5316',
-    'bandwidth': '\u5e26\u5bbd',
-    'binary': '\u4e8c\u8fdb\u5236',
-    'bluetooth': '\u84dd\u7259',
-    'browser': '\u6d4f\u89c8\u5668',
-    'bug': '\u6f0f\u6d1e',
-    'cellular': '\u8702\u7a9d\u7f51\u7edc',
-    'circuit': '\u7535\u8def',
-    'click': '\u70b9\u51fb',
-    'cloud': '\u4e91',
-    'code': '\u4ee3\u7801',
-    'compatible': '\u517c\u5bb9\u7684',
-    'cookie': '\u5c0f\u578b\u6587\u672c\u6587\u4ef6',
-    'cursor': '\u5149\u6807',
-    'cyber': '\u7f51\u7edc\u7684',
-    'database': '\u6570\u636e\u5e93',
-    'debug': '\u8c03\u8bd5',
-    'decode': '\u89e3\u7801',
-    'desktop': '\u684c\u9762',
-    'download': '\u4e0b\u8f7d',
-    'drone': '\u65e0\u4eba\u673a',
-    'email': '\u7535\u5b50\u90ae\u4ef6',
-    'embed': '\u5d4c\u5165',
-    'encode': '\u7f16\u7801',
-    'encrypt': '\u52a0\u5bc6',
-    'ethernet': '\u4ee5\u592a\u7f51',
-    'file': '\u6587\u4ef6',
-    'firewall': '\u9632\u706b\u5899',
-    'firmware': '\u56fa\u4ef6',
-    'framework': '\u6846\u67b6',
-    'gigabyte': '\u5409\u5b57\u8282',
-    'hack': '\u9ed1\u5ba2\u653b\u51fb',
-    'hardware': '\u786c\u4ef6',
-    'homepage': '\u4e3b\u9875',
-    'icon': '\u56fe\u6807',
-    'keyboard': '\u952e\u76d8',
-    'laptop': '\u7b14\u8bb0\u672c\u7535\u8111',
-    'login': '\u767b\u5f55',
-    'malware': '\u6076\u610f\u8f6f\u4ef6',
-    'microchip': '\u5fae\u82af\u7247',
-    'modem': '\u8c03\u5236\u89e3\u8c03\u5668',
-    'mouse': '\u9f20\u6807',
-    'network': '\u7f51\u7edc',
-    'node': '\u8282\u70b9',
-    'offline': '\u79bb\u7ebf',
-    'online': '\u5728\u7ebf',
-    'optimize': '\u4f18\u5316',
-    'password': '\u5bc6\u7801',
-    'patch': '\u8865\u4e01',
-    'pixel': '\u50cf\u7d20',
-    'plugin': '\u63d2\u4ef6',
-    'portal': '\u95e8\u6237\u7f51\u7ad9',
-    'processor': '\u5904\u7406\u5668',
-    'protocol': '\u534f\u8bae',
-    'proxy': '\u4ee3\u7406',
-    'query': '\u67e5\u8be2',
-    'reboot': '\u91cd\u542f',
-    'render': '\u6e32\u67d3',
-    'router': '\u8def\u7531\u5668',
-    'scan': '\u626b\u63cf',
-    'screen': '\u5c4f\u5e55',
-    'script': '\u811a\u672c',
-    'scroll': '\u6eda\u52a8',
-    'sensor': '\u4f20\u611f\u5668',
-    'server': '\u670d\u52a1\u5668',
-    'simulate': '\u6a21\u62df',
-    'smartphone': '\u667a\u80fd\u624b\u673a',
-    'software': '\u8f6f\u4ef6',
-    'spam': '\u5783\u573e\u90ae\u4ef6',
-    'stream': '\u6d41\u5a92\u4f53',
-    'surf': '\u4e0a\u7f51\u6d4f\u89c8',
-    'sync': '\u540c\u6b65',
-    'tablet': '\u5e73\u677f\u7535\u8111',
-    'tech': '\u79d1\u6280',
-    'template': '\u6a21\u677f',
-    'terminal': '\u7ec8\u7aef',
-    'token': '\u4ee4\u724c',
-    'toolbar': '\u5de5\u5177\u680f',
-    'trace': '\u8ffd\u8e2a',
-    'upload': '\u4e0a\u4f20',
-    'username': '\u7528\u6237\u540d',
-    'virtual': '\u865a\u62df\u7684',
-    'virus': '\u75c5\u6bd2',
-    'web': '\u7f51\u9875',
-    'widget': '\u5c0f\u7ec4\u4ef6',
-    'wifi': '\u65e0\u7ebf\u7f51\u7edc',
-    'wireless': '\u65e0\u7ebf\u7684',
-    'zip': '\u538b\u7f29',
-
-    # Social Media
-    'avatar': '\u5934\u50cf',
-    'blog': '\u535a\u5ba2',
-    'bookmark': '\u4e66\u7b7e',
-    'bot': '\u673a\u5668\u4eba',
-    'caption': '\u5b57\u5e55',
-    'censor': '\u5ba1\u67e5',
-    'chat': '\u804a\u5929',
-    'creator': '\u521b\u4f5c\u8005',
-    'curate': '\u7b56\u5c55',
-    'dashboard': '\u4eea\u8868\u76d8',
-    'dislike': '\u4e0d\u559c\u6b22',
-    'emoji': '\u8868\u60c5\u7b26\u53f7',
-    'feed': '\u4fe1\u606f\u6d41',
-    'follower': '\u7c89\u4e1d',
-    'forum': '\u8bba\u575b',
-    'handle': '\u7528\u6237\u540d',
-    'hashtag': '\u8bdd\u9898\u6807\u7b7e',
-    'inbox': '\u6536\u4ef6\u7bb1',
-    'influencer': '\u7f51\u7ea2',
-    'meme': '\u7f51\u7edc\u6d41\u884c\u56fe',
-    'moderate': '\u5ba1\u6838',
-    'notify': '\u901a\u77e5',
-    'outreach': '\u5916\u5c55',
-    'pin': '\u7f6e\u9876',
-    'podcast': '\u64ad\u5ba2',
-    'poll': '\u6295\u7968',
-    'post': '\u53d1\u5e03',
-    'profile': '\u4e2a\u4eba\u8d44\u6599',
-    'react': '\u56de\u5e94',
-    'repost': '\u8f6c\u53d1',
-    'share': '\u5206\u4eab',
-    'status': '\u52a8\u6001',
-    'subscribe': '\u8ba2\u9605',
-    'tag': '\u6807\u7b7e',
-    'thread': '\u8bdd\u9898\u4e32',
-    'timeline': '\u65f6\u95f4\u7ebf',
-    'troll': '\u7f51\u7edc\u5587\u53ed',
-    'trending': '\u70ed\u95e8\u7684',
-    'unfollow': '\u53d6\u6d88\u5173\u6ce8',
-    'user': '\u7528\u6237',
-    'viral': '\u75c5\u6bd2\u5f0f\u4f20\u64ad\u7684',
-    'vlog': '\u89c6\u9891\u535a\u5ba2',
-
-    # Gaming
-    'arcade': '\u8857\u673a',
-    'arena': '\u7ade\u6280\u573a',
-    'armour': '\u76d4\u7532',
-    'badge': '\u5fbd\u7ae0',
-    'boss': 'Boss\u602a',
-    'buff': '\u589e\u76ca',
-    'checkpoint': '\u5b58\u6863\u70b9',
-    'clan': '\u6218\u961f',
-    'clash': '\u51b2\u7a81',
-    'combo': '\u8fde\u62db',
-    'competitive': '\u7ade\u6280\u7684',
-    'console': '\u6e38\u620f\u673a',
-    'controller': '\u624b\u67c4',
-    'craft': '\u5236\u4f5c',
-    'deck': '\u724c\u7ec4',
-    'demo': '\u8bd5\u73a9\u7248',
-    'deploy': '\u90e8\u7f72',
-    'dodge': '\u95ea\u907f',
-    'dungeon': '\u5730\u7262',
-    'elite': '\u7cbe\u82f1',
-    'emote': '\u8868\u60c5\u52a8\u4f5c',
-    'equip': '\u88c5\u5907',
-    'forge': '\u953b\u9020',
-    'frame': '\u5e27',
-    'fury': '\u72c2\u6012',
-    'gear': '\u88c5\u5907',
-    'glitch': '\u6f0f\u6d1e',
-    'grind': '\u5237\u7b49\u7ea7',
-    'guild': '\u516c\u4f1a',
-    'inventory': '\u80cc\u5305',
-    'item': '\u7269\u54c1',
-    'kingdom': '\u738b\u56fd',
-    'league': '\u8054\u8d5b',
-    'lobby': '\u5927\u5385',
-    'loot': '\u6218\u5229\u54c1',
-    'mount': '\u5750\u9a91',
-    'multiplayer': '\u591a\u4eba\u6e38\u620f',
-    'nerf': '\u524a\u5f31',
-    'opponent': '\u5bf9\u624b',
-    'quest': '\u4efb\u52a1',
-    'rage': '\u72c2\u6012',
-    'raid': '\u526f\u672c',
-    'realm': '\u9886\u57df',
-    'replay': '\u56de\u653e',
-    'respawn': '\u590d\u6d3b',
-    'rival': '\u5bf9\u624b',
-    'siege': '\u56f4\u653b',
-    'snipe': '\u72d9\u51fb',
-    'solo': '\u5355\u4eba',
-    'spawn': '\u751f\u6210',
-    'spell': '\u6cd5\u672f',
-    'sprint': '\u51b2\u523a',
-    'stamina': '\u8010\u529b',
-    'summon': '\u53ec\u5524',
-    'sword': '\u5251',
-    'tower': '\u5854',
-    'trap': '\u9677\u9631',
-    'treasure': '\u5b9d\u85cf',
-    'tutorial': '\u65b0\u624b\u6559\u7a0b',
-    'ultimate': '\u7ec8\u6781\u6280\u80fd',
-    'unlock': '\u89e3\u9501',
-    'upgrade': '\u5347\u7ea7',
-    'versus': '\u5bf9\u6218',
-    'warrior': '\u6218\u58eb',
-    'wizard': '\u5deb\u5e08',
-    'zone': '\u533a\u57df',
-
-    # Finance
-    'accountant': '\u4f1a\u8ba1',
-    'audit': '\u5ba1\u8ba1',
-    'bankrupt': '\u7834\u4ea7',
-    'bargain': '\u4ea4\u6613',
-    'bear': '\u718a\u5e02',
-    'bid': '\u51fa\u4ef7',
-    'bond': '\u503a\u5238',
-    'broker': '\u7ecf\u7eaa\u4eba',
-    'bull': '\u725b\u5e02',
-    'capital': '\u8d44\u672c',
-    'cash': '\u73b0\u91d1',
-    'client': '\u5ba2\u6237',
-    'coin': '\u786c\u5e01',
-    'commerce': '\u5546\u4e1a',
-    'commodity': '\u5546\u54c1',
-    'corporate': '\u516c\u53f8\u7684',
-    'coupon': '\u4f18\u60e0\u5238',
-    'credit': '\u4fe1\u7528',
-    'currency': '\u8d27\u5e01',
-    'customer': '\u5ba2\u6237',
-    'debt': '\u503a\u52a1',
-    'deficit': '\u8d64\u5b57',
-    'deposit': '\u5b58\u6b3e',
-    'depreciate': '\u8d2c\u503c',
-    'dividend': '\u80a1\u606f',
-    'earnings': '\u6536\u5165',
-    'enterprise': '\u4f01\u4e1a',
-    'equity': '\u80a1\u6743',
-    'fee': '\u8d39\u7528',
-    'fiscal': '\u8d22\u653f\u7684',
-    'forecast': '\u9884\u6d4b',
-    'fortune': '\u8d22\u5bcc',
-    'franchise': '\u7279\u8bb8\u7ecf\u8425',
-    'fraud': '\u6b3a\u8bc8',
-    'hedge': '\u5bf9\u51b2',
-    'inflation': '\u901a\u8d27\u81a8\u80c0',
-    'insure': '\u4fdd\u9669',
-    'invoice': '\u53d1\u7968',
-    'lease': '\u79df\u8d41',
-    'lend': '\u501f\u51fa',
-    'leverage': '\u6760\u6746',
-    'liability': '\u8d1f\u503a',
-    'liquid': '\u6d41\u52a8\u6027',
-    'loan': '\u8d37\u6b3e',
-    'margin': '\u5229\u6da6',
-    'merge': '\u5408\u5e76',
-    'monopoly': '\u5784\u65ad',
-    'mortgage': '\u62b5\u62bc\u8d37\u6b3e',
-    'mutual': '\u5171\u540c\u7684',
-    'negotiate': '\u8c08\u5224',
-    'offset': '\u62b5\u6d88',
-    'overhead': '\u7ba1\u7406\u8d39\u7528',
-    'patent': '\u4e13\u5229',
-    'pension': '\u517b\u8001\u91d1',
-    'portfolio': '\u6295\u8d44\u7ec4\u5408',
-    'premium': '\u4fdd\u8d39',
-    'principal': '\u672c\u91d1',
-    'quota': '\u914d\u989d',
-    'receipt': '\u6536\u636e',
-    'recession': '\u8870\u9000',
-    'refund': '\u9000\u6b3e',
-    'regulate': '\u76d1\u7ba1',
-    'retail': '\u96f6\u552e',
-    'revenue': '\u6536\u5165',
-    'salary': '\u85aa\u6c34',
-    'share': '\u80a1\u4efd',
-    'shortage': '\u77ed\u7f3a',
-    'speculate': '\u6295\u673a',
-    'stake': '\u80a1\u4efd',
-    'stock': '\u80a1\u7968',
-    'subsidy': '\u8865\u8d34',
-    'surplus': '\u76c8\u4f59',
-    'tariff': '\u5173\u7a0e',
-    'tender': '\u62db\u6807',
-    'transaction': '\u4ea4\u6613',
-    'treasury': '\u8d22\u653f\u90e8',
-    'turnover': '\u8425\u4e1a\u989d',
-    'utility': '\u516c\u7528\u4e8b\u4e1a',
-    'venture': '\u98ce\u9669\u6295\u8d44',
-    'wage': '\u5de5\u8d44',
-    'wealth': '\u8d22\u5bcc',
-    'wholesale': '\u6279\u53d1',
-    'withdraw': '\u53d6\u6b3e',
-    'yield': '\u6536\u76ca',
-
-    # Marketing
-    'affiliate': '\u8054\u76df',
-    'awareness': '\u77e5\u540d\u5ea6',
-    'benchmark': '\u57fa\u51c6',
-    'billboard': '\u5e7f\u544a\u724c',
-    'boost': '\u63a8\u52a8',
-    'brand': '\u54c1\u724c',
-    'brochure': '\u624b\u518c',
-    'bundle': '\u6346\u7ed1\u9500\u552e',
-    'buyer': '\u4e70\u5bb6',
-    'catalogue': '\u76ee\u5f55',
-    'conversion': '\u8f6c\u5316',
-    'deadline': '\u622a\u6b62\u65e5\u671f',
-    'demographic': '\u4eba\u53e3\u7edf\u8ba1\u7684',
-    'endorse': '\u4ee3\u8a00',
-    'feedback': '\u53cd\u9988',
-    'frequency': '\u9891\u7387',
-    'headline': '\u6807\u9898',
-    'incentive': '\u6fc0\u52b1',
-    'innovation': '\u521b\u65b0',
-    'insight': '\u6d1e\u5bdf',
-    'layout': '\u5e03\u5c40',
-    'lead': '\u6f5c\u5728\u5ba2\u6237',
-    'logo': '\u6807\u5fd7',
-    'loyalty': '\u5fe0\u8bda\u5ea6',
-    'merchandise': '\u5546\u54c1',
-    'metric': '\u6307\u6807',
-    'motto': '\u5e7f\u544a\u8bed',
-    'niche': '\u5c0f\u4f17\u5e02\u573a',
-    'organic': '\u81ea\u7136\u589e\u957f\u7684',
-    'perception': '\u611f\u77e5',
-    'persuade': '\u8bf4\u670d',
-    'pitch': '\u63a8\u9500',
-    'prospect': '\u6f5c\u5728\u5ba2\u6237',
-    'referral': '\u63a8\u8350',
-    'reputation': '\u58f0\u8a89',
-    'sample': '\u6837\u54c1',
-    'segment': '\u7ec6\u5206\u5e02\u573a',
-    'slogan': '\u6807\u8bed',
-    'sponsor': '\u8d5e\u52a9\u5546',
-    'survey': '\u8c03\u67e5',
-    'target': '\u76ee\u6807\u5ba2\u6237',
-    'testimonial': '\u63a8\u8350\u4fe1',
-    'track': '\u8ffd\u8e2a',
-    'traffic': '\u6d41\u91cf',
-    'trend': '\u8d8b\u52bf',
-    'visual': '\u89c6\u89c9\u7684',
-
-    # Film
-    'audition': '\u8bd5\u955c',
-    'blockbuster': '\u5927\u7247',
-    'caption': '\u5b57\u5e55',
-    'cast': '\u6f14\u5458\u9635\u5bb9',
-    'cinema': '\u7535\u5f71\u9662',
-    'clip': '\u7247\u6bb5',
-    'comedy': '\u559c\u5267',
-    'costume': '\u670d\u88c5',
-    'dialogue': '\u5bf9\u767d',
-    'documentary': '\u7eaa\u5f55\u7247',
-    'dub': '\u914d\u97f3',
-    'ending': '\u7ed3\u5c40',
-    'entertain': '\u5a31\u4e50',
-    'epic': '\u53f2\u8bd7\u5927\u7247',
-    'episode': '\u96c6',
-    'extra': '\u7fa4\u4f17\u6f14\u5458',
-    'fade': '\u6de1\u5165\u6de1\u51fa',
-    'fantasy': '\u5947\u5e7b',
-    'fiction': '\u865a\u6784',
-    'footage': '\u7d20\u6750',
-    'genre': '\u7c7b\u578b',
-    'horror': '\u6050\u6016',
-    'lens': '\u955c\u5934',
-    'makeup': '\u5316\u5986',
-    'motion': '\u52a8\u4f5c',
-    'mystery': '\u60ac\u7591',
-    'narrative': '\u53d9\u4e8b',
-    'nominate': '\u63d0\u540d',
-    'Oscar': '\u5965\u65af\u5361',
-    'pilot': '\u8bd5\u64ad\u96c6',
-    'plot': '\u5267\u60c5',
-    'premiere': '\u9996\u6620',
-    'preview': '\u9884\u544a',
-    'producer': '\u5236\u7247\u4eba',
-    'remake': '\u7ffb\u62cd',
-    'romance': '\u7231\u60c5\u7247',
-    'scene': '\u573a\u666f',
-    'screenplay': '\u5267\u672c',
-    'sequel': '\u7eed\u96c6',
-    'series': '\u7cfb\u5217',
-    'shot': '\u955c\u5934',
-    'silent': '\u65e0\u58f0\u7684',
-    'soundtrack': '\u539f\u58f0\u5e26',
-    'subtitle': '\u5b57\u5e55',
-    'thriller': '\u60ca\u609a\u7247',
-    'trailer': '\u9884\u544a\u7247',
-    'twist': '\u53cd\u8f6c',
-    'villain': '\u53cd\u6d3e',
-
-    # Medical
-    'ache': '\u75bc\u75db',
-    'acute': '\u6025\u6027\u7684',
-    'addict': '\u4e0a\u763e\u8005',
-    'adverse': '\u4e0d\u826f\u7684',
-    'aging': '\u8001\u5316',
-    'allergy': '\u8fc7\u654f',
-    'ambulance': '\u6551\u62a4\u8f66',
-    'anatomy': '\u89e3\u5256\u5b66',
-    'antibiotic': '\u6297\u751f\u7d20',
-    'artery': '\u52a8\u8109',
-    'bandage': '\u7ef7\u5e26',
-    'bruise': '\u7624\u4f24',
-    'calcium': '\u9499',
-    'cancer': '\u764c\u75c7',
-    'capsule': '\u80f6\u56ca',
-    'cardiac': '\u5fc3\u810f\u7684',
-    'checkup': '\u4f53\u68c0',
-    'chronic': '\u6162\u6027\u7684',
-    'clinic': '\u8bca\u6240',
-    'clinical': '\u4e34\u5e8a\u7684',
-    'coma': '\u660f\u8ff7',
-    'contagious': '\u4f20\u67d3\u6027\u7684',
-    'deaf': '\u804b\u7684',
-    'deficiency': '\u7f3a\u4e4f',
-    'diagnose': '\u8bca\u65ad',
-    'disability': '\u6b8b\u75be',
-    'discharge': '\u51fa\u9662',
-    'disease': '\u75be\u75c5',
-    'dizzy': '\u5934\u6655',
-    'dose': '\u5242\u91cf',
-    'epidemic': '\u6d41\u884c\u75c5',
-    'fatal': '\u81f4\u547d\u7684',
-    'fatigue': '\u75b2\u52b3',
-    'fever': '\u53d1\u70e7',
-    'flu': '\u6d41\u611f',
-    'fracture': '\u9aa8\u6298',
-    'gene': '\u57fa\u56e0',
-    'genetic': '\u9057\u4f20\u7684',
-    'germ': '\u7ec6\u83cc',
-    'hormone': '\u6fc0\u7d20',
-    'hygiene': '\u536b\u751f',
-    'immune': '\u514d\u75ab\u7684',
-    'implant': '\u690d\u5165',
-    'infant': '\u5a74\u513f',
-    'infect': '\u611f\u67d3',
-    'inflammation': '\u708e\u75c7',
-    'inject': '\u6ce8\u5c04',
-    'injection': '\u6ce8\u5c04',
-    'intensive': '\u91cd\u75c7\u7684',
-    'kidney': '\u80be\u810f',
-    'laboratory': '\u5b9e\u9a8c\u5ba4',
-    'limb': '\u80a2\u4f53',
-    'liver': '\u809d\u810f',
-    'lung': '\u80ba',
-    'metabolism': '\u65b0\u9648\u4ee3\u8c22',
-    'microscope': '\u663e\u5fae\u955c',
-    'nerve': '\u795e\u7ecf',
-    'nutrition': '\u8425\u517b',
-    'obesity': '\u80a5\u80d6\u75c7',
-    'organ': '\u5668\u5b98',
-    'oxygen': '\u6c27\u6c14',
-    'paralyse': '\u9ebb\u75f9',
-    'pharmacy': '\u836f\u623f',
-    'physician': '\u533b\u5e08',
-    'pill': '\u836f\u7247',
-    'poison': '\u6bd2\u836f',
-    'pregnant': '\u6000\u5b55\u7684',
-    'prescribe': '\u5f00\u5904\u65b9',
-    'prescription': '\u5904\u65b9',
-    'psychiatry': '\u7cbe\u795e\u75c5\u5b66',
-    'pulse': '\u8109\u640f',
-    'remedy': '\u6cbb\u7597\u65b9\u6cd5',
-    'specialist': '\u4e13\u79d1\u533b\u751f',
-    'spine': '\u810a\u67f1',
-    'sterile': '\u65e0\u83cc\u7684',
-    'stroke': '\u4e2d\u98ce',
-    'surgeon': '\u5916\u79d1\u533b\u751f',
-    'swallow': '\u541e\u54bd',
-    'symptom': '\u75c7\u72b6',
-    'syndrome': '\u7efc\u5408\u75c7',
-    'therapy': '\u6cbb\u7597',
-    'tissue': '\u7ec4\u7ec7',
-    'toxic': '\u6709\u6bd2\u7684',
-    'transplant': '\u79fb\u690d',
-    'tumour': '\u80bf\u7624',
-    'vaccine': '\u75ab\u82d7',
-    'vein': '\u9759\u8109',
-    'vitamin': '\u7ef4\u751f\u7d20',
-    'ward': '\u75c5\u623f',
-    'wound': '\u4f24\u53e3',
-    'x-ray': 'X\u5c04\u7ebf',
-
-    # Science
-    'atom': '\u539f\u5b50',
-    'beam': '\u5149\u675f',
-    'biology': '\u751f\u7269\u5b66',
-    'catalyst': '\u50ac\u5316\u5242',
-    'chamber': '\u5b9e\u9a8c\u5ba4',
-    'chemistry': '\u5316\u5b66',
-    'clone': '\u514b\u9686',
-    'coal': '\u7164\u70ad',
-    'compound': '\u5316\u5408\u7269',
-    'contaminate': '\u6c61\u67d3',
-    'correlate': '\u76f8\u5173',
-    'crystal': '\u6676\u4f53',
-    'cycle': '\u5faa\u73af',
-    'decay': '\u8870\u53d8',
-    'density': '\u5bc6\u5ea6',
-    'diagram': '\u56fe\u8868',
-    'DNA': '\u8131\u6c27\u6838\u7cd6\u6838\u9178',
-    'element': '\u5143\u7d20',
-    'emit': '\u53d1\u5c04',
-    'empirical': '\u7ecf\u9a8c\u7684',
-    'enzyme': '\u9176',
-    'equation': '\u7b49\u5f0f',
-    'equilibrium': '\u5e73\u8861',
-    'evolve': '\u8fdb\u5316',
-    'experiment': '\u5b9e\u9a8c',
-    'explode': '\u7206\u70b8',
-    'fluid': '\u6d41\u4f53',
-    'formula': '\u516c\u5f0f',
-    'fossil': '\u5316\u77f3',
-    'fraction': '\u5206\u6570',
-    'friction': '\u6469\u64e6',
-    'fuel': '\u71c3\u6599',
-    'fundamental': '\u57fa\u672c\u7684',
-    'fusion': '\u878d\u5408',
-    'gas': '\u6c14\u4f53',
-    'geology': '\u5730\u8d28\u5b66',
-    'gravity': '\u91cd\u529b',
-    'habitat': '\u6816\u606f\u5730',
-    'humidity': '\u6e7f\u5ea6',
-    'hydrogen': '\u6c22',
-    'hypothesis': '\u5047\u8bbe',
-    'infrared': '\u7ea2\u5916\u7ebf',
-    'ingredient': '\u6210\u5206',
-    'inspect': '\u68c0\u67e5',
-    'instrument': '\u4eea\u5668',
-    'insulate': '\u7edd\u7f18',
-    'interval': '\u95f4\u9694',
-    'journal': '\u671f\u520a',
-    'laser': '\u6fc0\u5149',
-    'layer': '\u5c42',
-    'liquid': '\u6db2\u4f53',
-    'magnet': '\u78c1\u94c1',
-    'magnitude': '\u91cf\u7ea7',
-    'mass': '\u8d28\u91cf',
-    'mechanism': '\u673a\u5236',
-    'mineral': '\u77ff\u7269',
-    'mixture': '\u6df7\u5408\u7269',
-    'molecule': '\u5206\u5b50',
-    'momentum': '\u52a8\u91cf',
-    'neutral': '\u4e2d\u6027\u7684',
-    'neutron': '\u4e2d\u5b50',
-    'nitrogen': '\u6c2e',
-    'nuclear': '\u6838\u7684',
-    'nucleus': '\u539f\u5b50\u6838',
-    'orbit': '\u8f68\u9053',
-    'organism': '\u6709\u673a\u4f53',
-    'oxide': '\u6c27\u5316\u7269',
-    'particle': '\u7c92\u5b50',
-    'phase': '\u9636\u6bb5',
-    'phenomenon': '\u73b0\u8c61',
-    'physics': '\u7269\u7406\u5b66',
-    'plasma': '\u7b49\u79bb\u5b50\u4f53',
-    'polar': '\u6781\u6027\u7684',
-    'principle': '\u539f\u7406',
-    'probe': '\u63a2\u9488',
-    'protein': '\u86cb\u767d\u8d28',
-    'proton': '\u8d28\u5b50',
-    'quantum': '\u91cf\u5b50',
-    'radiation': '\u8f90\u5c04',
-    'reaction': '\u53cd\u5e94',
-    'reagent': '\u8bd5\u5242',
-    'satellite': '\u536b\u661f',
-    'sequence': '\u5e8f\u5217',
-    'solar': '\u592a\u9633\u7684',
-    'solution': '\u6eb6\u6db2',
-    'species': '\u7269\u79cd',
-    'specimen': '\u6807\u672c',
-    'spectrum': '\u5149\u8c31',
-    'stable': '\u7a33\u5b9a\u7684',
-    'static': '\u9759\u6001\u7684',
-    'stem': '\u5e72\u7ec6\u80de',
-    'substance': '\u7269\u8d28',
-    'synthesis': '\u5408\u6210',
-    'temperature': '\u6e29\u5ea6',
-    'theorem': '\u5b9a\u7406',
-    'thermal': '\u70ed\u7684',
-    'trial': '\u5b9e\u9a8c',
-    'universe': '\u5b87\u5b99',
-    'vacuum': '\u771f\u7a7a',
-    'valid': '\u6709\u6548\u7684',
-    'variable': '\u53d8\u91cf',
-    'velocity': '\u901f\u5ea6',
-    'volume': '\u4f53\u79ef',
-    'wave': '\u6ce2',
-    'wavelength': '\u6ce2\u957f',
-    # Additional missing
-    'module': '\u6a21\u5757',
-    'navigate': '\u5bfc\u822a',
-    'beta': '\u6d4b\u8bd5\u7248',
-    'dragon': '\u9f99',
-    'shield': '\u76fe\u724c',
-    'decline': '\u4e0b\u964d',
-    'animate': '\u5236\u4f5c\u52a8\u753b',
-    'applause': '\u638c\u58f0',
-    'performer': '\u8868\u6f14\u8005',
-    'depress': '\u4f7f\u6c2e\u4e27',
-    'exhaust': '\u8017\u5c3d',
-    'approximate': '\u8fd1\u4f3c\u7684',
-
-    # Missing from multiple topics
-    'altitude': '\u6d77\u62d4',
-    'antenna': '\u5929\u7ebf',
-    'axis': '\u8f74',
-    'clay': '\u9ecf\u571f',
-    'bore': '\u4f7f\u65e0\u804a',
-    'converse': '\u5bf9\u8bdd',
-
-    # Space
-    'asteroid': '\u5c0f\u884c\u661f',
-    'astronaut': '\u5b87\u822a\u5458',
-    'astronomer': '\u5929\u6587\u5b66\u5bb6',
-    'astronomy': '\u5929\u6587\u5b66',
-    'beacon': '\u4fe1\u6807',
-    'blast': '\u7206\u70b8',
-    'booster': '\u52a9\u63a8\u5668',
-    'celestial': '\u5929\u4f53\u7684',
-    'comet': '\u5f57\u661f',
-    'commander': '\u6307\u6325\u5b98',
-    'constellation': '\u661f\u5ea7',
-    'cosmic': '\u5b87\u5b99\u7684',
-    'cosmos': '\u5b87\u5b99',
-    'crater': '\u964d\u77f3\u5751',
-    'debris': '\u788e\u7247',
-    'descent': '\u4e0b\u964d',
-    'dock': '\u5bf9\u63a5',
-    'drift': '\u6f02\u79fb',
-    'dwarf': '\u77ee\u661f',
-    'eclipse': '\u65e5\u98df/\u6708\u98df',
-    'emission': '\u6392\u653e',
-    'equator': '\u8d64\u9053',
-    'exploration': '\u63a2\u7d22',
-    'explorer': '\u63a2\u7d22\u8005',
-    'explosion': '\u7206\u70b8',
-    'galaxy': '\u94f6\u6cb3\u7cfb',
-    'interstellar': '\u661f\u9645\u7684',
-    'ion': '\u79bb\u5b50',
-    'lunar': '\u6708\u7403\u7684',
-    'manoeuvre': '\u64cd\u7eb5',
-    'Mars': '\u706b\u661f',
-    'Mercury': '\u6c34\u661f',
-    'meteor': '\u6d41\u661f',
-    'meteorite': '\u964d\u77f3',
-    'moon': '\u6708\u7403',
-    'nebula': '\u661f\u4e91',
-    'Neptune': '\u6d77\u738b\u661f',
-    'payload': '\u6709\u6548\u8f7d\u8377',
-    'planet': '\u884c\u661f',
-    'propel': '\u63a8\u8fdb',
-    'radar': '\u96f7\u8fbe',
-    'radio': '\u65e0\u7ebf\u7535',
-    'reentry': '\u91cd\u8fd4\u5927\u6c14\u5c42',
-    'revolve': '\u65cb\u8f6c',
-    'rocket': '\u706b\u7bad',
-    'rover': '\u6f2b\u6e38\u8f66',
-    'Saturn': '\u571f\u661f',
-    'shuttle': '\u822a\u5929\u98de\u673a',
-    'spacecraft': '\u822a\u5929\u5668',
-    'sphere': '\u7403\u4f53',
-    'star': '\u6052\u661f',
-    'station': '\u7a7a\u95f4\u7ad9',
-    'stellar': '\u6052\u661f\u7684',
-    'sun': '\u592a\u9633',
-    'telescope': '\u671b\u8fdc\u955c',
-    'thrust': '\u63a8\u529b',
-    'trajectory': '\u8f68\u8ff9',
-    'Venus': '\u91d1\u661f',
-    'void': '\u865a\u7a7a',
-    'weightless': '\u5931\u91cd\u7684',
-    'zero': '\u96f6',
-
-    # Art
-    'acrylic': '\u4e19\u70ef\u989c\u6599',
-    'aesthetic': '\u7f8e\u5b66\u7684',
-    'artistic': '\u827a\u672f\u7684',
-    'canvas': '\u753b\u5e03',
-    'carve': '\u96d5\u523b',
-    'ceramic': '\u9676\u74f7',
-    'charcoal': '\u6728\u70ad',
-    'collage': '\u62fc\u8d34\u753b',
-    'composition': '\u6784\u56fe',
-    'decorate': '\u88c5\u9970',
-    'dye': '\u67d3\u6599',
-    'engrave': '\u96d5\u523b',
-    'exhibition': '\u5c55\u89c8',
-    'font': '\u5b57\u4f53',
-    'fresco': '\u58c1\u753b',
-    'gallery': '\u753b\u5eca',
-    'glaze': '\u4e0a\u91c9',
-    'gradient': '\u6e10\u53d8',
-    'harmony': '\u548c\u8c10',
-    'heritage': '\u9057\u4ea7',
-    'hue': '\u8272\u8c03',
-    'imagination': '\u60f3\u8c61\u529b',
-    'ink': '\u58a8\u6c34',
-    'landscape': '\u98ce\u666f\u753b',
-    'marble': '\u5927\u7406\u77f3',
-    'masterpiece': '\u6770\u4f5c',
-    'medium': '\u5a92\u4ecb',
-    'miniature': '\u5fae\u7f29\u6a21\u578b',
-    'mosaic': '\u9a6c\u8d5b\u514b',
-    'mould': '\u5851\u9020',
-    'mural': '\u58c1\u753b',
-    'museum': '\u535a\u7269\u9986',
-    'nude': '\u88f8\u4f53\u753b',
-    'ornament': '\u88c5\u9970\u54c1',
-    'palette': '\u8c03\u8272\u677f',
-    'pastel': '\u7c89\u5f69',
-    'perspective': '\u900f\u89c6\u6cd5',
-    'pigment': '\u989c\u6599',
-    'portrait': '\u8096\u50cf',
-    'pottery': '\u9676\u5668',
-    'replica': '\u590d\u5236\u54c1',
-    'saturate': '\u9971\u548c',
-    'sculpt': '\u96d5\u5851',
-    'sculpture': '\u96d5\u5851\u4f5c\u54c1',
-    'shade': '\u9634\u5f71',
-    'shadow': '\u5f71\u5b50',
-    'sketch': '\u7d20\u63cf',
-    'symmetry': '\u5bf9\u79f0',
-    'texture': '\u7eb9\u7406',
-    'tint': '\u8272\u8c03',
-    'typography': '\u6392\u7248',
-    'vivid': '\u9c9c\u8273\u7684',
-    'watercolour': '\u6c34\u5f69\u753b',
-
-    # Politics
-    'administration': '\u7ba1\u7406',
-    'advocate': '\u5021\u5bfc\u8005',
-    'agenda': '\u8bae\u7a0b',
-    'ambassador': '\u5927\u4f7f',
-    'amend': '\u4fee\u6b63',
-    'bilateral': '\u53cc\u8fb9\u7684',
-    'bureaucracy': '\u5b98\u50da\u673a\u6784',
-    'cabinet': '\u5185\u9601',
-    'capitalism': '\u8d44\u672c\u4e3b\u4e49',
-    'chancellor': '\u603b\u7406',
-    'citizen': '\u516c\u6c11',
-    'coalition': '\u8054\u76df',
-    'colony': '\u6b96\u6c11\u5730',
-    'communism': '\u5171\u4ea7\u4e3b\u4e49',
-    'compromise': '\u59a5\u534f',
-    'congress': '\u56fd\u4f1a',
-    'consensus': '\u5171\u8bc6',
-    'conservative': '\u4fdd\u5b88\u7684',
-    'constitution': '\u5baa\u6cd5',
-    'consul': '\u9886\u4e8b',
-    'convention': '\u516c\u7ea6',
-    'corrupt': '\u8150\u8d25\u7684',
-    'council': '\u8bae\u4f1a',
-    'coup': '\u653f\u53d8',
-    'decree': '\u6cd5\u4ee4',
-    'delegate': '\u4ee3\u8868',
-    'democracy': '\u6c11\u4e3b',
-    'dictator': '\u72ec\u88c1\u8005',
-    'diplomacy': '\u5916\u4ea4',
-    'diplomat': '\u5916\u4ea4\u5b98',
-    'domestic': '\u56fd\u5185\u7684',
-    'elect': '\u9009\u4e3e',
-    'election': '\u9009\u4e3e',
-    'embassy': '\u5927\u4f7f\u9986',
-    'empire': '\u5e1d\u56fd',
-    'enforce': '\u6267\u884c',
-    'executive': '\u884c\u653f\u7684',
-    'exile': '\u6d41\u653e',
-    'federal': '\u8054\u90a6\u7684',
-    'govern': '\u6cbb\u7406',
-    'government': '\u653f\u5e9c',
-    'ideology': '\u610f\u8bc6\u5f62\u6001',
-    'immigrate': '\u79fb\u6c11',
-    'imperial': '\u5e1d\u56fd\u7684',
-    'impose': '\u5f3a\u52a0',
-    'independence': '\u72ec\u7acb',
-    'institution': '\u5236\u5ea6',
-    'interfere': '\u5e72\u6d89',
-    'justice': '\u6b63\u4e49',
-    'legislate': '\u7acb\u6cd5',
-    'liberal': '\u81ea\u7531\u7684',
-    'liberty': '\u81ea\u7531',
-    'mandate': '\u6388\u6743',
-    'mayor': '\u5e02\u957f',
-    'mediate': '\u8c03\u89e3',
-    'military': '\u519b\u4e8b\u7684',
-    'minister': '\u90e8\u957f',
-    'monarchy': '\u541b\u4e3b\u5236',
-    'nation': '\u56fd\u5bb6',
-    'opposition': '\u53cd\u5bf9\u6d3e',
-    'parliament': '\u8bae\u4f1a',
-    'patriot': '\u7231\u56fd\u8005',
-    'petition': '\u8bf7\u613f',
-    'policy': '\u653f\u7b56',
-    'president': '\u603b\u7edf',
-    'privilege': '\u7279\u6743',
-    'propaganda': '\u5ba3\u4f20',
-    'province': '\u7701\u4efd',
-    'radical': '\u6fc0\u8fdb\u7684',
-    'rebel': '\u53db\u4e71\u8005',
-    'reform': '\u6539\u9769',
-    'refugee': '\u96be\u6c11',
-    'regime': '\u653f\u6743',
-    'republic': '\u5171\u548c\u56fd',
-    'resign': '\u8f9e\u804c',
-    'revolution': '\u9769\u547d',
-    'sanction': '\u5236\u88c1',
-    'senate': '\u53c2\u8bae\u9662',
-    'socialist': '\u793e\u4f1a\u4e3b\u4e49\u8005',
-    'sovereign': '\u4e3b\u6743\u7684',
-    'summit': '\u5cf0\u4f1a',
-    'supreme': '\u6700\u9ad8\u7684',
-    'territory': '\u9886\u571f',
-    'treaty': '\u6761\u7ea6',
-    'unite': '\u8054\u5408',
-    'veto': '\u5426\u51b3',
-    'welfare': '\u798f\u5229',
-
-    # Math
-    'algebra': '\u4ee3\u6570',
-    'calculus': '\u5fae\u79ef\u5206',
-    'coefficient': '\u7cfb\u6570',
-    'cone': '\u5706\u9525',
-    'converge': '\u6536\u655b',
-    'coordinate': '\u5750\u6807',
-    'correlation': '\u76f8\u5173\u6027',
-    'cosine': '\u4f59\u5f26',
-    'cube': '\u7acb\u65b9\u4f53',
-    'cylinder': '\u5706\u67f1\u4f53',
-    'decimal': '\u5c0f\u6570',
-    'deduce': '\u63a8\u5bfc',
-    'denominator': '\u5206\u6bcd',
-    'diagonal': '\u5bf9\u89d2\u7ebf',
-    'diameter': '\u76f4\u5f84',
-    'digit': '\u6570\u5b57',
-    'exponent': '\u6307\u6570',
-    'expression': '\u8868\u8fbe\u5f0f',
-    'geometry': '\u51e0\u4f55\u5b66',
-    'graph': '\u56fe\u8868',
-    'hypotenuse': '\u659c\u8fb9',
-    'inequality': '\u4e0d\u7b49\u5f0f',
-    'infinite': '\u65e0\u7a77\u7684',
-    'integer': '\u6574\u6570',
-    'intercept': '\u622a\u8ddd',
-    'intersect': '\u76f8\u4ea4',
-    'inverse': '\u9006',
-    'irrational': '\u65e0\u7406\u6570\u7684',
-    'linear': '\u7ebf\u6027\u7684',
-    'logarithm': '\u5bf9\u6570',
-    'logic': '\u903b\u8f91',
-    'matrix': '\u77e9\u9635',
-    'maximum': '\u6700\u5927\u503c',
-    'median': '\u4e2d\u4f4d\u6570',
-    'minimum': '\u6700\u5c0f\u503c',
-    'minus': '\u51cf',
-    'mode': '\u4f17\u6570',
-    'multiply': '\u4e58',
-    'negative': '\u8d1f\u6570',
-    'odd': '\u5947\u6570',
-    'parallel': '\u5e73\u884c\u7684',
-    'percent': '\u767e\u5206\u6bd4',
-    'perimeter': '\u5468\u957f',
-    'perpendicular': '\u5782\u76f4\u7684',
-    'plane': '\u5e73\u9762',
-    'plot': '\u7ed8\u56fe',
-    'plus': '\u52a0',
-    'polygon': '\u591a\u8fb9\u5f62',
-    'positive': '\u6b63\u6570',
-    'prime': '\u8d28\u6570',
-    'probability': '\u6982\u7387',
-    'proof': '\u8bc1\u660e',
-    'radius': '\u534a\u5f84',
-    'random': '\u968f\u673a\u7684',
-    'ratio': '\u6bd4\u7387',
-    'rational': '\u6709\u7406\u6570\u7684',
-    'rectangle': '\u77e9\u5f62',
-    'remainder': '\u4f59\u6570',
-    'root': '\u6839',
-    'sequence': '\u6570\u5217',
-    'set': '\u96c6\u5408',
-    'sphere': '\u7403\u4f53',
-    'square': '\u6b63\u65b9\u5f62',
-    'statistic': '\u7edf\u8ba1\u5b66',
-    'subtract': '\u51cf\u53bb',
-    'sum': '\u603b\u548c',
-    'tangent': '\u6b63\u5207',
-    'triangle': '\u4e09\u89d2\u5f62',
-    'vector': '\u5411\u91cf',
-
-    # Environment
-    'biodiversity': '\u751f\u7269\u591a\u6837\u6027',
-    'biofuel': '\u751f\u7269\u71c3\u6599',
-    'bush': '\u704c\u6728',
-    'catastrophe': '\u707e\u96be',
-    'coral': '\u73ca\u745a',
-    'cultivate': '\u8015\u79cd',
-    'deforest': '\u780d\u4f10\u68ee\u6797',
-    'deplete': '\u8017\u5c3d',
-    'disaster': '\u707e\u96be',
-    'dispose': '\u5904\u7406',
-    'drought': '\u5e72\u65f1',
-    'dump': '\u503e\u5012',
-    'ecology': '\u751f\u6001\u5b66',
-    'ecosystem': '\u751f\u6001\u7cfb\u7edf',
-    'endanger': '\u5371\u53ca',
-    'erode': '\u4fb5\u8680',
-    'extinct': '\u706d\u7edd\u7684',
-    'fertile': '\u80a5\u6c83\u7684',
-    'glacier': '\u51b0\u5ddd',
-    'greenhouse': '\u6e29\u5ba4',
-    'hazard': '\u5371\u5bb3',
-    'hurricane': '\u98d3\u98ce',
-    'irrigate': '\u704c\u6e89',
-    'marine': '\u6d77\u6d0b\u7684',
-    'meadow': '\u8349\u5730',
-    'ozone': '\u81ed\u6c27',
-    'pesticide': '\u6740\u866b\u5242',
-    'pollute': '\u6c61\u67d3',
-    'preserve': '\u4fdd\u62a4',
-    'purify': '\u51c0\u5316',
-    'rainforest': '\u96e8\u6797',
-    'recycle': '\u56de\u6536',
-    'renewable': '\u53ef\u518d\u751f\u7684',
-    'reuse': '\u518d\u5229\u7528',
-    'rural': '\u519c\u6751\u7684',
-    'sand': '\u6c99\u5b50',
-    'sewage': '\u6c61\u6c34',
-    'soil': '\u571f\u58e4',
-    'sustainable': '\u53ef\u6301\u7eed\u7684',
-    'timber': '\u6728\u6750',
-    'tornado': '\u9f99\u5377\u98ce',
-    'tropical': '\u70ed\u5e26\u7684',
-    'urban': '\u57ce\u5e02\u7684',
-    'vegetation': '\u690d\u88ab',
-    'volcano': '\u706b\u5c71',
-    'wetland': '\u6e7f\u5730',
-    'wildlife': '\u91ce\u751f\u52a8\u7269',
-
-    # Psychology
-    'abuse': '\u6ee5\u7528',
-    'adolescent': '\u9752\u5c11\u5e74',
-    'aggressive': '\u597d\u6597\u7684',
-    'appetite': '\u98df\u6b32',
-    'arouse': '\u5524\u8d77',
-    'attach': '\u4f9d\u604b',
-    'behaviour': '\u884c\u4e3a',
-    'bully': '\u6b3a\u51cc',
-    'cognitive': '\u8ba4\u77e5\u7684',
-    'compel': '\u5f3a\u8feb',
-    'conform': '\u987a\u4ece',
-    'consent': '\u540c\u610f',
-    'cope': '\u5e94\u5bf9',
-    'counsel': '\u54a8\u8be2',
-    'curiosity': '\u597d\u5947\u5fc3',
-    'desire': '\u6b32\u671b',
-    'discipline': '\u7eaa\u5f8b',
-    'distort': '\u626d\u66f2',
-    'distract': '\u5206\u5fc3',
-    'disturb': '\u6270\u4e71',
-    'dominate': '\u652f\u914d',
-    'ego': '\u81ea\u6211',
-    'empathy': '\u5171\u60c5',
-    'frustrate': '\u632b\u8d25',
-    'grief': '\u60b2\u4f24',
-    'guilt': '\u5185\u7596',
-    'hallucinate': '\u4ea7\u751f\u5e7b\u89c9',
-    'illusion': '\u5e7b\u89c9',
-    'impulse': '\u51b2\u52a8',
-    'inhibit': '\u6291\u5236',
-    'instinct': '\u672c\u80fd',
-    'intimate': '\u4eb2\u5bc6\u7684',
-    'introvert': '\u5185\u5411\u8005',
-    'intuition': '\u76f4\u89c9',
-    'mature': '\u6210\u719f\u7684',
-    'meditate': '\u5192\u60f3',
-    'motivate': '\u6fc0\u52b1',
-    'neglect': '\u5ffd\u89c6',
-    'neurotic': '\u795e\u7ecf\u8d28\u7684',
-    'norm': '\u89c4\u8303',
-    'nurture': '\u57f9\u517b',
-    'obsess': '\u7740\u8ff7',
-    'perceive': '\u611f\u77e5',
-    'personality': '\u4eba\u683c',
-    'phobia': '\u6050\u60e7\u75c7',
-    'pleasure': '\u5feb\u4e50',
-    'prejudice': '\u504f\u89c1',
-    'punish': '\u60e9\u7f5a',
-    'recall': '\u56de\u5fc6',
-    'reinforce': '\u5f3a\u5316',
-    'reject': '\u62d2\u7edd',
-    'relax': '\u653e\u677e',
-    'repress': '\u538b\u6291',
-    'respond': '\u56de\u5e94',
-    'satisfy': '\u6ee1\u8db3',
-    'self': '\u81ea\u6211',
-    'sensation': '\u611f\u89c9',
-    'shame': '\u7f9e\u803b',
-    'stimulate': '\u523a\u6fc0',
-    'subconscious': '\u6f5c\u610f\u8bc6\u7684',
-    'suppress': '\u538b\u5236',
-    'sympathy': '\u540c\u60c5',
-    'temperament': '\u6c14\u8d28',
-    'tension': '\u7d27\u5f20',
-    'thought': '\u601d\u60f3',
-    'trait': '\u7279\u8d28',
-    'trauma': '\u521b\u4f24',
-    'trigger': '\u89e6\u53d1',
-    'unconscious': '\u65e0\u610f\u8bc6\u7684',
-    'urge': '\u51b2\u52a8',
-    'vulnerable': '\u8106\u5f31\u7684',
-
-    # Sports
-    'ace': '\u53d1\u7403\u5f97\u5206',
-    'amateur': '\u4e1a\u4f59\u7684',
-    'athlete': '\u8fd0\u52a8\u5458',
-    'athletics': '\u7530\u5f84\u8fd0\u52a8',
-    'bat': '\u7403\u68d2',
-    'bench': '\u66ff\u8865\u5e2d',
-    'bicycle': '\u81ea\u884c\u8f66',
-    'boot': '\u7403\u978b',
-    'bounce': '\u5f39\u8df3',
-    'bout': '\u4e00\u5c40\u6bd4\u8d5b',
-    'bowl': '\u4fdd\u9f84\u7403',
-    'captain': '\u961f\u957f',
-    'chase': '\u8ffd\u9010',
-    'coach': '\u6559\u7ec3',
-    'competition': '\u6bd4\u8d5b',
-    'competitor': '\u53c2\u8d5b\u8005',
-    'contest': '\u7ade\u8d5b',
-    'defence': '\u9632\u5b88',
-    'disqualify': '\u53d6\u6d88\u8d44\u683c',
-    'dive': '\u8df3\u6c34',
-    'drill': '\u8bad\u7ec3',
-    'endurance': '\u8010\u529b',
-    'fault': '\u72af\u89c4',
-    'field': '\u8fd0\u52a8\u573a',
-    'foul': '\u72af\u89c4',
-    'goal': '\u8fdb\u7403',
-    'golf': '\u9ad8\u5c14\u592b',
-    'guard': '\u540e\u536b',
-    'gym': '\u5065\u8eab\u623f',
-    'hockey': '\u66f2\u68cd\u7403',
-    'hurdle': '\u8de8\u680f',
-    'lap': '\u5708',
-    'marathon': '\u9a6c\u62c9\u677e',
-    'medal': '\u5956\u724c',
-    'net': '\u7403\u7f51',
-    'offence': '\u8fdb\u653b',
-    'official': '\u88c1\u5224',
-    'overtime': '\u52a0\u65f6\u8d5b',
-    'pass': '\u4f20\u7403',
-    'pitch': '\u7403\u573a',
-    'pool': '\u6e38\u6cf3\u6c60',
-    'professional': '\u804c\u4e1a\u7684',
-    'qualify': '\u83b7\u5f97\u8d44\u683c',
-    'race': '\u6bd4\u8d5b',
-    'racket': '\u7403\u62cd',
-    'referee': '\u88c1\u5224',
-    'relay': '\u63a5\u529b\u8d5b',
-    'rugby': '\u6a44\u6984\u7403',
-    'seed': '\u79cd\u5b50\u9009\u624b',
-    'serve': '\u53d1\u7403',
-    'squad': '\u961f\u4f0d',
-    'stadium': '\u4f53\u80b2\u573a',
-    'substitute': '\u66ff\u8865',
-    'swim': '\u6e38\u6cf3',
-    'tackle': '\u94f2\u7403',
-    'tennis': '\u7f51\u7403',
-    'tie': '\u5e73\u5c40',
-    'tournament': '\u9526\u6807\u8d5b',
-    'transfer': '\u8f6c\u4f1a',
-    'volleyball': '\u6392\u7403',
-
-    # Architecture
-    'anchor': '\u951a\u56fa\u4ef6',
-    'arch': '\u62f1\u95e8',
-    'architect': '\u5efa\u7b51\u5e08',
-    'architecture': '\u5efa\u7b51\u5b66',
-    'blueprint': '\u84dd\u56fe',
-    'bolt': '\u87ba\u6813',
-    'boundary': '\u8fb9\u754c',
-    'brace': '\u652f\u6491',
-    'brick': '\u7816',
-    'bridge': '\u6865\u6881',
-    'ceiling': '\u5929\u82b1\u677f',
-    'cement': '\u6c34\u6ce5',
-    'chimney': '\u70df\u56f1',
-    'clamp': '\u5939\u5177',
-    'column': '\u67f1\u5b50',
-    'concrete': '\u6df7\u51dd\u571f',
-    'construction': '\u5efa\u8bbe',
-    'consultant': '\u987e\u95ee',
-    'corridor': '\u8d70\u5eca',
-    'crane': '\u8d77\u91cd\u673a',
-    'dam': '\u6c34\u575d',
-    'demolish': '\u62c6\u9664',
-    'dense': '\u5bc6\u96c6\u7684',
-    'dome': '\u5706\u9876',
-    'door': '\u95e8',
-    'drain': '\u6392\u6c34',
-    'durable': '\u8010\u7528\u7684',
-    'dwelling': '\u4f4f\u5b85',
-    'edge': '\u8fb9\u7f18',
-    'elevate': '\u5347\u9ad8',
-    'erect': '\u5efa\u9020',
-    'excavate': '\u6316\u6398',
-    'exterior': '\u5916\u90e8',
-    'facade': '\u5916\u7acb\u9762',
-    'facility': '\u8bbe\u65bd',
-    'fence': '\u6805\u680f',
-    'fibre': '\u7ea4\u7ef4',
-    'fixture': '\u56fa\u5b9a\u88c5\u7f6e',
-    'floor': '\u697c\u5c42',
-    'foundation': '\u5730\u57fa',
-    'furnish': '\u88c5\u4fee',
-    'girder': '\u5927\u6881',
-    'glass': '\u73bb\u7483',
-    'grade': '\u5761\u5ea6',
-    'gravel': '\u7826\u77f3',
-    'ground': '\u5730\u9762',
-    'gutter': '\u6392\u6c34\u6c9f',
-    'height': '\u9ad8\u5ea6',
-    'horizontal': '\u6c34\u5e73\u7684',
-    'infrastructure': '\u57fa\u7840\u8bbe\u65bd',
-    'interior': '\u5ba4\u5185',
-    'iron': '\u94c1',
-    'joint': '\u63a5\u5934',
-    'landmark': '\u5730\u6807',
-    'load': '\u8377\u8f7d',
-    'mortar': '\u7802\u6d46',
-    'panel': '\u9762\u677f',
-    'pier': '\u58a9',
-    'pillar': '\u67f1\u5b50',
-    'pipe': '\u7ba1\u9053',
-    'plaster': '\u7070\u6ce5',
-    'plumb': '\u94c5\u5782\u7684',
-    'pole': '\u6746',
-    'ramp': '\u5761\u9053',
-    'renovate': '\u7ffb\u65b0',
-    'residential': '\u4f4f\u5b85\u7684',
-    'rigid': '\u575a\u786c\u7684',
-    'roof': '\u5c4b\u9876',
-    'scaffold': '\u811a\u624b\u67b6',
-    'site': '\u5de5\u5730',
-    'slab': '\u677f',
-    'slope': '\u5761\u5ea6',
-    'span': '\u8de8\u5ea6',
-    'specification': '\u89c4\u683c',
-    'steel': '\u94a2\u94c1',
-    'storey': '\u697c\u5c42',
-    'studio': '\u5de5\u4f5c\u5ba4',
-    'suspend': '\u60ac\u6302',
-    'terrace': '\u9732\u53f0',
-    'tile': '\u74f7\u7816',
-    'trench': '\u6c9f\u6e20',
-    'tunnel': '\u96a7\u9053',
-    'vault': '\u62f1\u9876',
-    'ventilate': '\u901a\u98ce',
-    'vertical': '\u5782\u76f4\u7684',
-    'wall': '\u5899',
-    'weld': '\u710a\u63a5',
-    'wire': '\u7535\u7ebf',
-
-    # AI
-    'accuracy': '\u51c6\u786e\u7387',
-    'agent': '\u667a\u80fd\u4f53',
-    'annotate': '\u6807\u6ce8',
-    'assistant': '\u52a9\u624b',
-    'augment': '\u589e\u5f3a',
-    'autonomous': '\u81ea\u4e3b\u7684',
-    'batch': '\u6279\u6b21',
-    'caption': '\u63cf\u8ff0\u6587\u5b57',
-    'classify': '\u5206\u7c7b',
-    'cognitive': '\u8ba4\u77e5\u7684',
-    'corpus': '\u8bed\u6599\u5e93',
-    'dataset': '\u6570\u636e\u96c6',
-    'decision': '\u51b3\u7b56',
-    'deep': '\u6df1\u5ea6',
-    'discriminate': '\u5224\u522b',
-    'dynamic': '\u52a8\u6001\u7684',
-    'efficient': '\u9ad8\u6548\u7684',
-    'entity': '\u5b9e\u4f53',
-    'epoch': '\u8bad\u7ec3\u8f6e\u6b21',
-    'error': '\u8bef\u5dee',
-    'feature': '\u7279\u5f81',
-    'fine': '\u5fae\u8c03',
-    'foundation': '\u57fa\u7840\u6a21\u578b',
-    'graph': '\u56fe',
-    'image': '\u56fe\u50cf',
-    'implement': '\u5b9e\u73b0',
-    'inference': '\u63a8\u7406',
-    'instance': '\u5b9e\u4f8b',
-    'iterate': '\u8fed\u4ee3',
-    'kernel': '\u6838',
-    'label': '\u6807\u7b7e',
-    'language': '\u8bed\u8a00',
-    'latent': '\u6f5c\u5728\u7684',
-    'learn': '\u5b66\u4e60',
-    'linear': '\u7ebf\u6027\u7684',
-    'loss': '\u635f\u5931',
-    'machine': '\u673a\u5668',
-    'matrix': '\u77e9\u9635',
-    'metric': '\u8bc4\u4ef7\u6307\u6807',
-    'neural': '\u795e\u7ecf\u7684',
-    'noise': '\u566a\u58f0',
-    'objective': '\u76ee\u6807\u51fd\u6570',
-    'overfit': '\u8fc7\u62df\u5408',
-    'parallel': '\u5e76\u884c',
-    'parameter': '\u53c2\u6570',
-    'perceive': '\u611f\u77e5',
-    'pipeline': '\u6d41\u6c34\u7ebf',
-    'predict': '\u9884\u6d4b',
-    'pretrain': '\u9884\u8bad\u7ec3',
-    'probability': '\u6982\u7387',
-    'prompt': '\u63d0\u793a\u8bcd',
-    'recognition': '\u8bc6\u522b',
-    'reinforce': '\u5f3a\u5316',
-    'represent': '\u8868\u793a',
-    'robot': '\u673a\u5668\u4eba',
-    'scale': '\u89c4\u6a21',
-    'semantic': '\u8bed\u4e49\u7684',
-    'speech': '\u8bed\u97f3',
-    'statistic': '\u7edf\u8ba1',
-    'supervise': '\u76d1\u7763',
-    'synthetic': '\u5408\u6210\u7684',
-    'task': '\u4efb\u52a1',
-    'tensor': '\u5f20\u91cf',
-    'test': '\u6d4b\u8bd5',
-    'train': '\u8bad\u7ec3',
-    'transfer': '\u8fc1\u79fb',
-    'transform': '\u53d8\u6362',
-    'tune': '\u8c03\u4f18',
-    'validate': '\u9a8c\u8bc1',
-    'vector': '\u5411\u91cf',
-    'vision': '\u89c6\u89c9',
-    'weight': '\u6743\u91cd',
-}
-
-
-def load_oxford_translations(csv_path):
-    """Load translations from Oxford 5000 CSV file."""
-    translations = {}
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            term = row['term'].strip().lower()
-            translation = row['translation'].strip()
-            if translation:
-                translations[term] = translation
-    return translations
-
 
 def generate_wordbook_js(topic_id, topic_info, words_data):
     """Generate JS file content for a topic wordbook."""
@@ -1949,10 +701,10 @@ def main():
     print("Topic Wordbook Generator")
     print("=" * 60)
 
-    # Load Oxford translations
-    print(f"\nLoading Oxford 5000 translations from: {OXFORD_CSV}")
-    oxford_translations = load_oxford_translations(OXFORD_CSV)
-    print(f"  Loaded {len(oxford_translations)} Oxford translations")
+    # Open the translation store (Oxford CSV first, then the topic fill-ins)
+    store = TranslationStore()
+    print(f"\nTranslation store: {store.path}")
+    print(f"  {store.count('oxford')} Oxford translations, {store.count('topic')} topic translations")
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -1978,19 +730,13 @@ def main():
             word_lower = word.lower()
 
             # Get translation
-            meaning = oxford_translations.get(word_lower)
-            if meaning is None:
-                meaning = EXTRA_TRANSLATIONS.get(word_lower)
-            if meaning is None:
-                meaning = EXTRA_TRANSLATIONS.get(word)
+            meaning = store.lookup(word, TRANSLATION_LAYERS)
             if meaning is None:
                 missing_translations.append(word)
                 meaning = word  # fallback
 
             # Check audio
-            audio_file = f"{word_lower}.wav"
-            audio_path = os.path.join(AUDIO_DIR, audio_file)
-            audio = audio_file if os.path.exists(audio_path) else None
+            audio = audio_field(f"{word_lower}.wav", AUDIO_DIR)
 
             words_data.append({
                 'word': word_lower,
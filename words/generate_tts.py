@@ -1,91 +1,70 @@
+"""
+Generate TTS audio for the Oxford 5000 word list and write words_manifest.json.
+
+Thin CLI over tts_lib.py (backend, voice resolution, cache, rate limiting,
+batching); this script owns the CSV input, the resumable journal and the
+manifest. Manifest entries are streamed to words_manifest.jsonl (see
+manifest_store.py) in CSV order: a row's entry is written once it and every
+row before it are settled (skipped as unchanged, generated, or failed), so
+reruns produce the same file. Words that fail are left out of the manifest
+and listed at the end; after a crash, --rebuild-manifest restores the entries
+still waiting on an earlier row from the journal. The legacy JSON is exported
+at the end.
+
+Usage:
+    python generate_tts.py
+    python generate_tts.py --batch-size 10          # pack 10 words per request
+    python generate_tts.py --backend local          # offline, no credentials
+    python generate_tts.py --rebuild-manifest       # manifest from the journal
+"""
 import os
 import argparse
-import json
 import pandas as pd
-from google.cloud import texttospeech
-from google.api_core import client_options
+from tts_lib import (
+    LANGUAGE_CODE, SSML_TEMPLATE, TARGET_VOICE_DISPLAY, TARGET_VOICE_NAME,
+    add_tts_arguments, resolve_voice, setup_pipeline, setup_quality_gate,
+    synthesize_batch_to_files, synthesize_text,
+)
+from tts_journal import TtsJournal, input_hash, rebuild_manifest
+from manifest_store import ManifestWriter, export_legacy_json
+from tts_batch import batch_template
 
 # Configuration
 INPUT_FILE = 'oxford_5000_merged_total.csv'
 OUTPUT_DIR = 'tts_delivery/audio'
 MANIFEST_FILE = 'tts_delivery/words_manifest.json'
-LANGUAGE_CODE = 'en-US'
-# Primary target voice
-TARGET_VOICE_NAME = 'en-US-Chirp3-HD-Zephyr' 
-# Fallback to look for if exact ID match fails (substring search)
-TARGET_VOICE_DISPLAY = 'Zephyr' 
-
-def get_text_to_speech_client():
-    """Initializes the Text-to-Speech client."""
-    try:
-        # Explicitly set the quota project to handle ADC issues
-        options = client_options.ClientOptions(quota_project_id='gen-lang-client-0153103557')
-        return texttospeech.TextToSpeechClient(client_options=options)
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        print(f"Error initializing Google Cloud TTS Client: {e}")
-        print("Ensure you have authenticated using: gcloud auth application-default login")
-        return None
-
-def find_voice(client, language_code, target_name):
-    """Finds the requested voice ID."""
-    print(f"Searching for voice: {target_name} in {language_code}...")
-    voices = client.list_voices(language_code=language_code).voices
-    
-    # 1. Try exact match
-    for voice in voices:
-        if voice.name == target_name:
-            print(f"Found exact match: {voice.name}")
-            return voice.name
-
-    # 2. Try substring match (e.g. matching 'Zephyr' in name)
-    for voice in voices:
-        if target_name in voice.name:
-            print(f"Found related voice: {voice.name}")
-            return voice.name
-            
-    print(f"Voice '{target_name}' not found. Listing available {language_code} voices:")
-    for voice in voices:
-        print(f"- {voice.name} ({voice.ssml_gender.name})")
-    
-    return None
-
-def synthesize_text(client, text, voice_name, output_path):
-    """Synthesizes speech from the input string of text using SSML to add padding."""
-    # Use SSML to add a small break at the end to prevent audio cutoff
-    ssml_text = f'<speak>{text}<break time="300ms"/></speak>'
-    input_text = texttospeech.SynthesisInput(ssml=ssml_text)
-
-    # Note: specific voice parameters for Chirp might vary
-    voice = texttospeech.VoiceSelectionParams(
-        language_code=LANGUAGE_CODE,
-        name=voice_name
-    )
-
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.LINEAR16
-    )
-
-    try:
-        response = client.synthesize_speech(
-            request={"input": input_text, "voice": voice, "audio_config": audio_config}
-        )
-
-        with open(output_path, "wb") as out:
-            out.write(response.audio_content)
-        return True
-    
-    except Exception as e:
-        print(f"Error synthesizing '{text}': {e}")
-        return False
+MANIFEST_STREAM_FILE = 'tts_delivery/words_manifest.jsonl'
+JOURNAL_FILE = 'tts_delivery/tts_journal.jsonl'
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate TTS audio for the Oxford 5000 word list')
+    add_tts_arguments(parser)
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate every word, ignoring completed entries in the journal')
+    parser.add_argument('--rebuild-manifest', action='store_true',
+                        help='Rebuild words_manifest.json from the job journal and exit')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='Words per SSML request; >1 enables batching with local splitting (default: 1)')
+    args = parser.parse_args()
+
     # Setup paths
     base_dir = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(base_dir, INPUT_FILE)
     output_dir_path = os.path.join(base_dir, OUTPUT_DIR)
     manifest_path = os.path.join(base_dir, MANIFEST_FILE)
+    stream_path = os.path.join(base_dir, MANIFEST_STREAM_FILE)
+    journal_path = os.path.join(base_dir, JOURNAL_FILE)
+
+    if args.rebuild_manifest:
+        if not os.path.exists(journal_path):
+            print(f"Error: journal {journal_path} not found.")
+            return
+        with ManifestWriter(stream_path, mode='w') as manifest:
+            for entry in rebuild_manifest(journal_path):
+                manifest.append(entry)
+        count = export_legacy_json(stream_path, manifest_path)
+        print(f"Rebuilt manifest with {count} entries: {manifest_path}")
+        return
 
     if not os.path.exists(output_dir_path):
         os.makedirs(output_dir_path)
@@ -112,34 +91,61 @@ def main():
     
     print(f"Found {len(words_data)} entries to process.")
 
-    # Init Client
-    client = get_text_to_speech_client()
-    if not client:
+    # Init Backend
+    backend, limiter, cache = setup_pipeline(args)
+    if not backend:
         return
+    gate = setup_quality_gate(args, backend)
 
     # Select Voice
-    voice_id = find_voice(client, LANGUAGE_CODE, TARGET_VOICE_NAME)
-    if not voice_id:
-        # Try finding by display name "Zephyr" if exact ID failed
-        voice_id = find_voice(client, LANGUAGE_CODE, TARGET_VOICE_DISPLAY)
+    voice_id = resolve_voice(backend, LANGUAGE_CODE, TARGET_VOICE_NAME, TARGET_VOICE_DISPLAY,
+                             refresh=args.refresh_voices)
         
     if not voice_id:
         print("Could not identify the correct voice. Aborting.")
         return
         
-    print(f"Using Voice ID: {voice_id}")
+    print(f"Using Voice ID: {voice_id} (backend: {backend.name})")
     
     # Process
     success_count = 0
+    skipped_count = 0
     total_count = len(words_data)
-    manifest_list = []
+    journal = TtsJournal(journal_path)
+    manifest = ManifestWriter(stream_path, mode='w')
+    print(f"Journal: {journal_path} {journal.counts() or '(new)'}")
+    pending = []
+    batch_fallbacks = 0
+    failed_words = []
+
+    # Rows settle out of order (unchanged ones up front, batches later), so
+    # entries wait in `settled` until every earlier row is settled too
+    rows = []      # indices of rows with a word, in CSV order
+    settled = {}   # row index -> manifest entry, or None for a failed word
+    cursor = 0
+
+    def settle(i, entry):
+        nonlocal cursor
+        settled[i] = entry
+        while cursor < len(rows) and rows[cursor] in settled:
+            ready = settled.pop(rows[cursor])
+            if ready:
+                manifest.append(ready)
+            cursor += 1
+
+    def batch_digest(word):
+        return input_hash(word, voice_id, batch_template(), backend=backend.name)
     
-    print("Starting generation (Overwriting existing files to fix audio duration)...")
+    if args.force:
+        print("Starting generation (--force: overwriting all existing files)...")
+    else:
+        print("Starting generation (resuming: words journaled with unchanged inputs are skipped)...")
     for i, row in enumerate(words_data):
         word_str = row.get('word')
         if not word_str:
             continue
-            
+        rows.append(i)
+
         # Create safe filename
         safe_filename = "".join([c for c in word_str if c.isalpha() or c.isdigit() or c in (' ', '.', '_', '-')]).rstrip()
         filename = f"{safe_filename}.wav"
@@ -153,20 +159,84 @@ def main():
             "path": f"{OUTPUT_DIR}/{filename}",
             "cefr": row.get('cefr', 'N/A') # Capture CEFR level if present
         }
-        manifest_list.append(entry)
 
-        # Removed 'file exists' check to force regeneration with SSML
-        
+        # A plain 'file exists' check is not enough (the SSML padding or voice
+        # may have changed), so resume based on the journaled input hash.
+        # The same hash is the key of the word's blob in the synthesis cache.
+        digest = input_hash(word_str, voice_id, SSML_TEMPLATE, backend=backend.name)
+        if not args.force and (journal.is_done(filename, digest, output_path) or
+                               journal.is_done(filename, batch_digest(word_str), output_path)):
+            skipped_count += 1
+            settle(i, entry)
+            continue
+        pending.append((i, word_str, filename, output_path, entry, digest))
+
+    def run_single(i, word_str, filename, output_path, entry, digest):
         print(f"[{i+1}/{total_count}] Generating {word_str}...")
-        if synthesize_text(client, word_str, voice_id, output_path):
-            success_count += 1
+        journal.record(filename, 'pending', digest, word=word_str, voice=voice_id)
+        if synthesize_text(backend, word_str, voice_id, output_path, limiter, cache, gate):
+            journal.record(filename, 'done', digest, word=word_str, voice=voice_id, entry=entry)
+            settle(i, entry)
+            return True
+        journal.record(filename, 'failed', digest, word=word_str, voice=voice_id)
+        failed_words.append(word_str)
+        settle(i, None)
+        return False
 
-    # Save Manifest
+    if args.batch_size > 1:
+        for b in range(0, len(pending), args.batch_size):
+            chunk = pending[b:b + args.batch_size]
+            first, last = chunk[0][0] + 1, chunk[-1][0] + 1
+            print(f"[{first}-{last}/{total_count}] Generating batch of {len(chunk)} words...")
+            for i, word_str, filename, output_path, entry, digest in chunk:
+                journal.record(filename, 'pending', batch_digest(word_str), word=word_str, voice=voice_id)
+            try:
+                synthesize_batch_to_files(
+                    backend, [(job[1], job[3]) for job in chunk], voice_id, limiter, cache
+                )
+            except Exception as e:
+                # Segment count mismatch or API error: redo this batch word by word
+                print(f"  Batch rejected ({e}); falling back to single-word requests")
+                batch_fallbacks += 1
+                success_count += sum(run_single(*job) for job in chunk)
+                continue
+            for job in chunk:
+                i, word_str, filename, output_path, entry, digest = job
+                # A split clip that fails the quality gate is redone with its own request;
+                # its batch blob is evicted so the next batch run does not reuse it
+                if gate and gate.check(output_path):
+                    if cache:
+                        cache.discard(batch_digest(word_str))
+                    success_count += run_single(*job)
+                    continue
+                journal.record(filename, 'done', batch_digest(word_str), word=word_str,
+                               voice=voice_id, entry=entry)
+                settle(i, entry)
+                success_count += 1
+    else:
+        for job in pending:
+            success_count += run_single(*job)
+
+    journal.close()
+    manifest.close()
+
+    # Export the legacy manifest from the streamed one
     print(f"Saving manifest to {manifest_path}...")
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest_list, f, indent=2, ensure_ascii=False)
-
-    print(f"Done. Successfully generated {success_count}/{total_count} files.")
+    export_legacy_json(stream_path, manifest_path)
+
+    print(f"Done. Successfully generated {success_count}/{total_count - skipped_count} files "
+          f"({skipped_count} unchanged, skipped).")
+    if failed_words:
+        print(f"Failed ({len(failed_words)}, not in the manifest; rerun to retry): {', '.join(failed_words)}")
+    if args.batch_size > 1:
+        print(f"Batches rejected and redone per word: {batch_fallbacks}")
+    print(f"Rate limiter: {limiter.summary()}")
+    if cache:
+        print(f"Synthesis cache: {cache.summary()}")
+    if gate:
+        print(f"Quality gate: {gate.summary()}")
+        if gate.failures:
+            print(f"Rejected clips queued for retry in: {gate.write_queue()}")
     print(f"Manifest saved at: {manifest_path}")
 
 if __name__ == "__main__":
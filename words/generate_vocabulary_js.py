@@ -5,13 +5,16 @@ Oxford 5000 词汇 JS 生成器
 用法: python generate_vocabulary_js.py
 """
 import csv
-import json
 import os
 
+from audio_store import audio_field
+from manifest_store import load_manifest_map
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CSV_PATH = os.path.join(SCRIPT_DIR, 'oxford_5000_merged_total_translated.csv')
 MANIFEST_PATH = os.path.join(SCRIPT_DIR, 'tts_delivery', 'words_manifest.json')
+MANIFEST_STREAM_PATH = os.path.join(SCRIPT_DIR, 'tts_delivery', 'words_manifest.jsonl')
 OUTPUT_PATH = os.path.join(os.path.dirname(SCRIPT_DIR), 'oxford_vocabulary.js')
 
 # Part-of-speech and non-word entries to skip
@@ -34,10 +37,8 @@ def main():
 
     # 2. Read manifest (has audio filenames)
     manifest_map = {}
-    if os.path.exists(MANIFEST_PATH):
-        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-        manifest_map = {e['word']: e['filename'] for e in manifest}
+    if os.path.exists(MANIFEST_STREAM_PATH) or os.path.exists(MANIFEST_PATH):
+        manifest_map = load_manifest_map(MANIFEST_STREAM_PATH, MANIFEST_PATH)
         print(f"Loaded manifest: {len(manifest_map)} audio entries")
     else:
         print("WARNING: manifest not found, audio filenames will be guessed")
@@ -73,7 +74,7 @@ def main():
             'meaning': translation,
         }
         if audio_filename:
-            entry['audio'] = audio_filename
+            entry['audio'] = audio_field(audio_filename, must_exist=False)
 
         vocab[cefr].append(entry)
 
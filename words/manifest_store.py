@@ -0,0 +1,175 @@
+"""
+Streaming audio manifest (words_manifest.jsonl).
+
+generate_tts.py appends one JSON object per line as each audio file is
+produced, so the manifest survives a crash and never has to be held in
+memory. Readers can:
+- iterate entries lazily:          iter_manifest()
+- build a word -> filename dict:   load_manifest_map()
+- look up single words in O(1):    ManifestIndex(path).get(word)
+  (byte offsets per word, persisted in a .idx sidecar and rebuilt
+  automatically when the manifest's size or mtime changes)
+
+The legacy words_manifest.json (one indented JSON array) is still exported
+for the game and older tools:
+    python words/manifest_store.py --export
+"""
+import argparse
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_JSONL = os.path.join(SCRIPT_DIR, 'tts_delivery', 'words_manifest.jsonl')
+MANIFEST_JSON = os.path.join(SCRIPT_DIR, 'tts_delivery', 'words_manifest.json')
+
+
+class ManifestWriter:
+    """Appends manifest entries to a JSON Lines file, one flush per entry."""
+
+    def __init__(self, path=MANIFEST_JSONL, mode='a'):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.fh = open(path, mode, encoding='utf-8')
+
+    def append(self, entry):
+        self.fh.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.fh.flush()
+
+    def close(self):
+        self.fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_manifest(path=MANIFEST_JSONL, legacy_path=MANIFEST_JSON):
+    """Yield manifest entries lazily; falls back to the legacy JSON array."""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from an interrupted run
+                    continue
+    elif legacy_path and os.path.exists(legacy_path):
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def latest_entries(path=MANIFEST_JSONL, legacy_path=MANIFEST_JSON):
+    """Entries with later lines overriding earlier ones for the same word, in first-seen order."""
+    latest = {}
+    for entry in iter_manifest(path, legacy_path):
+        latest[entry['word']] = entry
+    return list(latest.values())
+
+
+def load_manifest_map(path=MANIFEST_JSONL, legacy_path=MANIFEST_JSON, field='filename'):
+    """Return {word: entry[field]} (later entries win)."""
+    return {e['word']: e[field] for e in iter_manifest(path, legacy_path)}
+
+
+def export_legacy_json(path=MANIFEST_JSONL, json_path=MANIFEST_JSON):
+    """Write the legacy indented words_manifest.json; returns the entry count."""
+    entries = latest_entries(path, legacy_path=None)
+    tmp = json_path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, json_path)
+    return len(entries)
+
+
+class ManifestIndex:
+    """O(1) lookup of manifest entries by word via byte offsets into the JSONL file."""
+
+    def __init__(self, path=MANIFEST_JSONL):
+        self.path = path
+        self.idx_path = path + '.idx'
+        self.offsets = self._load_or_build()
+
+    def _load_or_build(self, force=False):
+        # A rewrite can reorder the same entries at the same size, so the
+        # mtime is part of the stamp too
+        st = os.stat(self.path)
+        size, mtime_ns = st.st_size, st.st_mtime_ns
+        if not force and os.path.exists(self.idx_path):
+            with open(self.idx_path, 'r', encoding='utf-8') as f:
+                idx = json.load(f)
+            if idx.get('size') == size and idx.get('mtime_ns') == mtime_ns:
+                return idx['offsets']
+
+        offsets = {}
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    try:
+                        offsets[json.loads(line)['word']] = offset
+                    except ValueError:
+                        pass
+                offset += len(line)
+        with open(self.idx_path, 'w', encoding='utf-8') as f:
+            json.dump({'size': size, 'mtime_ns': mtime_ns, 'offsets': offsets}, f, ensure_ascii=False)
+        return offsets
+
+    def __contains__(self, word):
+        return word in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, word, default=None):
+        entry = self._read(word)
+        if entry is not None and entry.get('word') != word:
+            # The sidecar is stale (manifest rewritten within the mtime
+            # resolution): rebuild it and read again
+            self.offsets = self._load_or_build(force=True)
+            entry = self._read(word)
+        return entry if entry is not None and entry.get('word') == word else default
+
+    def _read(self, word):
+        offset = self.offsets.get(word)
+        if offset is None:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            try:
+                return json.loads(f.readline())
+            except ValueError:
+                return {}
+
+
+def convert_legacy(json_path=MANIFEST_JSON, path=MANIFEST_JSONL):
+    """Create words_manifest.jsonl from an existing legacy words_manifest.json."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    with ManifestWriter(path, mode='w') as writer:
+        for entry in entries:
+            writer.append(entry)
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Streaming manifest tools')
+    parser.add_argument('--export', action='store_true', help='Export words_manifest.json from the JSONL manifest')
+    parser.add_argument('--import-legacy', action='store_true', help='Create the JSONL manifest from words_manifest.json')
+    parser.add_argument('--lookup', metavar='WORD', help='Print the manifest entry for WORD')
+    args = parser.parse_args()
+
+    if args.import_legacy:
+        print(f"Imported {convert_legacy()} entries into {MANIFEST_JSONL}")
+    if args.export:
+        print(f"Exported {export_legacy_json()} entries to {MANIFEST_JSON}")
+    if args.lookup:
+        print(json.dumps(ManifestIndex().get(args.lookup), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+"""
+POS-marker grammar of the Oxford 5000 export, shared by every script that
+cleans terms or repairs filenames derived from them.
+
+The raw export glues part-of-speech markers (and sometimes the next word)
+onto terms: "cut v.dad", "whose det./pron.", "close 1". The markers are
+listed once in POS_TAGS; every pattern below is built from that list and
+compiled at import, so term cleaning (clean_vocabulary.py) and audio
+filename repair (fix_audio_filenames.py) take the same fast path and cannot
+disagree about what a marker is.
+
+    normalize_text(text)       non-ASCII spaces/quotes -> ASCII
+    normalize_term(term)       normalize_text + strip + BROKEN_WORDS fix
+    split_terms(term)          "cut v.dad" -> ["cut", "dad"] (cleaned words)
+    clean_single_term(term)    strip sense numbers and trailing markers, or None
+    clean_translation(text)    strip markers / sense numbers from a Chinese meaning
+"""
+import re
+
+# POS patterns to strip from terms
+POS_TAGS = [
+    r'\s+adj\./adv\.',
+    r'\s+det\./pron\./adv\.',
+    r'\s+det\./pron\.',
+    r'\s+det\./number',
+    r'\s+conj\./prep\.',
+    r'\s+conj\./adv\.',
+    r'\s+prep\./adv\.',
+    r'\s+pron\./det\.',
+    r'\s+adj\./pron\.',
+    r'\s+adv\./prep\.',
+    r'\s+exclam\./n\.',
+    r'\s+number/det\.',
+    r'\s+n\./v\.',
+    r'\s+indefinite\s+article',
+    r'\s+definite\s+article',
+    r'\s+infinitive\s+marker',
+    r'\s+modal\s+v\.',
+    r'\s+modal',
+    r'\s+auxiliary',
+    r'\s+number',
+    r'\s+adj\.',
+    r'\s+adv\s*\.',
+    r'\s+adv\.',
+    r'\s+det\.',
+    r'\s+pron\.',
+    r'\s+prep\.',
+    r'\s+conj\.',
+    r'\s+exclam\.',
+    r'\s+n\.',
+    r'\s+v\s*\.',
+    r'\s+v\.',
+]
+
+# Standalone POS abbreviations (entire term is just a POS marker)
+SKIP_TERMS = {
+    'adj.', 'adv.', 'n.', 'v.', 'conj.', 'det.', 'prep.', 'pron.', 'exclam.',
+    'adj./adv.', 'det./pron.', 'n./v.', 'n.place', 'n.who', 'n.ethical',
+    'n.treasure', 'n.neighbouring', 'infinitive marker', 'auxiliary',
+}
+
+# POS_TAGS without the leading whitespace, and as one alternation in the same
+# order (the first marker that matches wins)
+POS_MARKERS = [p[len(r'\s+'):] for p in POS_TAGS]
+POS_ALTERNATION = '|'.join(POS_MARKERS)
+
+# A POS marker anywhere after whitespace (does this name/term carry one?)
+POS_PATTERN = re.compile(r'\s+(?:' + POS_ALTERNATION + r')')
+
+# Merged entries: word + POS_MARKER + nextword, matched at a position in the term
+# e.g. "cut v.dad", "sandwich n.Saturday", "bright adj.brilliant"
+MERGE_PATTERN = re.compile(r'(\S+)\s+(?:' + POS_ALTERNATION + r')\s*')
+
+# Trailing POS marker; the group name is the marker's index in POS_TAGS.
+# POS_TAGS lists compound markers before their parts ('modal v.' before 'v.'),
+# so the leftmost match is also the first pattern in list order.
+POS_TAIL = re.compile(
+    r'\s+(?:' + '|'.join(f'(?P<p{i}>{marker})' for i, marker in enumerate(POS_MARKERS)) + r')\s*$'
+)
+POS_TAIL_PATTERNS = [re.compile(p + r'\s*$') for p in POS_TAGS]
+
+SENSE_NUMBER = re.compile(r'\s*\d+\s*$')         # "close 1" -> "close"
+SENSE_SUFFIX = re.compile(r'(\D)\d+$')            # "live1" -> "live", "can2" -> "can"
+POS_ONLY = re.compile(r'^(adj|adv|n|v|det|pron|prep|conj|exclam)\.?$')
+POS_FRAGMENT = re.compile(r'^/?(?:adj|adv|n|v|det|pron|prep|conj|exclam)\.?/?\.?$')
+
+# Known broken words to fix (whole terms, filename stems and each split-off word)
+BROKEN_WORDS = {
+    'reven ge': 'revenge',
+    'allright': 'all right',
+    'second 1 det./': 'second',
+    'second 1 det.': 'second',
+    'recount 1': 'recount',
+}
+
+TRANSLATION_POS = re.compile(
+    r'\s*(?:adj\.|adv\.|det\.|pron\.|prep\.|conj\.|exclam\.|n\.|v\.)'
+    r'(?:/(?:adj\.|adv\.|det\.|pron\.|prep\.|conj\.|exclam\.|n\.|v\.))*\s*$')
+TRANSLATION_POS_CJK = re.compile(
+    r'\s*(?:adj|adv|det|pron|prep|conj|exclam)\.'
+    r'(?:/(?:adj|adv|det|pron|prep|conj|exclam)\.?)*[。]?\s*$')
+TRANSLATION_POS_MIXED = re.compile(
+    r'\s*(?:adj|adv|det|pron|prep|conj|exclam)\.'
+    r'(?:/[^\s]+)*[。.]?\s*$')
+TRANSLATION_SENSE = re.compile(r'\s*\d+\s*(?:检测|det)/?\.?\s*$')
+TRAILING_COMMA = re.compile(r'[，,]\s*$')
+
+
+def normalize_text(text):
+    """Fix non-ASCII characters"""
+    text = text.replace('\u00a0', ' ')  # Non-breaking space -> regular space
+    text = text.replace('\u2019', "'")  # Right single quotation mark -> apostrophe
+    text = text.replace('\u2018', "'")  # Left single quotation mark -> apostrophe
+    text = text.replace('\u201c', '"')  # Left double quotation mark
+    text = text.replace('\u201d', '"')  # Right double quotation mark
+    return text
+
+
+def normalize_term(term):
+    """Raw term or filename stem -> ASCII, stripped, known breakages fixed."""
+    term = normalize_text(term.strip())
+    return BROKEN_WORDS.get(term, term)
+
+
+def has_sense_number(term):
+    """True for 'close 1', 'live1' (a trailing number after a non-digit)."""
+    return SENSE_SUFFIX.search(term) is not None
+
+
+def split_terms(term):
+    """Split a merged term like 'cut v.dad' into individual cleaned words"""
+    term = normalize_term(term)
+
+    # Skip standalone POS abbreviations
+    if term in SKIP_TERMS:
+        return []
+
+    # Walk the term once: word + POS marker pairs, then whatever is left
+    results = []
+    pos = 0
+    end = len(term)
+
+    while pos < end:
+        m = MERGE_PATTERN.match(term, pos)
+        if not m:
+            # No more merges detected, clean the remaining term
+            results.append(clean_single_term(term[pos:]))
+            break
+        word = m.group(1)
+        if word not in SKIP_TERMS:
+            results.append(clean_single_term(word))
+        pos = m.end()
+
+    return [r for r in results if r]
+
+
+def strip_pos_tags(term):
+    """Strip trailing POS markers, as if each POS_TAGS pattern were applied once, in order."""
+    term = term.strip()
+    start = 0
+    while True:
+        m = POS_TAIL.search(term)
+        if not m:
+            return term
+        index = int(m.lastgroup[1:])
+        if index < start:
+            break
+        term = term[:m.start()].strip()
+        start = index + 1
+    # The term now ends with a marker earlier in POS_TAGS than one already
+    # removed (e.g. "x modal v. adj."): finish with the remaining patterns in order
+    for pattern in POS_TAIL_PATTERNS[start:]:
+        term = pattern.sub('', term).strip()
+    return term
+
+
+def clean_single_term(term):
+    """Clean a single term: remove POS markers, sense numbers, etc."""
+    term = term.strip()
+    term = BROKEN_WORDS.get(term, term)
+
+    if not term:
+        return None
+
+    if term in SKIP_TERMS:
+        return None
+
+    # Remove sense disambiguator numbers (e.g. "close 1", "live1", "can2")
+    term = SENSE_NUMBER.sub('', term)
+    term = SENSE_SUFFIX.sub(r'\1', term)
+
+    term = strip_pos_tags(term)
+
+    # Remove trailing dots that are POS remnants (but keep real abbreviations like "o'clock")
+    if term.endswith('.') and not term.endswith("o'clock"):
+        # Check if it's a POS abbreviation
+        if POS_ONLY.match(term):
+            return None
+
+    term = term.strip()
+
+    # Skip if result is empty or just punctuation
+    if not term or not any(c.isalpha() for c in term):
+        return None
+
+    # Skip remaining POS fragments (e.g. "/adj.", "adj", "/adv.")
+    if POS_FRAGMENT.match(term):
+        return None
+
+    # Skip all-uppercase non-words (FALSE, TRUE, etc.) unless they're acronyms
+    if term.isupper() and len(term) > 2:
+        return None
+
+    return term
+
+
+def clean_translation(translation):
+    """Remove POS markers and other junk from translation text"""
+    if not translation:
+        return ''
+    t = translation.strip()
+    # Remove POS markers from translations
+    # e.g. "每个 det./pron./adv." -> "每个"
+    # e.g. "好吧，adj./adv." -> "好吧"
+    # e.g. "单独 adj./adv." -> "单独"
+    # e.g. "谁的det./pron。" -> "谁的"
+    # e.g. "much det./代词。" -> "much"  (this is a bad translation, will be overridden)
+    t = TRANSLATION_POS.sub('', t)
+    # Also catch Chinese-punctuated versions (e.g. "谁的det./pron。")
+    t = TRANSLATION_POS_CJK.sub('', t)
+    # Catch "much det./代词。" pattern (POS marker + Chinese POS)
+    t = TRANSLATION_POS_MIXED.sub('', t)
+    # Remove sense numbers from translations (e.g. "第二个 1 检测/" -> "第二个")
+    t = TRANSLATION_SENSE.sub('', t)
+    t = TRAILING_COMMA.sub('', t)  # Remove trailing comma
+    # Remove sense numbers from end of translation (e.g. "关闭 1" -> "关闭", "做1" -> "做")
+    t = SENSE_NUMBER.sub('', t)
+    return t.strip()
@@ -0,0 +1,46 @@
+"""
+Golden test for clean_vocabulary.py: cleaning the committed source CSV
+(oxford_5000_merged_total_translated.csv) must reproduce the committed
+oxford_5000_cleaned.csv row for row, serially, with worker processes and
+in streaming mode.
+
+    python -m pytest words/test_clean_vocabulary.py
+"""
+import pytest
+
+from clean_vocabulary import CSV_FIELDS, CSV_PATH, OUTPUT_CSV, clean_rows, read_rows, stream_clean
+from translation_store import TranslationStore
+
+
+def csv_rows(entries):
+    return [{field: entry[field] for field in CSV_FIELDS} for entry in entries]
+
+
+def assert_rows_equal(cleaned, golden):
+    assert len(cleaned) == len(golden)
+    mismatches = [(i, got, want) for i, (got, want) in enumerate(zip(cleaned, golden)) if got != want]
+    assert not mismatches, f"{len(mismatches)} rows differ, first: {mismatches[0]}"
+
+
+@pytest.fixture(scope='module')
+def golden():
+    return list(read_rows(OUTPUT_CSV))
+
+
+@pytest.fixture(scope='module')
+def store(tmp_path_factory):
+    # Built in a temp dir so the test never touches words/translations.sqlite
+    with TranslationStore(path=str(tmp_path_factory.mktemp('store') / 'translations.sqlite')) as s:
+        yield s
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_clean_rows_matches_committed_csv(golden, store, workers):
+    cleaned = csv_rows(clean_rows(read_rows(CSV_PATH), {}, set(), workers=workers, store=store))
+    assert_rows_equal(cleaned, golden)
+
+
+def test_stream_clean_matches_committed_csv(golden, store, tmp_path):
+    output_csv = tmp_path / 'cleaned.csv'
+    stream_clean(CSV_PATH, str(output_csv), store=store)
+    assert_rows_equal(list(read_rows(str(output_csv))), golden)
@@ -0,0 +1,84 @@
+"""
+generate_concurrently() against a local fake synthesizer: output names,
+failure capture for tts_failed.txt, and that requests really overlap.
+
+    python -m pytest words/test_tts_lib.py
+"""
+import os
+import threading
+import time
+
+from tts_lib import generate_concurrently, write_failed_words
+
+LATENCY = 0.1
+WORDS = ['apple', 'bad', 'cat', 'dog', 'boom', 'egg', 'fish', 'goat']
+FAILS = {'bad'}     # synthesize() returns False
+RAISES = {'boom'}   # synthesize() raises
+
+
+class FakeSynthesizer:
+    """Sleeps LATENCY per word and writes the word into its file; tracks peak concurrency."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def __call__(self, word, output_path):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(word)
+        try:
+            # Later words finish first, so completion order differs from input order
+            time.sleep(LATENCY * (1 + (len(WORDS) - WORDS.index(word)) / len(WORDS)))
+            if word in RAISES:
+                raise RuntimeError('simulated backend error')
+            if word in FAILS:
+                return False
+            with open(output_path, 'wb') as f:
+                f.write(word.encode('utf-8'))
+            return True
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_outputs_failures_and_concurrency(tmp_path):
+    fake = FakeSynthesizer()
+    success, failed, skipped, elapsed = generate_concurrently(WORDS, str(tmp_path), fake, max_workers=4)
+
+    good = [w for w in WORDS if w not in FAILS | RAISES]
+    assert success == len(good)
+    assert failed == ['bad', 'boom']  # input order, not completion order
+    assert skipped == []
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{w}.wav" for w in good)
+    for w in good:
+        assert (tmp_path / f"{w}.wav").read_bytes() == w.encode('utf-8')
+
+    assert fake.calls[:4] == WORDS[:4]  # started in input (priority) order
+    assert fake.peak == 4
+    serial = sum(LATENCY * (1 + (len(WORDS) - i) / len(WORDS)) for i in range(len(WORDS)))
+    assert elapsed < serial / 2
+
+    failed_file = write_failed_words(str(tmp_path / 'tts_failed.txt'), failed)
+    with open(failed_file, 'r', encoding='utf-8') as f:
+        assert f.read() == 'bad\nboom\n'
+
+
+def test_single_worker_is_serial(tmp_path):
+    fake = FakeSynthesizer()
+    success, failed, _, _ = generate_concurrently(WORDS, str(tmp_path), fake, max_workers=1)
+    assert fake.peak == 1
+    assert fake.calls == WORDS
+    assert success == len(WORDS) - 2
+    assert failed == ['bad', 'boom']
+
+
+def test_deadline_skips_unstarted_words(tmp_path):
+    fake = FakeSynthesizer()
+    success, failed, skipped, _ = generate_concurrently(
+        WORDS, str(tmp_path), fake, max_workers=2, deadline=time.monotonic() - 1)
+    assert (success, failed, fake.calls) == (0, [], [])
+    assert skipped == WORDS
@@ -0,0 +1,196 @@
+"""
+Translation store shared by the vocabulary cleaner and the wordbook generators.
+
+Every Chinese meaning a generator can fall back to lives in one SQLite file
+(words/translations.sqlite, not committed), built from:
+
+    oxford_5000_cleaned.csv      layer 'oxford'   clean_vocabulary.py output,
+                                                  keyed on the lowercase term
+    translation_fallbacks.csv    layers 'clean'   clean_vocabulary.py fill-ins
+                                        'topic'   generate_topic_wordbooks.py
+                                        'scene'   generate_scene_wordbooks.py
+                                        'cet'     generate_cet_wordbooks.py
+                                 (an empty translation marks a word to drop)
+
+Rows are indexed on the lowercase term: one query returns every layer's
+candidates for a word, and the caller names the layers to consult in
+priority order. Within a layer the exact spelling wins over the lowercase
+form ('Saturday' before 'saturday'); the first row of a (layer, term) wins.
+Candidates are memoized in an in-process LRU cache, so each distinct word
+costs at most one indexed query.
+
+    store = TranslationStore()
+    store.lookup('algorithm', ('oxford', 'topic'))   # -> '算法', None if no layer has it
+
+The database is rebuilt when a source CSV changes (size + mtime, like the
+manifest .idx sidecar), or explicitly:
+
+    python words/translation_store.py --build
+    python words/translation_store.py --lookup Saturday --layers clean
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import tempfile
+from functools import lru_cache
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OXFORD_CSV = os.path.join(SCRIPT_DIR, 'oxford_5000_cleaned.csv')
+FALLBACKS_CSV = os.path.join(SCRIPT_DIR, 'translation_fallbacks.csv')
+STORE_PATH = os.path.join(SCRIPT_DIR, 'translations.sqlite')
+
+LAYERS = ('oxford', 'clean', 'topic', 'scene', 'cet')
+CACHE_SIZE = 1 << 16
+SCHEMA_VERSION = 1
+
+# lookup() result for a word its layer lists with an empty translation
+SKIP = object()
+
+
+def source_stamp(oxford_csv=OXFORD_CSV, fallbacks_csv=FALLBACKS_CSV):
+    """Schema version + size/mtime of every source; the store is rebuilt when this changes."""
+    parts = [f"v{SCHEMA_VERSION}"]
+    for path in (oxford_csv, fallbacks_csv):
+        try:
+            st = os.stat(path)
+            parts.append(f"{os.path.basename(path)}:{st.st_size}:{st.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{os.path.basename(path)}:missing")
+    return ';'.join(parts)
+
+
+def iter_sources(oxford_csv=OXFORD_CSV, fallbacks_csv=FALLBACKS_CSV):
+    """(layer, term, translation) rows of every source; translation is None for a skipped word."""
+    if os.path.exists(oxford_csv):
+        with open(oxford_csv, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                translation = row['translation'].strip()
+                if translation:
+                    yield 'oxford', row['term'].strip().lower(), translation
+    with open(fallbacks_csv, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield row['layer'], row['term'], row['translation'] or None
+
+
+def build_store(path=STORE_PATH, oxford_csv=OXFORD_CSV, fallbacks_csv=FALLBACKS_CSV):
+    """(Re)build the SQLite store from the source CSVs; returns the row count."""
+    stamp = source_stamp(oxford_csv, fallbacks_csv)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp-', suffix='.sqlite')
+    os.close(fd)
+    try:
+        db = sqlite3.connect(tmp)
+        try:
+            db.executescript("""
+                CREATE TABLE translations (
+                    layer TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    term_lower TEXT NOT NULL,
+                    translation TEXT,
+                    PRIMARY KEY (layer, term)
+                ) WITHOUT ROWID;
+                CREATE INDEX translations_term_lower ON translations (term_lower);
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            """)
+            db.executemany(
+                'INSERT OR IGNORE INTO translations VALUES (?, ?, ?, ?)',
+                ((layer, term, term.lower(), translation)
+                 for layer, term, translation in iter_sources(oxford_csv, fallbacks_csv)))
+            db.execute("INSERT INTO meta VALUES ('stamp', ?)", (stamp,))
+            db.commit()
+            count = db.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        finally:
+            db.close()
+        os.chmod(tmp, 0o644)  # mkstemp creates files as 0600
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return count
+
+
+def stored_stamp(path=STORE_PATH):
+    """Stamp the store at path was built from, or None if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        db = sqlite3.connect(path)
+        try:
+            row = db.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+        finally:
+            db.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+class TranslationStore:
+    """Layered lookup of translations in the SQLite store, rebuilt first if a source changed."""
+
+    def __init__(self, path=STORE_PATH, oxford_csv=OXFORD_CSV, fallbacks_csv=FALLBACKS_CSV,
+                 cache_size=CACHE_SIZE):
+        self.path = path
+        if stored_stamp(path) != source_stamp(oxford_csv, fallbacks_csv):
+            build_store(path, oxford_csv, fallbacks_csv)
+        self.db = sqlite3.connect(path)
+        self._candidates = lru_cache(maxsize=cache_size)(self._query)
+
+    def _query(self, term_lower):
+        rows = self.db.execute(
+            'SELECT layer, term, translation FROM translations WHERE term_lower = ?', (term_lower,))
+        return {(layer, term): translation for layer, term, translation in rows}
+
+    def lookup(self, word, layers=LAYERS, default=None):
+        """Translation of word from the first of layers that has it, SKIP if that row is empty."""
+        word_lower = word.lower()
+        candidates = self._candidates(word_lower)
+        if not candidates:
+            return default
+        for layer in layers:
+            for term in (word, word_lower):
+                if (layer, term) in candidates:
+                    translation = candidates[(layer, term)]
+                    return SKIP if translation is None else translation
+        return default
+
+    def count(self, layer):
+        """Number of words in one layer."""
+        return self.db.execute('SELECT COUNT(*) FROM translations WHERE layer = ?', (layer,)).fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the shared translation store')
+    parser.add_argument('--build', action='store_true', help='Rebuild translations.sqlite from the source CSVs')
+    parser.add_argument('--lookup', metavar='WORD', action='append', default=[], help='Print the translation of WORD (repeatable)')
+    parser.add_argument('--layers', default=','.join(LAYERS),
+                        help=f"Comma-separated layers in priority order (default: {','.join(LAYERS)})")
+    args = parser.parse_args()
+
+    if args.build:
+        print(f"Built {STORE_PATH}: {build_store()} translations")
+    if args.lookup:
+        layers = tuple(layer.strip() for layer in args.layers.split(',') if layer.strip())
+        with TranslationStore() as store:
+            for word in args.lookup:
+                translation = store.lookup(word, layers)
+                if translation is SKIP:
+                    translation = '(skipped)'
+                print(f"{word}\t{translation if translation is not None else '(not found)'}")
+    if not args.build and not args.lookup:
+        with TranslationStore() as store:
+            for layer in LAYERS:
+                print(f"  {layer:8} {store.count(layer):>6} words")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+Pluggable TTS backends.
+
+Every backend implements:
+    synthesize(ssml, voice_name) -> (wav_bytes, metadata)
+    list_voices(language_code)   -> [Voice(name, gender), ...]
+
+wav_bytes is always a mono 16-bit LINEAR16 WAV, so the cache, journal,
+batch splitting and manifest logic are identical whichever backend is used.
+
+Backends:
+- google: Google Cloud TTS (Chirp 3 HD). Needs credentials and network.
+- local:  deterministic offline synthesizer (tones + silence derived from the
+          SSML), for exercising and load-testing the pipeline on a plain box.
+          --local-latency simulates per-request network latency.
+- espeak: espeak-ng / espeak if installed, for audible offline output.
+
+Usage:
+    backend = get_backend('local', latency=0.2)
+    wav, meta = backend.synthesize('<speak>apple<break time="300ms"/></speak>', 'en-US-Chirp3-HD-Zephyr')
+"""
+import hashlib
+import io
+import math
+import re
+import shutil
+import subprocess
+import time
+import wave
+from array import array
+from collections import namedtuple
+
+GOOGLE_CLOUD_PROJECT_ID = 'gen-lang-client-0153103557'
+LOCAL_SAMPLE_RATE = 24000
+
+Voice = namedtuple('Voice', 'name gender')
+
+BREAK_RE = re.compile(r'<break\s+time="(\d+)(ms|s)"\s*/>')
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def ssml_segments(ssml):
+    """Yield ('text', str) and ('break', milliseconds) parts of a simple SSML document."""
+    pos = 0
+    for m in BREAK_RE.finditer(ssml):
+        text = TAG_RE.sub('', ssml[pos:m.start()]).strip()
+        if text:
+            yield 'text', text
+        value = int(m.group(1))
+        yield 'break', value * 1000 if m.group(2) == 's' else value
+        pos = m.end()
+    text = TAG_RE.sub('', ssml[pos:]).strip()
+    if text:
+        yield 'text', text
+
+
+def pcm_to_wav(samples, sample_rate):
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+class GoogleBackend:
+    """Google Cloud Text-to-Speech (one shared client, thread-safe)."""
+
+    name = 'google'
+    sample_rate = 24000  # LINEAR16 output of the Chirp 3 HD voices
+
+    def __init__(self, project_id=GOOGLE_CLOUD_PROJECT_ID, language_code='en-US'):
+        # Imported here so the local backends work without the Google libraries installed
+        from google.cloud import texttospeech
+        from google.api_core import client_options
+
+        self.tts = texttospeech
+        self.language_code = language_code
+        # Explicitly set the quota project to handle ADC issues
+        options = client_options.ClientOptions(quota_project_id=project_id)
+        self.client = texttospeech.TextToSpeechClient(client_options=options)
+
+    def list_voices(self, language_code):
+        return [Voice(v.name, v.ssml_gender.name)
+                for v in self.client.list_voices(language_code=language_code).voices]
+
+    def synthesize(self, ssml, voice_name):
+        tts = self.tts
+        response = self.client.synthesize_speech(request={
+            "input": tts.SynthesisInput(ssml=ssml),
+            "voice": tts.VoiceSelectionParams(language_code=self.language_code, name=voice_name),
+            "audio_config": tts.AudioConfig(audio_encoding=tts.AudioEncoding.LINEAR16),
+        })
+        return response.audio_content, {'backend': self.name, 'voice': voice_name}
+
+
+class LocalToneBackend:
+    """Deterministic offline synthesizer.
+
+    Each text run becomes a tone whose pitch is derived from a hash of the
+    text and whose length grows with the number of letters; <break> tags
+    become digital silence. Same input -> byte-identical output.
+    """
+
+    name = 'local'
+
+    def __init__(self, latency=0.0, sample_rate=LOCAL_SAMPLE_RATE):
+        self.latency = latency
+        self.sample_rate = sample_rate
+
+    def list_voices(self, language_code):
+        return [Voice(f'{language_code}-Chirp3-HD-Zephyr', 'FEMALE'),
+                Voice(f'{language_code}-Local-Tone', 'NEUTRAL')]
+
+    def tone(self, text):
+        seed = int(hashlib.md5(text.encode('utf-8')).hexdigest()[:8], 16)
+        freq = 180 + seed % 240
+        n = self.sample_rate * (150 + 70 * sum(c.isalnum() for c in text)) // 1000
+        fade = min(n // 4, self.sample_rate // 100)
+        step = 2 * math.pi * freq / self.sample_rate
+        samples = array('h', bytes(2 * n))
+        for i in range(n):
+            env = min(1.0, i / fade, (n - i) / fade) if fade else 1.0
+            samples[i] = int(9000 * env * math.sin(step * i))
+        return samples
+
+    def synthesize(self, ssml, voice_name):
+        if self.latency:
+            time.sleep(self.latency)
+        samples = array('h')
+        for kind, value in ssml_segments(ssml):
+            if kind == 'break':
+                samples.extend(array('h', bytes(2 * (self.sample_rate * value // 1000))))
+            else:
+                samples.extend(self.tone(value))
+        return pcm_to_wav(samples, self.sample_rate), {'backend': self.name, 'voice': voice_name}
+
+
+class EspeakBackend:
+    """espeak-ng / espeak command-line engine (SSML input via -m)."""
+
+    name = 'espeak'
+    sample_rate = 0  # 22050 Hz from espeak-ng; varies by build, so the quality gate accepts any rate
+
+    def __init__(self):
+        self.exe = shutil.which('espeak-ng') or shutil.which('espeak')
+        if not self.exe:
+            raise RuntimeError("espeak-ng / espeak not found on PATH")
+
+    def list_voices(self, language_code):
+        return [Voice(language_code.split('-')[0], 'NEUTRAL')]
+
+    def synthesize(self, ssml, voice_name):
+        voice = voice_name if '-' not in voice_name else 'en-us'
+        result = subprocess.run([self.exe, '-m', '-v', voice, '--stdout', ssml],
+                                capture_output=True, check=True)
+        return result.stdout, {'backend': self.name, 'voice': voice}
+
+
+BACKENDS = {
+    'google': GoogleBackend,
+    'local': LocalToneBackend,
+    'espeak': EspeakBackend,
+}
+
+
+def get_backend(name, **options):
+    """Instantiate a backend by name ('google', 'local', 'espeak')."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend '{name}' (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name](**options)
@@ -0,0 +1,128 @@
+"""
+Multi-word SSML batching for TTS generation.
+
+Single-word requests are dominated by per-request overhead, so batching
+mode packs N words into one SSML document separated by long breaks:
+
+    <speak>apple<break time="1200ms"/>banana<break time="1200ms"/>...</speak>
+
+The returned LINEAR16 WAV is split back into per-word clips by silence
+detection. A split is only accepted if it yields exactly one voiced segment
+per word; otherwise BatchSplitError is raised and the caller falls back to
+one request per word for that batch.
+
+Each clip keeps a short lead-in and the same 300ms tail the single-word
+SSML template adds, so batched and single-word files play the same way.
+"""
+import io
+import math
+import wave
+from array import array
+from xml.sax.saxutils import escape
+
+DEFAULT_BATCH_BREAK_MS = 1200
+FRAME_MS = 10
+# Silence must last at least this fraction of the inserted break to count as a word boundary
+MIN_GAP_FRACTION = 0.6
+SILENCE_DBFS = -45.0
+LEAD_MS = 50
+TAIL_MS = 300
+
+
+class BatchSplitError(Exception):
+    """Raised when a batch response cannot be split into one clip per word."""
+
+
+def batch_template(break_ms=DEFAULT_BATCH_BREAK_MS):
+    """Identifier of the batch SSML layout, used in cache keys / journal hashes."""
+    return f'batch:<speak>{{text}}<break time="{break_ms}ms"/>...</speak>'
+
+
+def build_batch_ssml(words, break_ms=DEFAULT_BATCH_BREAK_MS):
+    parts = [escape(w) for w in words]
+    body = f'<break time="{break_ms}ms"/>'.join(parts)
+    return f'<speak>{body}<break time="{TAIL_MS}ms"/></speak>'
+
+
+def read_wav(data):
+    """Parse WAV bytes -> (params, samples as array('h'))."""
+    with wave.open(io.BytesIO(data), 'rb') as w:
+        params = w.getparams()
+        if params.sampwidth != 2 or params.nchannels != 1:
+            raise BatchSplitError(f"expected mono 16-bit PCM, got {params.nchannels}ch/{8 * params.sampwidth}bit")
+        samples = array('h')
+        samples.frombytes(w.readframes(params.nframes))
+    return params, samples
+
+
+def write_wav(params, samples):
+    """Build WAV bytes from params and an array('h') of samples."""
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(params.framerate)
+        w.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+def voiced_frames(samples, sample_rate, threshold_dbfs=SILENCE_DBFS):
+    """Return one bool per FRAME_MS frame: True if the frame RMS is above the threshold."""
+    frame_len = max(1, sample_rate * FRAME_MS // 1000)
+    threshold = 32768 * 10 ** (threshold_dbfs / 20)
+    limit = threshold * threshold * frame_len
+    flags = []
+    for start in range(0, len(samples), frame_len):
+        frame = samples[start:start + frame_len]
+        flags.append(sum(x * x for x in frame) > limit)
+    return flags, frame_len
+
+
+def find_segments(samples, sample_rate, min_gap_ms):
+    """Return (start, end) sample ranges of voiced regions separated by >= min_gap_ms of silence."""
+    flags, frame_len = voiced_frames(samples, sample_rate)
+    min_gap = max(1, math.ceil(min_gap_ms / FRAME_MS))
+    segments = []
+    seg_start = None
+    last_voiced = None
+    for i, voiced in enumerate(flags):
+        if not voiced:
+            continue
+        if seg_start is None:
+            seg_start = i
+        elif i - last_voiced - 1 >= min_gap:
+            segments.append((seg_start, last_voiced + 1))
+            seg_start = i
+        last_voiced = i
+    if seg_start is not None:
+        segments.append((seg_start, last_voiced + 1))
+    return [(s * frame_len, min(len(samples), e * frame_len)) for s, e in segments]
+
+
+def split_batch(words, wav_bytes, break_ms=DEFAULT_BATCH_BREAK_MS):
+    """Split a batch response into per-word WAV bytes, in the order of words."""
+    params, samples = read_wav(wav_bytes)
+    rate = params.framerate
+    segments = find_segments(samples, rate, break_ms * MIN_GAP_FRACTION)
+    if len(segments) != len(words):
+        raise BatchSplitError(f"expected {len(words)} segments, found {len(segments)}")
+
+    lead = rate * LEAD_MS // 1000
+    tail = rate * TAIL_MS // 1000
+    clips = []
+    for start, end in segments:
+        clip = samples[max(0, start - lead):min(len(samples), end)]
+        # Pad the tail with digital silence rather than borrowing from the next word's lead-in
+        clip.extend(array('h', bytes(2 * tail)))
+        clips.append(write_wav(params, clip))
+    return clips
+
+
+def synthesize_batch(words, request_fn, break_ms=DEFAULT_BATCH_BREAK_MS):
+    """Synthesize words in one request and split the result.
+
+    request_fn(ssml) -> WAV bytes performs the actual API call.
+    Raises BatchSplitError if the segment count does not match.
+    """
+    ssml = build_batch_ssml(words, break_ms)
+    return split_batch(words, request_fn(ssml), break_ms)
@@ -0,0 +1,103 @@
+"""
+Content-addressed store for synthesized audio.
+
+The key of every blob is the hash of the full synthesis request (text, voice,
+SSML template, encoding, backend - see tts_journal.input_hash), not the output
+filename. So:
+- changing the voice or the SSML padding is a cache miss, even if
+  {word}.wav already exists on disk
+- the same request under different filenames (e.g. copies made by
+  fix_audio_filenames.py, or the same word in several wordbooks) is
+  synthesized once and materialized as many times as needed
+
+Layout:
+    tts_delivery/cache/blobs/ab/abcdef....wav
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+from tts_journal import input_hash
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'cache')
+
+
+def request_key(text, voice_name, ssml_template, encoding='LINEAR16', backend='google'):
+    """Cache key for one synthesis request."""
+    return input_hash(text, voice_name, ssml_template, encoding, backend)
+
+
+def atomic_write(path, data):
+    """Write bytes to path via a temp file + rename, so readers never see a partial file."""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates files as 0600
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class AudioCache:
+    """Blob store keyed by request hash, with hit/miss counters."""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key):
+        return os.path.join(self.blob_dir, key[:2], f"{key}.wav")
+
+    def get(self, key):
+        """Return the blob path for key, or None (counts as a miss)."""
+        path = self.path_for(key)
+        with self.lock:
+            if os.path.exists(path):
+                self.hits += 1
+                return path
+            self.misses += 1
+        return None
+
+    def put(self, key, data):
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, data)
+        return path
+
+    def discard(self, key):
+        """Drop the blob for key (e.g. audio that failed the quality gate)."""
+        try:
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def materialize(self, key, output_path):
+        """Place the blob for key at output_path (hardlink, falling back to copy)."""
+        src = self.path_for(key)
+        if os.path.exists(output_path) and os.path.samefile(src, output_path):
+            return output_path
+        directory = os.path.dirname(output_path) or '.'
+        tmp = os.path.join(directory, f".tmp-{os.getpid()}-{threading.get_ident()}-{key[:16]}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, output_path)
+        return output_path
+
+    def summary(self):
+        total = self.hits + self.misses
+        rate = 100 * self.hits / total if total else 0
+        return f"hits={self.hits} misses={self.misses} ({rate:.1f}% reused)"
@@ -0,0 +1,112 @@
+"""
+Write-ahead job journal for resumable TTS batch runs.
+
+The journal is an append-only JSON Lines file. Every word gets a 'pending'
+record before its request is sent and a 'done' / 'failed' record afterwards,
+each carrying the content hash of the synthesis inputs (text, voice, SSML
+template, encoding). Replaying the file gives the latest state per output
+filename, so a killed run can be resumed and only entries whose inputs
+changed are synthesized again.
+
+The manifest entry for each word is stored in its 'done' record, so
+words_manifest.json can be rebuilt from the journal at any point:
+    python words/generate_tts.py --rebuild-manifest
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+def input_hash(text, voice_name, ssml_template, encoding='LINEAR16', backend='google'):
+    """Hash of everything that determines the synthesized audio."""
+    fields = [text, voice_name, ssml_template, encoding]
+    if backend != 'google':
+        # Kept out of the payload for Google so hashes from earlier runs stay valid
+        fields.append(backend)
+    payload = json.dumps(fields, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TtsJournal:
+    """Append-only per-word status log, replayed into memory on open."""
+
+    def __init__(self, path):
+        self.path = path
+        self.state = {}  # filename -> latest record
+        self.lock = threading.Lock()
+        self._replay()
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self.fh = open(path, 'a', encoding='utf-8')
+        if self.fh.tell() and not self._ends_with_newline():
+            self.fh.write('\n')
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash mid-write
+                    continue
+                self.state[rec['filename']] = rec
+
+    def is_done(self, filename, digest, output_path=None):
+        """True if filename was produced from the same inputs (and still exists)."""
+        rec = self.state.get(filename)
+        if not rec or rec['status'] != 'done' or rec['hash'] != digest:
+            return False
+        return output_path is None or os.path.exists(output_path)
+
+    def record(self, filename, status, digest, **fields):
+        rec = {'filename': filename, 'status': status, 'hash': digest, 'ts': round(time.time(), 3)}
+        rec.update(fields)
+        line = json.dumps(rec, ensure_ascii=False)
+        with self.lock:
+            self.fh.write(line + '\n')
+            self.fh.flush()
+            os.fsync(self.fh.fileno())
+            self.state[filename] = rec
+        return rec
+
+    def counts(self):
+        result = {}
+        for rec in self.state.values():
+            result[rec['status']] = result.get(rec['status'], 0) + 1
+        return result
+
+    def close(self):
+        self.fh.close()
+
+
+def rebuild_manifest(journal_path):
+    """Return manifest entries for every 'done' word, in first-seen order."""
+    order = []
+    latest = {}
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if rec['filename'] not in latest:
+                order.append(rec['filename'])
+            latest[rec['filename']] = rec
+    return [latest[fn]['entry'] for fn in order
+            if latest[fn]['status'] == 'done' and 'entry' in latest[fn]]
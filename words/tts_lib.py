@@ -0,0 +1,350 @@
+"""
+Shared TTS library used by generate_tts.py and generate_missing_audio.py.
+
+Owns everything both generators need, so performance work lands once:
+1. Backend construction and reuse (one client per backend/options per process)
+2. Voice resolution (exact match, then substring, then display-name fallback)
+   over a voice catalog cached in memory and on disk (TTL, per language)
+3. synthesize_text() / synthesize_batch_to_files(): cache lookup, rate-limited
+   request, atomic write to disk, optional quality gate (audio_quality.py)
+4. generate_concurrently(): bounded worker pool over many words
+5. add_tts_arguments() / setup_pipeline(): the common CLI flags
+
+Building blocks live in their own modules:
+    tts_backends.py   Google / local / espeak synthesizers
+    tts_ratelimit.py  token bucket + retry/backoff + AIMD
+    tts_cache.py      content-addressed audio store
+    tts_journal.py    resumable job journal
+    tts_batch.py      multi-word SSML batching and splitting
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tts_backends import BACKENDS, GOOGLE_CLOUD_PROJECT_ID, Voice, get_backend
+from tts_batch import DEFAULT_BATCH_BREAK_MS, batch_template, synthesize_batch
+from tts_cache import CACHE_DIR, AudioCache, atomic_write, request_key
+from tts_ratelimit import AdaptiveRateLimiter
+
+# --- Configuration ---
+LANGUAGE_CODE = 'en-US'
+# Primary target voice
+TARGET_VOICE_NAME = 'en-US-Chirp3-HD-Zephyr'
+# Fallback to look for if exact ID match fails (substring search)
+TARGET_VOICE_DISPLAY = 'Zephyr'
+# SSML wrapper: a small break at the end prevents audio cutoff
+SSML_TEMPLATE = '<speak>{text}<break time="300ms"/></speak>'
+DEFAULT_WORKERS = 4
+DEFAULT_QPS = 5.0
+DEFAULT_MAX_QPS = 20.0
+# Persisted list_voices() results, so batch runs skip the round trip at startup
+VOICE_CACHE_FILE = os.path.join(CACHE_DIR, 'voice_catalog.json')
+VOICE_CACHE_TTL = 7 * 24 * 3600
+
+_backends = {}
+_backends_lock = threading.Lock()
+_voices = {}
+_voice_indexes = {}
+_voices_lock = threading.Lock()
+
+
+def get_tts_backend(name='google', latency=0.0):
+    """Returns the shared backend instance for name, creating it on first use."""
+    key = (name, latency if name == 'local' else None)
+    with _backends_lock:
+        if key in _backends:
+            return _backends[key]
+        try:
+            if name == 'google':
+                backend = get_backend(name, project_id=GOOGLE_CLOUD_PROJECT_ID, language_code=LANGUAGE_CODE)
+            elif name == 'local':
+                backend = get_backend(name, latency=latency)
+            else:
+                backend = get_backend(name)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            print(f"Error initializing TTS backend '{name}': {e}")
+            if name == 'google':
+                print("Ensure you have authenticated using: gcloud auth application-default login")
+            return None
+        _backends[key] = backend
+        return backend
+
+
+class VoiceIndex:
+    """Voices of one language, indexed by full name and by '-' separated name token."""
+
+    def __init__(self, voices):
+        self.voices = list(voices)
+        self.by_name = {v.name: v for v in self.voices}
+        self.by_token = {}
+        for v in self.voices:
+            for token in v.name.split('-'):
+                self.by_token.setdefault(token, []).append(v)
+
+    def find(self, target_name):
+        """Exact name, then whole-token match (e.g. 'Zephyr'), then plain substring."""
+        if target_name in self.by_name:
+            return self.by_name[target_name], 'exact'
+        matches = self.by_token.get(target_name)
+        if matches:
+            return matches[0], 'related'
+        for v in self.voices:
+            if target_name in v.name:
+                return v, 'related'
+        return None, None
+
+
+def _read_voice_catalog(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def list_voices_cached(backend, language_code, ttl=VOICE_CACHE_TTL, path=VOICE_CACHE_FILE, refresh=False):
+    """Voice list for language_code, from memory, then the on-disk catalog, then the API.
+
+    The catalog is keyed by backend and language code; entries older than
+    ttl seconds are refetched. Returns a VoiceIndex.
+    """
+    key = (backend.name, language_code)
+    with _voices_lock:
+        if key in _voice_indexes and not refresh:
+            return _voice_indexes[key]
+
+        catalog = _read_voice_catalog(path)
+        entry = catalog.get(backend.name, {}).get(language_code)
+        if entry and not refresh and time.time() - entry['fetched'] < ttl:
+            voices = [Voice(*v) for v in entry['voices']]
+        else:
+            voices = backend.list_voices(language_code)
+            catalog.setdefault(backend.name, {})[language_code] = {
+                'fetched': round(time.time()),
+                'voices': [list(v) for v in voices],
+            }
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write(path, json.dumps(catalog, indent=1, ensure_ascii=False).encode('utf-8'))
+
+        index = VoiceIndex(voices)
+        _voice_indexes[key] = index
+        return index
+
+
+def find_voice(backend, language_code, target_name, refresh=False):
+    """Finds the requested voice ID."""
+    print(f"Searching for voice: {target_name} in {language_code}...")
+    index = list_voices_cached(backend, language_code, refresh=refresh)
+
+    # 1. Exact match, 2. related match (e.g. matching 'Zephyr' in name)
+    voice, kind = index.find(target_name)
+    if voice:
+        print(f"Found {'exact match' if kind == 'exact' else 'related voice'}: {voice.name}")
+        return voice.name
+
+    print(f"Voice '{target_name}' not found. Listing available {language_code} voices:")
+    for voice in index.voices:
+        print(f"- {voice.name} ({voice.gender})")
+
+    return None
+
+
+def resolve_voice(backend, language_code=LANGUAGE_CODE, target_name=TARGET_VOICE_NAME,
+                  fallback_name=TARGET_VOICE_DISPLAY, refresh=False):
+    """find_voice() with the display-name fallback, memoized per backend/language/target."""
+    key = (backend.name, language_code, target_name, fallback_name)
+    if key not in _voices or refresh:
+        voice_id = find_voice(backend, language_code, target_name, refresh)
+        if not voice_id and fallback_name:
+            # Try finding by display name (e.g. "Zephyr") if exact ID failed
+            voice_id = find_voice(backend, language_code, fallback_name)
+        _voices[key] = voice_id
+    return _voices[key]
+
+
+def request_audio(backend, ssml_text, voice_name, limiter=None):
+    """Sends one SSML synthesis request and returns the LINEAR16 WAV bytes."""
+    if limiter:
+        audio, _ = limiter.call(backend.synthesize, ssml_text, voice_name)
+    else:
+        audio, _ = backend.synthesize(ssml_text, voice_name)
+    return audio
+
+
+def store_audio(audio, output_path, cache=None, key=None):
+    """Writes synthesized audio to output_path, through the cache when enabled."""
+    if cache:
+        cache.put(key, audio)
+        cache.materialize(key, output_path)
+    else:
+        # Never write in place: output_path may be a hardlink into the cache
+        atomic_write(output_path, audio)
+
+
+def synthesize_text(backend, text, voice_name, output_path, limiter=None, cache=None, gate=None):
+    """Synthesizes speech using SSML with 300ms padding to prevent audio cutoff.
+
+    With a QualityGate the written clip is checked right away; a failing clip
+    is evicted from the cache and requested once more, then rejected (moved
+    aside and queued for retry) if it still fails.
+    """
+    # Identical requests (same text/voice/SSML) are served from the content-addressed cache
+    key = request_key(text, voice_name, SSML_TEMPLATE, backend=backend.name)
+    attempts = 2 if gate else 1
+    for attempt in range(attempts):
+        if attempt == 0 and cache and cache.get(key):
+            cache.materialize(key, output_path)
+        else:
+            try:
+                audio = request_audio(backend, SSML_TEMPLATE.format(text=text), voice_name, limiter)
+                store_audio(audio, output_path, cache, key)
+            except Exception as e:
+                print(f"  ERROR synthesizing '{text}': {e}")
+                return False
+        if not gate:
+            return True
+        problems = gate.check(output_path)
+        if not problems:
+            return True
+        if cache:
+            cache.discard(key)
+        print(f"  QUALITY '{text}': {'; '.join(problems)}")
+        if attempt + 1 < attempts:
+            with gate.lock:
+                gate.retried += 1
+    gate.reject(text, output_path, problems)
+    return False
+
+
+def synthesize_batch_to_files(backend, jobs, voice_name, limiter=None, cache=None,
+                              break_ms=DEFAULT_BATCH_BREAK_MS):
+    """Synthesizes several words with one request (see tts_batch.py).
+
+    jobs is a list of (word, output_path). Words already in the cache are
+    materialized directly; the rest are packed into one SSML document.
+    Raises BatchSplitError (or the API error) so the caller can fall back
+    to one request per word.
+    """
+    template = batch_template(break_ms)
+    todo = []
+    for word, output_path in jobs:
+        key = request_key(word, voice_name, template, backend=backend.name)
+        if cache and cache.get(key):
+            cache.materialize(key, output_path)
+        else:
+            todo.append((word, output_path, key))
+    if not todo:
+        return
+
+    words = [word for word, _, _ in todo]
+    clips = synthesize_batch(
+        words, lambda ssml: request_audio(backend, ssml, voice_name, limiter), break_ms
+    )
+    for (word, output_path, key), clip in zip(todo, clips):
+        store_audio(clip, output_path, cache, key)
+
+
+def generate_concurrently(words, audio_dir, synthesize, max_workers=DEFAULT_WORKERS, deadline=None):
+    """Synthesize words with up to max_workers requests in flight.
+
+    synthesize(word, output_path) -> bool does the actual work; callers bind it
+    to one shared backend (the Google gRPC client is thread-safe), and the
+    local backend or any fake can be used to exercise this loop without network.
+
+    Words are started in input order, so a priority-sorted list is served
+    highest-value first. If deadline (a time.monotonic() value) passes, words
+    not yet started are skipped rather than synthesized.
+
+    Output files are always {word}.wav regardless of completion order.
+    Returns (success_count, failed_words, skipped_words, elapsed_seconds), with
+    failed_words in input order so tts_failed.txt is stable between runs.
+    """
+    total = len(words)
+    failed = {}
+    skipped = {}
+    success = 0
+    done = 0
+    start = time.perf_counter()
+
+    def run(index, word):
+        output_path = os.path.join(audio_dir, f"{word}.wav")
+        if deadline is not None and time.monotonic() >= deadline:
+            return index, word, output_path, None
+        try:
+            ok = synthesize(word, output_path)
+        except Exception as e:
+            print(f"  ERROR synthesizing '{word}': {e}")
+            ok = False
+        return index, word, output_path, ok
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [pool.submit(run, i, w) for i, w in enumerate(words)]
+        for future in as_completed(futures):
+            index, word, output_path, ok = future.result()
+            if ok is None:
+                skipped[index] = word
+                continue
+            done += 1
+            progress = f"[{done}/{total}]"
+            if ok:
+                success += 1
+                size_kb = os.path.getsize(output_path) / 1024
+                print(f"{progress} {word}: OK ({size_kb:.1f} KB)")
+            else:
+                failed[index] = word
+                print(f"{progress} {word}: FAILED")
+
+    elapsed = time.perf_counter() - start
+    return (success, [failed[i] for i in sorted(failed)],
+            [skipped[i] for i in sorted(skipped)], elapsed)
+
+
+def write_failed_words(path, failed):
+    """Write the retry list (one word per line, in input order); returns path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(failed) + '\n')
+    return path
+
+
+def add_tts_arguments(parser):
+    """Adds the backend / rate limit / cache flags shared by every generator."""
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='google',
+                        help="TTS backend; 'local' is a deterministic offline synthesizer (default: google)")
+    parser.add_argument('--local-latency', type=float, default=0.0,
+                        help='Simulated seconds per request for the local backend (default: 0)')
+    parser.add_argument('--qps', type=float, default=DEFAULT_QPS,
+                        help=f'Initial request rate; adapts to throttling (default: {DEFAULT_QPS})')
+    parser.add_argument('--max-qps', type=float, default=DEFAULT_MAX_QPS,
+                        help=f'Upper bound for the adaptive request rate (default: {DEFAULT_MAX_QPS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the content-addressed synthesis cache')
+    parser.add_argument('--refresh-voices', action='store_true',
+                        help='Refetch the voice list instead of using the cached catalog')
+    parser.add_argument('--no-quality-gate', action='store_true',
+                        help='Skip the per-clip quality check after synthesis (audio_quality.py)')
+
+
+def setup_pipeline(args):
+    """Returns (backend, limiter, cache) for parsed add_tts_arguments() flags.
+
+    backend is None if it could not be initialized; cache is None with --no-cache.
+    """
+    backend = get_tts_backend(args.backend, args.local_latency)
+    limiter = AdaptiveRateLimiter(rate=args.qps, max_rate=args.max_qps)
+    cache = None if args.no_cache else AudioCache()
+    return backend, limiter, cache
+
+
+def setup_quality_gate(args, backend=None):
+    """Returns the shared QualityGate, or None with --no-quality-gate.
+
+    The expected sample rate comes from the backend (0 = any rate).
+    """
+    if args.no_quality_gate:
+        return None
+    from audio_quality import EXPECTED_SAMPLE_RATE, QualityGate
+    return QualityGate(sample_rate=getattr(backend, 'sample_rate', EXPECTED_SAMPLE_RATE))
@@ -0,0 +1,122 @@
+"""
+Priority ordering for TTS generation.
+
+Instead of synthesizing missing words alphabetically, score each word by how
+much it is worth to players and generate the highest-value words first, so a
+partial run (budget cap) delivers the most useful audio.
+
+Priority sources (combined by summing):
+- wordbook: membership in registered wordbooks, weighted per book/level
+  (oxford_a1, cet4 高频 ... highest); small bonus per extra book
+- cefr:     CEFR level from oxford_5000_cleaned.csv (A1 highest)
+- plays:    play counts exported from the game's localStorage 'wordGameStats'
+            ({"totalWordsArray": [...]} and/or {"playCounts": {word: n}})
+
+Usage:
+    scores = build_priority(['wordbook', 'cefr'], stats_path=None)
+    ordered = prioritize(words, scores)
+"""
+import csv
+import json
+import math
+import os
+
+from wordbook_index import WordbookIndex
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OXFORD_CSV = os.path.join(SCRIPT_DIR, 'oxford_5000_cleaned.csv')
+
+PRIORITY_SOURCES = ('wordbook', 'cefr', 'plays')
+
+# Weight of a word's most valuable book/level ('book' or 'book/level'; prefix 'scene_*' style)
+BOOK_WEIGHTS = {
+    'oxford_a1': 100,
+    'cet4/高频': 90,
+    'oxford_a2': 80,
+    'cet6/高频': 70,
+    'cet4': 60,
+    'oxford_b1': 60,
+    'cet6': 50,
+    'scene_*': 50,
+    'oxford_b2': 40,
+    'topic_*': 30,
+    'oxford_c1': 20,
+}
+DEFAULT_BOOK_WEIGHT = 10
+EXTRA_BOOK_BONUS = 5
+CEFR_WEIGHTS = {'A1': 50, 'A2': 40, 'B1': 30, 'B2': 20, 'C1': 10}
+PLAY_WEIGHT = 10
+
+
+def book_weight(book_id, level=None):
+    """Weight of book_id (and level) per BOOK_WEIGHTS."""
+    if level and f'{book_id}/{level}' in BOOK_WEIGHTS:
+        return BOOK_WEIGHTS[f'{book_id}/{level}']
+    if book_id in BOOK_WEIGHTS:
+        return BOOK_WEIGHTS[book_id]
+    for pattern, weight in BOOK_WEIGHTS.items():
+        if pattern.endswith('*') and book_id.startswith(pattern[:-1]):
+            return weight
+    return DEFAULT_BOOK_WEIGHT
+
+
+def wordbook_scores(membership):
+    scores = {}
+    for word, books in membership.items():
+        weights = sorted((book_weight(b, lv) for b, lv in books), reverse=True)
+        scores[word] = weights[0] + EXTRA_BOOK_BONUS * (len(weights) - 1)
+    return scores
+
+
+def cefr_scores(csv_path=OXFORD_CSV):
+    scores = {}
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            weight = CEFR_WEIGHTS.get(row['cefr'].strip())
+            if weight:
+                scores.setdefault(row['term'].strip(), weight)
+    return scores
+
+
+def play_scores(stats_path):
+    """Scores from an exported wordGameStats JSON object."""
+    with open(stats_path, 'r', encoding='utf-8') as f:
+        stats = json.load(f)
+    counts = {}
+    for word in stats.get('totalWordsArray', []):
+        counts[word] = counts.get(word, 0) + 1
+    for word, n in stats.get('playCounts', {}).items():
+        counts[word] = counts.get(word, 0) + n
+    return {word: PLAY_WEIGHT * math.log1p(n) for word, n in counts.items()}
+
+
+def build_priority(sources, stats_path=None, index=None):
+    """Return {word: score} combining the requested priority sources.
+
+    index is an already scanned WordbookIndex to reuse (scanned here if None).
+    """
+    total = {}
+    parts = []
+    if 'wordbook' in sources:
+        index = index or WordbookIndex.scan()
+        parts.append(wordbook_scores(index.membership()))
+    if 'cefr' in sources:
+        parts.append(cefr_scores())
+    if 'plays' in sources and stats_path:
+        parts.append(play_scores(stats_path))
+    for scores in parts:
+        for word, score in scores.items():
+            total[word] = total.get(word, 0) + score
+    return total
+
+
+def prioritize(words, scores):
+    """Sort words by descending score (case-insensitive fallback), keeping input order for ties."""
+    lower = {}
+    for word, score in scores.items():
+        lower[word.lower()] = max(score, lower.get(word.lower(), 0))
+
+    def score_of(word):
+        return scores.get(word, lower.get(word.lower(), 0))
+
+    return sorted(words, key=lambda w: -score_of(w))
@@ -0,0 +1,160 @@
+"""
+Rate limiting and retry layer for Google Cloud TTS requests.
+
+Large batch runs (generate_tts.py, generate_missing_audio.py) used to fire
+requests as fast as possible and treat every exception as a failed word, so a
+quota burst (RESOURCE_EXHAUSTED) turned into hundreds of FAILED lines.
+
+This module provides:
+1. TokenBucket - thread-safe request pacing (requests/sec + burst capacity)
+2. classify_error() - maps API exceptions to 'throttle' / 'transient' / 'fatal'
+3. AdaptiveRateLimiter - token bucket + per-class retry with exponential
+   backoff and jitter, and AIMD adaptation of the request rate:
+   additive increase after successes, multiplicative decrease on throttling
+
+Usage:
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=20)
+    response = limiter.call(client.synthesize_speech, request={...})
+"""
+import random
+import threading
+import time
+from collections import Counter
+
+# Exception class names from google.api_core.exceptions (matched by name so
+# this module has no hard dependency on the Google client libraries)
+THROTTLE_ERRORS = {'ResourceExhausted', 'TooManyRequests'}
+TRANSIENT_ERRORS = {
+    'ServiceUnavailable', 'DeadlineExceeded', 'InternalServerError',
+    'Aborted', 'GatewayTimeout', 'BadGateway', 'RetryError',
+    'ConnectionError', 'TimeoutError',
+}
+
+# Retry policy per error class: (max attempts, base delay s, max delay s)
+RETRY_POLICY = {
+    'throttle': (8, 1.0, 60.0),
+    'transient': (4, 0.5, 10.0),
+    'fatal': (1, 0.0, 0.0),
+}
+
+
+def classify_error(exc):
+    """Return 'throttle', 'transient' or 'fatal' for an exception."""
+    for cls in type(exc).__mro__:
+        if cls.__name__ in THROTTLE_ERRORS:
+            return 'throttle'
+        if cls.__name__ in TRANSIENT_ERRORS:
+            return 'transient'
+    return 'fatal'
+
+
+def backoff_delay(attempt, base, cap):
+    """Exponential backoff with 'equal jitter': half fixed, half random."""
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class TokenBucket:
+    """Thread-safe token bucket. acquire() blocks until a token is available."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def set_rate(self, rate):
+        with self.lock:
+            self._refill()
+            self.rate = float(rate)
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate follows AIMD based on observed throttling.
+
+    - success: rate += increase (up to max_rate)
+    - throttle: rate *= decrease (down to min_rate), at most once per
+      cooldown window so a burst of concurrent 429s only halves once
+    """
+
+    def __init__(self, rate=5.0, min_rate=0.5, max_rate=50.0,
+                 increase=0.1, decrease=0.5, cooldown=2.0):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.bucket = TokenBucket(min(max(rate, min_rate), max_rate))
+        self.last_decrease = 0.0
+        self.lock = threading.Lock()
+        self.stats = {'success': 0, 'throttle': 0, 'transient': 0, 'fatal': 0, 'retries': 0}
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    def on_success(self):
+        with self.lock:
+            self.stats['success'] += 1
+            new_rate = min(self.max_rate, self.bucket.rate + self.increase)
+        self.bucket.set_rate(new_rate)
+
+    def on_throttle(self):
+        with self.lock:
+            self.stats['throttle'] += 1
+            now = time.monotonic()
+            if now - self.last_decrease < self.cooldown:
+                return
+            self.last_decrease = now
+            new_rate = max(self.min_rate, self.bucket.rate * self.decrease)
+        self.bucket.set_rate(new_rate)
+
+    def call(self, fn, *args, **kwargs):
+        """Call fn under the rate limit, retrying throttled/transient errors.
+
+        Each error class has its own attempt counter, so e.g. transient errors
+        do not use up the throttle budget or inflate its backoff.
+        """
+        attempts = Counter()
+        while True:
+            self.bucket.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                kind = classify_error(e)
+                if kind == 'throttle':
+                    self.on_throttle()
+                else:
+                    with self.lock:
+                        self.stats[kind] += 1
+                max_attempts, base, cap = RETRY_POLICY[kind]
+                attempts[kind] += 1
+                if attempts[kind] >= max_attempts:
+                    raise
+                with self.lock:
+                    self.stats['retries'] += 1
+                time.sleep(backoff_delay(attempts[kind] - 1, base, cap))
+                continue
+            self.on_success()
+            return result
+
+    def summary(self):
+        s = self.stats
+        return (f"rate={self.rate:.2f}/s ok={s['success']} throttled={s['throttle']} "
+                f"transient={s['transient']} fatal={s['fatal']} retries={s['retries']}")
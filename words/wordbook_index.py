@@ -0,0 +1,166 @@
+"""
+Wordbook index and missing-audio scanner (no JS runtime needed).
+
+Parses the registerWordbook(...) payloads in wordbooks/*.js and the
+OXFORD_VOCABULARY object in oxford_vocabulary.js directly, builds one
+in-memory index of every referenced word and audio filename, and diffs it
+against a single scan of the audio directory.
+
+Replaces the old `node -e "..."` one-liner:
+    python words/wordbook_index.py                 # writes words/all_missing_audio.txt
+    python words/wordbook_index.py --dangling      # also list audio fields pointing at missing files
+    python words/wordbook_index.py --stdout        # print instead of writing the file
+
+Library use:
+    index = WordbookIndex.scan()
+    missing = index.missing_words(audio_files())
+"""
+import argparse
+import json
+import os
+import re
+import time
+from collections import namedtuple
+
+from audio_store import audio_files
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+WORDBOOKS_DIR = os.path.join(PROJECT_DIR, 'wordbooks')
+OXFORD_JS = os.path.join(PROJECT_DIR, 'oxford_vocabulary.js')
+AUDIO_DIR = os.path.join(SCRIPT_DIR, 'tts_delivery', 'audio')
+MISSING_FILE = os.path.join(SCRIPT_DIR, 'all_missing_audio.txt')
+
+Entry = namedtuple('Entry', 'book level word audio')
+
+
+def _js_string(group):
+    return rf'"(?P<{group}>(?:[^"\\]|\\.)*)"'
+
+
+# One pass over each file: book registrations, level keys and word entries in source order
+TOKEN_RE = re.compile(
+    r"registerWordbook\(\s*'(?P<book>[^']+)'"
+    r"|^[ \t]*(?:'(?P<qlevel>[^']+)'|(?P<level>\w+))[ \t]*:[ \t]*\{[ \t]*$"
+    r"|\{\s*word:\s*" + _js_string('word') +
+    r"(?:[^{}]*?audio:\s*(?:" + _js_string('audio') + r"|null))?",
+    re.M,
+)
+OXFORD_TOKEN_RE = re.compile(
+    r'^\s*"(?P<cefr>[A-C][12])":\s*\['
+    r"|\{\s*word:\s*" + _js_string('word') +
+    r"(?:[^{}]*?audio:\s*(?:" + _js_string('audio') + r"|null))?",
+    re.M,
+)
+OXFORD_BOOK_RE = re.compile(r"registerWordbook\(\s*'([^']+)'[^;]*?OXFORD_VOCABULARY\['([A-C][12])'\]")
+
+
+def _unescape(s):
+    return json.loads(f'"{s}"') if s and '\\' in s else s
+
+
+def parse_wordbook_js(text):
+    """Yield Entry tuples from a wordbooks/*.js file."""
+    book = level = None
+    for m in TOKEN_RE.finditer(text):
+        if m.group('book'):
+            book, level = m.group('book'), None
+        elif m.group('word') is not None:
+            if book:
+                yield Entry(book, level, _unescape(m.group('word')), _unescape(m.group('audio')))
+        else:
+            name = m.group('qlevel') or m.group('level')
+            if name != 'levels':
+                level = name
+
+
+def parse_oxford_js(text):
+    """Yield Entry tuples from oxford_vocabulary.js, attributed to the registered oxford_* books."""
+    books = {cefr: book for book, cefr in OXFORD_BOOK_RE.findall(text)}
+    cefr = None
+    for m in OXFORD_TOKEN_RE.finditer(text):
+        if m.group('cefr'):
+            cefr = m.group('cefr')
+        elif cefr:
+            book = books.get(cefr, f'oxford_{cefr.lower()}')
+            yield Entry(book, 'all', _unescape(m.group('word')), _unescape(m.group('audio')))
+
+
+class WordbookIndex:
+    """Every word referenced by a registered wordbook, with its books/levels and audio field."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.books = {}
+        self.by_word = {}
+        for e in self.entries:
+            self.books.setdefault(e.book, []).append(e)
+            self.by_word.setdefault(e.word, []).append(e)
+
+    @classmethod
+    def scan(cls, wordbooks_dir=WORDBOOKS_DIR, oxford_js=OXFORD_JS):
+        entries = []
+        if oxford_js and os.path.exists(oxford_js):
+            with open(oxford_js, 'r', encoding='utf-8') as f:
+                entries.extend(parse_oxford_js(f.read()))
+        for name in sorted(os.listdir(wordbooks_dir)):
+            if name.endswith('.js'):
+                with open(os.path.join(wordbooks_dir, name), 'r', encoding='utf-8') as f:
+                    entries.extend(parse_wordbook_js(f.read()))
+        return cls(entries)
+
+    def membership(self):
+        """Return {word: [(book_id, level), ...]}."""
+        return {word: [(e.book, e.level) for e in es] for word, es in self.by_word.items()}
+
+    def audio_refs(self):
+        """Return {audio_filename: {words}} for every non-null audio field."""
+        refs = {}
+        for e in self.entries:
+            if e.audio:
+                refs.setdefault(e.audio, set()).add(e.word)
+        return refs
+
+    def missing_words(self, available):
+        """Sorted words without a {word}.wav in available (a set of filenames)."""
+        return sorted(w for w in self.by_word if f'{w}.wav' not in available)
+
+    def dangling_audio(self, available):
+        """Sorted audio fields that point at files not in available."""
+        return sorted(a for a in self.audio_refs() if a not in available)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List wordbook words that have no audio file')
+    parser.add_argument('--audio-dir', default=AUDIO_DIR)
+    parser.add_argument('--output', default=MISSING_FILE, help='Missing word list (default: all_missing_audio.txt)')
+    parser.add_argument('--stdout', action='store_true', help='Print the missing words instead of writing --output')
+    parser.add_argument('--dangling', action='store_true', help='Also report audio fields pointing at missing files')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = WordbookIndex.scan()
+    available = audio_files(args.audio_dir)
+    missing = index.missing_words(available)
+    elapsed = time.perf_counter() - start
+
+    if args.stdout:
+        print('\n'.join(missing))
+        return
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(missing) + '\n' if missing else '')
+
+    print(f"Wordbooks:     {len(index.books)}")
+    print(f"Unique words:  {len(index.by_word)} ({len(index.entries)} entries)")
+    print(f"Audio files:   {len(available)}")
+    print(f"Missing audio: {len(missing)} -> {args.output}")
+    if args.dangling:
+        dangling = index.dangling_audio(available)
+        print(f"Dangling audio fields: {len(dangling)}")
+        for name in dangling:
+            print(f"  {name}")
+    print(f"Scanned in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()